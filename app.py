@@ -1,7 +1,9 @@
 # TODO: This file is designed to test the functionality of Streamer and related components.
 # Desired operational outcomes are not yet attainable.
 
+import os
 import time
+import atexit
 import logging
 import threading
 
@@ -15,6 +17,7 @@ from cvpype.python.backend.web.streamer.camera import CameraWebStreamer
 from cvpype.python.backend.web.streamer.videofile import VideofileWebStreamer
 from cvpype.python.backend.web.streamer.rtimage import RealtimeImageWebStreamer
 from cvpype.python.applications.pipelines.linetracking import LineTrackingPipeline
+from cvpype.python.utils.tracing import TRACER
 
 st.set_page_config(
     page_title='cvpype',
@@ -83,6 +86,20 @@ class StreamingFrame:
         )
 
 
+@st.cache_resource
+def start_tracing(
+    path: str
+):
+    # NOTE: Opt-in, e.g. `CVPYPE_TRACE=trace.json streamlit run app.py`.
+    # The latest events are written when the app exits.
+    # Open the file in https://ui.perfetto.dev or chrome://tracing.
+    TRACER.start()
+    atexit.register(TRACER.export, path)
+
+if os.environ.get('CVPYPE_TRACE'):
+    start_tracing(os.environ['CVPYPE_TRACE'])
+
+
 @st.cache_resource
 def get_server(
 ) -> Server:
@@ -159,6 +176,8 @@ for name in [
 frame3 = get_streamingframe_from_pipe('GrayscailingComponent', 'GrayscailingComponent')
 frame4 = get_streamingframe_from_pipe('EdgeDetectingComponent', 'EdgeDetectingComponent')
 frame5 = get_streamingframe_from_pipe('SDVLineVisualizationComponent', 'SDVLineVisualizationComponent')
+# NOTE: The histogram is rendered headless and streamed as an image.
+frame6 = get_streamingframe_from_pipe('WidthBasedIntersectionFiltering', 'WidthBasedIntersectionFiltering')
 
 
 @st.cache_resource
@@ -239,4 +258,12 @@ with col5:
             height=frame5.height,
         )
 with col6:
-    pass
+    with st.container(border=True):
+        st.header(frame6.name)
+        st.caption(frame6.url)
+        frame6.wait_ready()
+        components.iframe(
+            frame6.url,
+            width=frame6.width,
+            height=frame6.height,
+        )
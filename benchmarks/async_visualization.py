@@ -0,0 +1,102 @@
+"""! Throughput of `LineTrackingPipeline` with the visualizers off, rendering
+synchronously, rendering every 10th frame synchronously, and rendering
+asynchronously on background threads.
+
+Image visualizers publish to `RealtimeImageWebStreamer`s instead of GUI
+windows, and matplotlib renders with its headless backend.
+
+Usage: `python3 -m benchmarks.async_visualization [--video data/sample.avi] [--json out.json]`
+"""
+# Built-in
+import os
+import time
+import logging
+import argparse
+
+# Third party
+import matplotlib
+matplotlib.use('Agg')
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Visualizers
+from cvpype.python.basic.visualizer.image import ImageVisualizer
+
+# Project-Streamers
+from cvpype.python.backend.web.streamer.rtimage import RealtimeImageWebStreamer
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    read_frames,
+    create_line_tracking_pipeline,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def create_pipeline(
+    mode: str
+):
+    pipeline = create_line_tracking_pipeline()
+    if mode == 'off':
+        return pipeline
+    for _, visualizer in pipeline.visualizers.items():
+        visualizer.is_operating = True
+        if isinstance(visualizer, ImageVisualizer):
+            visualizer.set_web_streamer(RealtimeImageWebStreamer())
+    if mode == 'sampled':
+        pipeline.set_visualization_sampling(every_n=10)
+    if mode == 'async':
+        pipeline.set_async_visualization()
+    return pipeline
+
+
+def benchmark_mode(
+    frames: list,
+    mode: str,
+) -> dict:
+    pipeline = create_pipeline(mode)
+    pipeline.set_optimization_mode()
+    t0 = time.perf_counter()
+    for frame in frames:
+        pipeline.run(frame)
+    elapsed = time.perf_counter() - t0
+    n_rendered = sum(v.n_rendered for _, v in pipeline.visualizers.items())
+    if mode == 'async':
+        pipeline.set_async_visualization(False)
+    return {
+        'fps': len(frames) / elapsed,
+        'ms_per_frame': elapsed / len(frames) * 1000,
+        'n_rendered': n_rendered,
+    }
+
+
+def main(
+    video_path: str = os.path.join(DATA_DIR, 'sample.avi'),
+    json_path: str = '',
+):
+    frames = read_frames(video_path)
+    result = {}
+    for mode in ('off', 'sync', 'sampled', 'async'):
+        result[mode] = benchmark_mode(frames, mode)
+        logger.info(
+            f'visualizers {mode:7s}: {result[mode]["fps"]:7.1f} fps '
+            f'({result[mode]["ms_per_frame"]:.2f} ms/frame, '
+            f'{result[mode]["n_rendered"]} renders)'
+        )
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark synchronous and asynchronous visualization.')
+    parser.add_argument('--video', type=str, default=os.path.join(DATA_DIR, 'sample.avi'), help='Path of the video.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.video, args.json)
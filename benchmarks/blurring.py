@@ -0,0 +1,161 @@
+"""! Latency of the blur modes of `BilateralBlurringComponent` on the crop of
+`LineTrackingPipeline`, and the agreement of the downstream results
+(edges and intersections) with the default bilateral filter.
+
+Usage: `python3 -m benchmarks.blurring [--videos data/sample.avi ...] [--json out.json]`
+"""
+# Built-in
+import os
+import glob
+import logging
+import argparse
+
+# Third party
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Components
+from cvpype.python.basic.components.blurring import BilateralBlurringComponent
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    measure,
+    edge_f1,
+    read_frames,
+    create_line_tracking_pipeline,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+CANDIDATES = {
+    'bilateral': dict(mode='bilateral'),
+    'downsampled-bilateral': dict(mode='downsampled-bilateral', scale=2),
+    'gaussian-3': dict(mode='gaussian', ksize=3),
+    'gaussian-5': dict(mode='gaussian', ksize=5),
+    'box-3': dict(mode='box', ksize=3),
+    'box-5': dict(mode='box', ksize=5),
+    'median-3': dict(mode='median', ksize=3),
+    'median-5': dict(mode='median', ksize=5),
+    'guided-9': dict(mode='guided', ksize=9, scale=1),
+    'guided-9-fast': dict(mode='guided', ksize=9, scale=2),
+}
+for preset in BilateralBlurringComponent.PRESETS:
+    CANDIDATES[f'preset-{preset}'] = dict(preset=preset)
+
+
+def pairs_match(
+    expected: np.ndarray,
+    actual: np.ndarray,
+    tolerance: int = 2,
+) -> bool:
+    """! Whether every pair of one side has a pair of the other side within
+    `tolerance` pixels at both ends.
+    """
+    expected = np.reshape(np.asarray(expected), (-1, 1, 2)).astype(np.int64)
+    actual = np.reshape(np.asarray(actual), (1, -1, 2)).astype(np.int64)
+    if expected.size == 0 or actual.size == 0:
+        return expected.size == actual.size
+    is_near = (np.abs(expected - actual) <= tolerance).all(axis=-1)
+    return bool(is_near.any(axis=1).all() and is_near.any(axis=0).all())
+
+
+def prepare_inputs(
+    video_paths: list[str],
+    every_n: int,
+) -> tuple[object, list]:
+    """! Returns the pipeline and the cropped color and grayscaled images of the videos.
+    """
+    pipeline = create_line_tracking_pipeline()
+    inputs = []
+    for video_path in video_paths:
+        for frame in read_frames(video_path)[::every_n]:
+            pipeline.run(frame)
+            inputs.append((
+                pipeline.cropping.outputs[0].data_container.data.copy(),
+                pipeline.grayscailing.outputs[0].data_container.data.copy(),
+            ))
+    return pipeline, inputs
+
+
+def downstream(
+    pipeline,
+    blurring: BilateralBlurringComponent,
+    color_image: np.ndarray,
+    gray_image: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    edge_image = pipeline.edge_detecting.run(blurring.run(gray_image)['image'])['image']
+    intersections = pipeline.intersection_pipeline.run(color_image, edge_image)
+    return edge_image, np.asarray(intersections.data_container.data).copy()
+
+
+def main(
+    video_paths: list[str],
+    every_n: int = 3,
+    min_agreement: float = 0.95,
+    json_path: str = '',
+):
+    pipeline, inputs = prepare_inputs(video_paths, every_n)
+    reference = BilateralBlurringComponent()
+    reference.visualizer.is_operating = False
+    expected = [downstream(pipeline, reference, *i) for i in inputs]
+    _, sample = inputs[len(inputs) // 2]
+
+    results = {}
+    for name, config in CANDIDATES.items():
+        blurring = BilateralBlurringComponent(**config)
+        blurring.visualizer.is_operating = False
+        n_iter = 30 if blurring.mode == 'bilateral' else 300
+        latency_us = measure(lambda: blurring.run(sample), n_iter=n_iter, n_warmup=3)['p50_us']
+        actual = [downstream(pipeline, blurring, *i) for i in inputs]
+        results[name] = {
+            'config': config,
+            'latency_us': latency_us,
+            'edge_f1': float(np.mean([
+                edge_f1(e[0], a[0]) for e, a in zip(expected, actual)
+            ])),
+            'intersections_exact': float(np.mean([
+                e[1].tolist() == a[1].tolist() for e, a in zip(expected, actual)
+            ])),
+            'intersections_2px': float(np.mean([
+                pairs_match(e[1], a[1]) for e, a in zip(expected, actual)
+            ])),
+        }
+
+    logger.info(f'{len(inputs)} frames of {len(video_paths)} videos')
+    logger.info(f'{"mode":24s} {"latency":>10s} {"edge F1":>8s} {"exact":>6s} {"2px":>6s}')
+    for name, result in sorted(results.items(), key=lambda item: item[1]['latency_us']):
+        logger.info(
+            f'{name:24s} {result["latency_us"]:8.1f}us {result["edge_f1"]:8.3f} '
+            f'{result["intersections_exact"]:6.1%} {result["intersections_2px"]:6.1%}'
+        )
+    acceptable = [
+        name for name, result in results.items()
+        if result['intersections_2px'] >= min_agreement
+    ]
+    cheapest = min(acceptable, key=lambda name: results[name]['latency_us'])
+    logger.info(
+        f'Cheapest mode with {min_agreement:.0%} of the intersections within 2px: {cheapest}'
+    )
+    if json_path:
+        dump_json({'frames': len(inputs), 'cheapest': cheapest, 'modes': results}, json_path)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the blur modes.')
+    parser.add_argument(
+        '--videos', type=str, nargs='+',
+        default=sorted(glob.glob(os.path.join(DATA_DIR, 'sample*.avi'))),
+        help='Paths of the videos.'
+    )
+    parser.add_argument('--every_n', type=int, default=3, help='Uses every n-th frame of the videos.')
+    parser.add_argument('--min_agreement', type=float, default=0.95, help='The agreement required for the recommendation.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.videos, args.every_n, args.min_agreement, args.json)
@@ -0,0 +1,90 @@
+"""! Time of `ColorBasedIntersectionFilteringComponent.run` with the former
+per-pair Python loop versus the prefix sum over the thresholded row,
+for a growing number of candidate pairs.
+
+Usage: `python3 -m benchmarks.color_filtering [--json out.json]`
+"""
+# Built-in
+import logging
+import argparse
+
+# Third party
+import cv2
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Components
+from cvpype.python.applications.components.intersectionfiltering import ColorBasedIntersectionFilteringComponent
+
+# Benchmarks
+from benchmarks.common import (
+    measure,
+    synthetic_frame,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def filter_with_loop(
+    color_image: np.ndarray,
+    valid_pairs: list,
+    y: int,
+    black_threshold: int = 230,
+) -> list:
+    """! `ColorBasedIntersectionFilteringComponent.run` before vectorization.
+    """
+    color_row = color_image[y]
+    hsv_row = cv2.cvtColor(np.array([color_row]), cv2.COLOR_BGR2HSV)
+    _, _, v_row = cv2.split(hsv_row)
+    BIN_COUNT = 256
+    cv2.calcHist([hsv_row], [0], None, [BIN_COUNT], [0, 256])
+    valid_black_pairs = []
+    for start, end in valid_pairs:
+        line_section = v_row[0][start:end]
+        black_pixels = len(np.where(line_section < black_threshold)[0])
+        if black_pixels / (len(line_section) + 0.1) >= 0.5:
+            valid_black_pairs.append((start, end))
+    return valid_black_pairs
+
+
+def main(
+    n_iter: int = 1000,
+    json_path: str = '',
+):
+    y = 40
+    color_image = synthetic_frame(50, 640, 3)
+    rng = np.random.default_rng(0)
+    fixed = ColorBasedIntersectionFilteringComponent(y=y, black_threshold=230)
+    adaptive = ColorBasedIntersectionFilteringComponent(y=y)
+    result = {}
+    for n_pairs in (10, 100, 1000):
+        starts = rng.integers(0, 590, size=n_pairs)
+        pairs = np.column_stack((starts, starts + rng.integers(10, 50, size=n_pairs)))
+        pair_list = [tuple(p) for p in pairs.tolist()]
+        key = f'{n_pairs}_pairs'
+        result[key] = {
+            'loop_us': measure(lambda: filter_with_loop(color_image, pair_list, y), n_iter=n_iter)['p50_us'],
+            'prefix_sum_us': measure(lambda: fixed.run(color_image, pairs), n_iter=n_iter)['p50_us'],
+            'prefix_sum_otsu_us': measure(lambda: adaptive.run(color_image, pairs), n_iter=n_iter)['p50_us'],
+        }
+        logger.info(
+            f'{key:11s} loop {result[key]["loop_us"]:8.1f}us | '
+            f'prefix sum {result[key]["prefix_sum_us"]:6.1f}us | '
+            f'prefix sum + Otsu {result[key]["prefix_sum_otsu_us"]:6.1f}us'
+        )
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the color based intersection filter.')
+    parser.add_argument('--n_iter', type=int, default=1000, help='Number of measured calls per case.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.n_iter, args.json)
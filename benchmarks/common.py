@@ -0,0 +1,146 @@
+# Built-in
+import os
+import gc
+import json
+import time
+import logging
+from typing import Callable
+
+# Third party
+import cv2
+import numpy as np
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+
+logger = logging.getLogger(__name__)
+
+
+def measure(
+    fn: Callable,
+    n_iter: int = 1000,
+    n_warmup: int = 100,
+) -> dict:
+    """! The function `measure` calls `fn` repeatedly and returns
+    the latency statistics of a single call in microseconds.
+
+    @param fn A callable without arguments.
+    @param n_iter The number of measured calls.
+    @param n_warmup The number of calls before the measurement starts.
+
+    @return a dictionary with `n`, `mean_us`, `p50_us`, `p95_us`,
+    `p99_us` and `max_us` keys.
+    """
+    for _ in range(n_warmup):
+        fn()
+    samples = np.empty((n_iter,), dtype=np.int64)
+    perf_counter_ns = time.perf_counter_ns
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(n_iter):
+            t0 = perf_counter_ns()
+            fn()
+            samples[i] = perf_counter_ns() - t0
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    samples_us = samples / 1000
+    return {
+        'n': n_iter,
+        'mean_us': float(samples_us.mean()),
+        'p50_us': float(np.percentile(samples_us, 50)),
+        'p95_us': float(np.percentile(samples_us, 95)),
+        'p99_us': float(np.percentile(samples_us, 99)),
+        'max_us': float(samples_us.max()),
+    }
+
+
+def edge_f1(
+    expected: np.ndarray,
+    actual: np.ndarray,
+    tolerance: int = 1,
+) -> float:
+    """! F1 score of the edge pixels of `actual`, where an edge pixel matches
+    if an edge of the other image lies within `tolerance` pixels.
+    """
+    kernel = np.ones((2 * tolerance + 1, 2 * tolerance + 1), dtype=np.uint8)
+    expected, actual = expected > 0, actual > 0
+    if not expected.any() and not actual.any():
+        return 1.0
+    near_expected = cv2.dilate(expected.view(np.uint8), kernel) > 0
+    near_actual = cv2.dilate(actual.view(np.uint8), kernel) > 0
+    precision = (actual & near_expected).sum() / max(actual.sum(), 1)
+    recall = (expected & near_actual).sum() / max(expected.sum(), 1)
+    return float(2 * precision * recall / max(precision + recall, 1e-9))
+
+
+def synthetic_frame(
+    height: int,
+    width: int,
+    channels: int = 3,
+    seed: int = 0,
+) -> np.ndarray:
+    """! Creates a deterministic noisy uint8 frame of the given size.
+    """
+    rng = np.random.default_rng(seed)
+    shape = (height, width, channels) if channels > 1 else (height, width)
+    return rng.integers(0, 256, size=shape, dtype=np.uint8)
+
+
+def read_frames(
+    video_path: str,
+    n_frames: int | None = None,
+) -> list[np.ndarray]:
+    """! Reads the first `n_frames` frames (or every frame) of a video into memory.
+    """
+    cap = cv2.VideoCapture(str(video_path))
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open video at path {video_path}")
+    frames = []
+    while cap.isOpened() and (n_frames is None or len(frames) < n_frames):
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def create_line_tracking_pipeline(
+    **kwargs
+):
+    """! Creates the `LineTrackingPipeline` used by `scripts/pipeline_from_video.py`
+    with every visualizer turned off.
+    """
+    # NOTE: Imported here so that benchmarks of the core do not
+    # depend on the application modules.
+    from cvpype.python.applications.pipelines.linetracking import LineTrackingPipeline
+    config = dict(crop_y=330, crop_y_end=380, roi_y=370, image_h=480)
+    config.update(kwargs)
+    pipeline = LineTrackingPipeline(**config)
+    pipeline.autocreate_graph()
+    for _, visualizer in pipeline.visualizers.items():
+        visualizer.is_operating = False
+    return pipeline
+
+
+def disable_visualizers(
+    *components
+):
+    """! Turns off the visualizers of the given components without
+    touching any window, so that benchmarks can run headless.
+    """
+    for component in components:
+        if component.visualizer is not None:
+            component.visualizer.is_operating = False
+
+
+def dump_json(
+    result: dict,
+    path: str,
+):
+    with open(path, 'w') as f:
+        json.dump(result, f, indent=2)
+    logger.info(f'Benchmark result saved to {path}')
@@ -0,0 +1,211 @@
+"""! Framework overhead of a single component call.
+
+Runs each basic component side by side as the bare `cv2` call it wraps,
+the bare `run()` method and `IOBaseComponent.__call__` on the output of
+`InputsComponent` (the way a pipeline enters the framework) in the
+debugging mode (every call validated) and in the trusted mode
+(precompiled call plan, no per-call checks).
+
+The variants alternate for a few rounds and the best median of each is
+kept, so that a noisy machine affects them alike. The overheads are the
+differences of the medians, so on large frames they are only as precise
+as the noise of the `cv2` call itself.
+
+With `--budget_us`, the script exits with a nonzero status if the overhead
+of a trusted call over the bare `cv2` call exceeds the budget on the tiny
+frames, where the cost of the framework dominates. The overhead does not
+grow with the frame (nothing is copied), and the larger frames show it.
+
+Usage: `python3 -m benchmarks.component_overhead [--budget_us 10] [--json out.json]`
+"""
+# Built-in
+import sys
+import time
+import logging
+import argparse
+
+# Third party
+import cv2
+
+# Project
+from cvpype.python.iospec import ComponentIOSpec
+from cvpype.python.utils import loggerutil
+
+# Project-Types
+from cvpype.python.basic.types.cvimage import ImageType
+
+# Project-Components
+from cvpype.python.core.components.base import IOBaseComponent
+from cvpype.python.basic.components.inputs import InputsComponent
+from cvpype.python.basic.components.cropping import CroppingComponent
+from cvpype.python.basic.components.blurring import BilateralBlurringComponent
+from cvpype.python.basic.components.grayscailing import GrayscailingComponent
+from cvpype.python.basic.components.edgedetecting import EdgeDetectingComponent
+
+# Benchmarks
+from benchmarks.common import (
+    measure,
+    synthetic_frame,
+    disable_visualizers,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+# NOTE: The frame size on which `--budget_us` is checked.
+BUDGET_SIZE = 'tiny(8x8)'
+
+
+class IdentityComponent(IOBaseComponent):
+    def __init__(
+        self
+    ):
+        super().__init__(
+            inputs=[
+                ComponentIOSpec(
+                    name='image',
+                    data_container=ImageType(),
+                )
+            ],
+            outputs=[
+                ComponentIOSpec(
+                    name='image',
+                    data_container=ImageType(),
+                )
+            ]
+        )
+
+    def run(
+        self,
+        image
+    ) -> dict:
+        return {'image': image}
+
+
+def benchmark_component(
+    component: IOBaseComponent,
+    bare_cv2,
+    frame,
+    n_iter: int,
+    n_rounds: int = 3,
+    max_seconds: float = 0.5,
+) -> dict:
+    """! The median latency of `bare_cv2(frame)`, of `component.run(frame)`
+    and of the validated and trusted calls of `component`, and the overheads.
+
+    @param bare_cv2 The `cv2` call (or `numpy` slicing) that `component` wraps.
+    @param n_iter The number of measured calls per variant and round,
+    reduced so that a round of a variant takes about `max_seconds`.
+    """
+    disable_visualizers(component)
+    t0 = time.perf_counter()
+    bare_cv2(frame)
+    n_iter = max(min(n_iter, int(max_seconds / (time.perf_counter() - t0))), 20)
+    inputs = InputsComponent()
+
+    def validated():
+        component.set_validation_frames(None)
+        return lambda: component(inputs(frame))
+
+    def trusted():
+        component.set_validation_frames(0)
+        return lambda: component(inputs(frame))
+
+    variants = {
+        'cv2': lambda: (lambda: bare_cv2(frame)),
+        'run': lambda: (lambda: component.run(frame)),
+        'validated_call': validated,
+        'trusted_call': trusted,
+    }
+    latencies = {name: [] for name in variants}
+    try:
+        for _ in range(n_rounds):
+            for name, create_fn in variants.items():
+                latencies[name].append(measure(create_fn(), n_iter=n_iter, n_warmup=min(n_iter, 100))['p50_us'])
+    finally:
+        component.set_validation_frames(None)
+    best = {name: min(values) for name, values in latencies.items()}
+    return {
+        'cv2_us': best['cv2'],
+        'run_us': best['run'],
+        'validated_call_us': best['validated_call'],
+        'trusted_call_us': best['trusted_call'],
+        # NOTE: The overhead of `run()` itself (checks, `run_on_output_rows`, logging).
+        'run_overhead_us': best['run'] - best['cv2'],
+        # NOTE: The overheads of `__call__` (wrapping, validation, call plan) on top of `run()`.
+        'validated_overhead_us': best['validated_call'] - best['run'],
+        'trusted_overhead_us': best['trusted_call'] - best['run'],
+        # NOTE: What the framework costs a pipeline per component call compared to plain OpenCV.
+        'total_overhead_us': best['trusted_call'] - best['cv2'],
+    }
+
+
+def main(
+    n_iter: int = 1000,
+    json_path: str = '',
+    budget_us: float | None = None,
+) -> int:
+    # NOTE: The blurring component uses its gaussian mode, since the overhead
+    # is lost in the noise of the default bilateral filter (milliseconds per frame).
+    cases = {
+        'IdentityComponent': (IdentityComponent, lambda f: f, 3),
+        'GrayscailingComponent': (
+            GrayscailingComponent, lambda f: cv2.cvtColor(f, cv2.COLOR_BGR2GRAY), 3
+        ),
+        'CroppingComponent': (CroppingComponent, lambda f: f[f.shape[0] // 2:], 3),
+        'BilateralBlurringComponent(gaussian)': (
+            lambda: BilateralBlurringComponent(mode='gaussian', ksize=5),
+            lambda f: cv2.GaussianBlur(f, (5, 5), 0), 1
+        ),
+        'EdgeDetectingComponent': (
+            EdgeDetectingComponent, lambda f: cv2.Canny(f, 100, 200), 1
+        ),
+    }
+    sizes = {
+        'tiny(8x8)': (8, 8),
+        'roi(50x480)': (50, 480),
+        'large(480x640)': (480, 640),
+    }
+    result = {}
+    for name, (create_component, bare_cv2, channels) in cases.items():
+        for size_name, (h, w) in sizes.items():
+            frame = synthetic_frame(h, w, channels)
+            key = f'{name}/{size_name}'
+            result[key] = benchmark_component(create_component(), bare_cv2, frame, n_iter)
+            logger.info(
+                f'{key:52s} '
+                f'cv2 {result[key]["cv2_us"]:8.2f}us | '
+                f'overhead run {result[key]["run_overhead_us"]:6.2f}us, '
+                f'validated {result[key]["validated_overhead_us"]:6.2f}us, '
+                f'trusted {result[key]["trusted_overhead_us"]:6.2f}us, '
+                f'total {result[key]["total_overhead_us"]:6.2f}us'
+            )
+    if json_path:
+        dump_json(result, json_path)
+
+    if budget_us is None:
+        return 0
+    over_budget = [
+        key for key, case in result.items()
+        if key.endswith(BUDGET_SIZE) and case['total_overhead_us'] > budget_us
+    ]
+    for key in over_budget:
+        logger.warning(
+            f'{key}: overhead {result[key]["total_overhead_us"]:.2f}us '
+            f'exceeds the budget of {budget_us:.2f}us'
+        )
+    if over_budget:
+        return 1
+    logger.info(f'Every overhead on {BUDGET_SIZE} is within the budget of {budget_us:.2f}us')
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the framework overhead per component call.')
+    parser.add_argument('--n_iter', type=int, default=1000, help='Number of measured calls per variant and round.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    parser.add_argument('--budget_us', type=float, default=None, help=f'Maximum overhead of a trusted call over the bare cv2 call on {BUDGET_SIZE}.')
+    args = parser.parse_args()
+    sys.exit(main(args.n_iter, args.json, args.budget_us))
@@ -0,0 +1,115 @@
+"""! Edge density and downstream cost of the fixed and the adaptive
+thresholds of `EdgeDetectingComponent` under lighting changes
+(the frames of the sample videos scaled by a gain), and the agreement of
+the intersections with the fixed thresholds on the original frames.
+
+Usage: `python3 -m benchmarks.edge_thresholds [--videos data/sample.avi ...] [--json out.json]`
+"""
+# Built-in
+import os
+import glob
+import logging
+import argparse
+
+# Third party
+import cv2
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Components
+from cvpype.python.basic.components.edgedetecting import EdgeDetectingComponent
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    measure,
+    read_frames,
+    create_line_tracking_pipeline,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+GAINS = (0.4, 0.7, 1.0, 1.3)
+
+
+def run_video(
+    video_path: str,
+    every_n: int,
+) -> dict:
+    frames = read_frames(video_path)[::every_n]
+    reference = create_line_tracking_pipeline(blur_preset='balanced')
+    expected = [
+        reference.run(frame).data_container.data.tolist()
+        for frame in frames
+    ]
+    result = {}
+    for edge_mode in EdgeDetectingComponent.MODES:
+        pipeline = create_line_tracking_pipeline(blur_preset='balanced', edge_mode=edge_mode)
+        pipeline.set_optimization_mode()
+        for gain in GAINS:
+            pipeline.edge_detecting.reset()
+            densities = []
+            n_agreed = 0
+            edge_images = []
+            for frame, e in zip(frames, expected):
+                frame = cv2.convertScaleAbs(frame, alpha=gain)
+                n_agreed += pipeline.run(frame).data_container.data.tolist() == e
+                edge_image = pipeline.edge_detecting.outputs[0].data_container.data
+                densities.append(np.count_nonzero(edge_image) / edge_image.size)
+                edge_images.append(edge_image.copy())
+            state = {'i': 0}
+            def find_lines():
+                pipeline.line_finding.run(edge_images[state['i']])
+                state['i'] = (state['i'] + 1) % len(edge_images)
+            timing = measure(find_lines, n_iter=len(edge_images) * 3, n_warmup=len(edge_images))
+            result[f'{edge_mode}@{gain}'] = {
+                'edge_density': float(np.mean(densities)),
+                'edge_density_std': float(np.std(densities)),
+                'line_finding_p50_us': timing['p50_us'],
+                'line_finding_p95_us': timing['p95_us'],
+                'agreement': n_agreed / len(frames),
+            }
+    blurred = reference.blurring.outputs[0].data_container.data.copy()
+    adaptive = EdgeDetectingComponent(mode='adaptive')
+    result['update_thresholds_us'] = measure(lambda: adaptive.update_thresholds(blurred))['p50_us']
+    return result
+
+
+def main(
+    video_paths: list[str],
+    every_n: int = 3,
+    json_path: str = '',
+):
+    results = {}
+    for video_path in video_paths:
+        name = os.path.basename(video_path)
+        results[name] = result = run_video(video_path, every_n)
+        logger.info(f'{name}: threshold update {result["update_thresholds_us"]:.1f}us')
+        for edge_mode in EdgeDetectingComponent.MODES:
+            logger.info(f'  {edge_mode:8s} ' + ', '.join(
+                f'x{gain}: {result[f"{edge_mode}@{gain}"]["edge_density"]:.2%} '
+                f'({result[f"{edge_mode}@{gain}"]["line_finding_p95_us"]:.0f}us, '
+                f'{result[f"{edge_mode}@{gain}"]["agreement"]:.0%})'
+                for gain in GAINS
+            ))
+    if json_path:
+        dump_json(results, json_path)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the thresholds of the edge detection.')
+    parser.add_argument(
+        '--videos', type=str, nargs='+',
+        default=sorted(glob.glob(os.path.join(DATA_DIR, 'sample*.avi'))),
+        help='Paths of the videos.'
+    )
+    parser.add_argument('--every_n', type=int, default=3, help='Uses every n-th frame of the videos.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.videos, args.every_n, args.json)
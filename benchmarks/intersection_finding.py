@@ -0,0 +1,117 @@
+"""! Time of finding and width-filtering the edge pairs of a row with the
+former Python loops versus the vectorized `find_edge_pairs`, for rows
+with few and many (noisy) edges.
+
+Usage: `python3 -m benchmarks.intersection_finding [--json out.json]`
+"""
+# Built-in
+import logging
+import argparse
+
+# Third party
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Components
+from cvpype.python.applications.components.intersectionfinding import find_edge_pairs
+
+# Benchmarks
+from benchmarks.common import (
+    measure,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def find_and_filter_with_loops(
+    edge_row: np.ndarray,
+    width_min: int,
+    width_max: int,
+) -> list:
+    """! `IntersectionFindingComponent` and `WidthBasedIntersectionFilteringComponent`
+    before vectorization (adjacent pairs only).
+    """
+    edge_idx = np.where(edge_row >= 255)[0]
+    if len(edge_idx) <= 1:
+        return []
+    edge_pairs = [
+        (edge_idx[i], edge_idx[i + 1])
+        for i in range(len(edge_idx) - 1)
+    ]
+    return [
+        (start_idx, end_idx) for start_idx, end_idx in edge_pairs
+        if width_min <= end_idx - start_idx <= width_max
+    ]
+
+
+def find_all_pairs_with_loops(
+    edge_row: np.ndarray,
+    width_min: int,
+    width_max: int,
+) -> list:
+    """! Enumerates every pair of edges, as the docstring of
+    `get_intersection_pipeline` describes.
+    """
+    edge_idx = np.where(edge_row >= 255)[0].tolist()
+    return [
+        (s, e)
+        for i, s in enumerate(edge_idx)
+        for e in edge_idx[i + 1:]
+        if width_min <= e - s <= width_max
+    ]
+
+
+def find_vectorized(
+    edge_row: np.ndarray,
+    width_min: int,
+    width_max: int,
+) -> np.ndarray:
+    return find_edge_pairs(np.flatnonzero(edge_row >= 255), width_min, width_max)
+
+
+def main(
+    n_iter: int = 2000,
+    json_path: str = '',
+):
+    width_min, width_max = 10, 50
+    rng = np.random.default_rng(0)
+    result = {}
+    for n_edges in (4, 50, 300):
+        edge_row = np.zeros((640,), dtype=np.uint8)
+        edge_row[rng.choice(640, size=n_edges, replace=False)] = 255
+        key = f'{n_edges}_edges'
+        result[key] = {
+            'adjacent_loops_us': measure(
+                lambda: find_and_filter_with_loops(edge_row, width_min, width_max), n_iter=n_iter
+            )['p50_us'],
+            'all_pairs_loops_us': measure(
+                lambda: find_all_pairs_with_loops(edge_row, width_min, width_max), n_iter=n_iter
+            )['p50_us'],
+            'all_pairs_vectorized_us': measure(
+                lambda: find_vectorized(edge_row, width_min, width_max), n_iter=n_iter
+            )['p50_us'],
+            'n_pairs': len(find_vectorized(edge_row, width_min, width_max)),
+        }
+        logger.info(
+            f'{key:10s} '
+            f'adjacent (loops) {result[key]["adjacent_loops_us"]:8.1f}us | '
+            f'all pairs (loops) {result[key]["all_pairs_loops_us"]:9.1f}us | '
+            f'all pairs (vectorized) {result[key]["all_pairs_vectorized_us"]:6.1f}us '
+            f'({result[key]["n_pairs"]} pairs)'
+        )
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the edge pair search of a row.')
+    parser.add_argument('--n_iter', type=int, default=2000, help='Number of measured calls per case.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.n_iter, args.json)
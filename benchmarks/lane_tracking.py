@@ -0,0 +1,135 @@
+"""! Time of the line and intersection search of `LineTrackingPipeline`
+with and without lane tracking, the fallback rate (the share of frames
+searched entirely) and the agreement of the intersections with the full search.
+
+Usage: `python3 -m benchmarks.lane_tracking [--videos data/sample_lcurve.avi ...] [--json out.json]`
+"""
+# Built-in
+import os
+import logging
+import argparse
+
+# Third party
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    measure,
+    read_frames,
+    create_line_tracking_pipeline,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def create_pipeline(
+    lane_tracking: bool
+):
+    pipeline = create_line_tracking_pipeline(lane_tracking=lane_tracking)
+    pipeline.set_optimization_mode()
+    return pipeline
+
+
+def search(
+    pipeline,
+    color_image,
+    edge_image,
+):
+    """! Runs the stages that use the search windows on precomputed images.
+    """
+    lines = pipeline.line_finding.run(edge_image)['lines']
+    intersections = pipeline.intersection_pipeline.run(color_image, edge_image)
+    if pipeline.lane_tracking is not None:
+        pipeline.lane_tracking.run(intersections.data_container.data, lines)
+
+
+def to_set(
+    intersections
+) -> set:
+    pairs = np.reshape(np.asarray(intersections.data_container.data), (-1, 2))
+    return set(map(tuple, pairs.tolist()))
+
+
+def run_clip(
+    video_path: str,
+) -> dict:
+    frames = read_frames(video_path)
+    full = create_pipeline(lane_tracking=False)
+    tracked = create_pipeline(lane_tracking=True)
+
+    # NOTE: One pass in frame order for the fallback rate and the agreement.
+    inputs = []
+    n_agreed = 0
+    for frame in frames:
+        expected = to_set(full.run(frame))
+        n_agreed += expected == to_set(tracked.run(frame))
+        inputs.append((
+            full.cropping.outputs[0].data_container.data.copy(),
+            full.edge_detecting.outputs[0].data_container.data.copy(),
+        ))
+    tracker_stats = tracked.lane_tracker.stats()
+
+    def replay(pipeline, fn):
+        state = {'i': 0}
+        def step():
+            fn(pipeline, state['i'])
+            state['i'] = (state['i'] + 1) % len(frames)
+        return step
+
+    tracked.lane_tracker.reset()
+    result = {
+        'n_frames': len(frames),
+        'fallback_rate': tracker_stats['fallback_rate'],
+        'lost': tracker_stats['lost'],
+        'agreement': n_agreed / len(frames),
+    }
+    for name, pipeline in (('full', full), ('tracked', tracked)):
+        result[f'search_{name}_us'] = measure(
+            replay(pipeline, lambda p, i: search(p, *inputs[i])),
+            n_iter=len(frames) * 10, n_warmup=len(frames),
+        )['p50_us']
+    for name, pipeline in (('full', full), ('tracked', tracked)):
+        result[f'pipeline_{name}_us'] = measure(
+            replay(pipeline, lambda p, i: p.run(frames[i])),
+            n_iter=len(frames) * 2, n_warmup=len(frames),
+        )['p50_us']
+    return result
+
+
+def main(
+    video_paths: list[str],
+    json_path: str = '',
+):
+    results = {}
+    for video_path in video_paths:
+        result = run_clip(video_path)
+        results[os.path.basename(video_path)] = result
+        logger.info(
+            f'{os.path.basename(video_path)}: '
+            f'search {result["search_full_us"]:.0f}us -> {result["search_tracked_us"]:.0f}us, '
+            f'pipeline {result["pipeline_full_us"]:.0f}us -> {result["pipeline_tracked_us"]:.0f}us, '
+            f'fallback rate {result["fallback_rate"]:.1%}, '
+            f'agreement {result["agreement"]:.1%}'
+        )
+    if json_path:
+        dump_json(results, json_path)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the lane tracking.')
+    parser.add_argument(
+        '--videos', type=str, nargs='+',
+        default=[os.path.join(DATA_DIR, f'sample_{name}.avi') for name in ('lcurve', 'rcurve')],
+        help='Paths of the videos.'
+    )
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.videos, args.json)
@@ -0,0 +1,133 @@
+"""! Latency of the line detector backends of `LineFindingComponent` on the
+edge images of the sample videos, and on denser edge images (lower Canny
+thresholds on the image before blurring), and the agreement of their lines
+with the Hough transform: the F1 score of the drawn lines within 3px,
+and within 12px (about half a lane, as `sliding-window` finds the center
+of a lane instead of its sides).
+
+Usage: `python3 -m benchmarks.line_backends [--videos data/sample.avi ...] [--json out.json]`
+"""
+# Built-in
+import os
+import glob
+import logging
+import argparse
+
+# Third party
+import cv2
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Components
+from cvpype.python.applications.components.linefinding import LineFindingComponent
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    measure,
+    edge_f1,
+    read_frames,
+    create_line_tracking_pipeline,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+# NOTE: The image (`blurred` or `gray`) and the Canny thresholds of the edge images.
+EDGE_IMAGES = {'default': ('blurred', 100, 200), 'dense': ('gray', 50, 100)}
+
+
+def draw_lines(
+    lines,
+    shape: tuple[int, int],
+) -> np.ndarray:
+    mask = np.zeros(shape, dtype=np.uint8)
+    for x1, y1, x2, y2 in np.reshape(lines, (-1, 4)).tolist():
+        cv2.line(mask, (int(x1), int(y1)), (int(x2), int(y2)), 255, 1)
+    return mask
+
+
+def prepare_edge_images(
+    video_paths: list[str],
+    every_n: int,
+) -> dict[str, list[np.ndarray]]:
+    pipeline = create_line_tracking_pipeline()
+    edge_images = {name: [] for name in EDGE_IMAGES}
+    for video_path in video_paths:
+        for frame in read_frames(video_path)[::every_n]:
+            pipeline.run(frame)
+            images = {
+                'blurred': pipeline.blurring.outputs[0].data_container.data,
+                'gray': pipeline.grayscailing.outputs[0].data_container.data,
+            }
+            for name, (source, threshold1, threshold2) in EDGE_IMAGES.items():
+                edge_images[name].append(cv2.Canny(images[source], threshold1, threshold2))
+    return edge_images
+
+
+def main(
+    video_paths: list[str],
+    every_n: int = 3,
+    json_path: str = '',
+):
+    edge_images = prepare_edge_images(video_paths, every_n)
+    backends = LineFindingComponent.available_backends()
+    skipped = [b for b in LineFindingComponent.BACKENDS if b not in backends]
+    if skipped:
+        logger.info(f'Unavailable backends: {skipped}')
+
+    results = {}
+    for density, images in edge_images.items():
+        reference = LineFindingComponent()
+        reference.visualizer.is_operating = False
+        expected = [draw_lines(reference.run(image)['lines'], image.shape) for image in images]
+        for backend in backends:
+            component = LineFindingComponent(backend=backend)
+            component.visualizer.is_operating = False
+            state = {'i': 0}
+            def find_lines():
+                component.run(images[state['i']])
+                state['i'] = (state['i'] + 1) % len(images)
+            timing = measure(find_lines, n_iter=len(images) * 2, n_warmup=len(images) // 4)
+            actual = [draw_lines(component.run(image)['lines'], image.shape) for image in images]
+            results[f'{backend}@{density}'] = {
+                'edge_density': float(np.mean([np.count_nonzero(i) / i.size for i in images])),
+                'p50_us': timing['p50_us'],
+                'p95_us': timing['p95_us'],
+                'line_f1': float(np.mean([
+                    edge_f1(e, a, tolerance=3) for e, a in zip(expected, actual)
+                ])),
+                'lane_f1': float(np.mean([
+                    edge_f1(e, a, tolerance=12) for e, a in zip(expected, actual)
+                ])),
+            }
+
+    logger.info(f'{len(edge_images["default"])} frames of {len(video_paths)} videos')
+    logger.info(
+        f'{"backend":28s} {"density":>8s} {"p50":>10s} {"p95":>10s} {"F1 3px":>8s} {"F1 12px":>8s}'
+    )
+    for name, result in results.items():
+        logger.info(
+            f'{name:28s} {result["edge_density"]:8.2%} {result["p50_us"]:8.1f}us '
+            f'{result["p95_us"]:8.1f}us {result["line_f1"]:8.3f} {result["lane_f1"]:8.3f}'
+        )
+    if json_path:
+        dump_json({'frames': len(edge_images['default']), 'backends': results}, json_path)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the line detector backends.')
+    parser.add_argument(
+        '--videos', type=str, nargs='+',
+        default=sorted(glob.glob(os.path.join(DATA_DIR, 'sample*.avi'))),
+        help='Paths of the videos.'
+    )
+    parser.add_argument('--every_n', type=int, default=3, help='Uses every n-th frame of the videos.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.videos, args.every_n, args.json)
@@ -0,0 +1,118 @@
+"""! Update time of the matplotlib visualizers rendered headless (Agg)
+and published to a `RealtimeImageWebStreamer`, with blitting and with
+a full redraw per update.
+
+Usage: `python3 -m benchmarks.matplotlib_visualizer [--json out.json]`
+"""
+# Built-in
+import logging
+import argparse
+
+# Third party
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Visualizers
+from cvpype.python.applications.visualizer.coord import CoordsHistogramVisualizer
+from cvpype.python.applications.visualizer.image import GrayScaledImageHistogramVisualizer
+
+# Project-Streamers
+from cvpype.python.backend.web.streamer.rtimage import RealtimeImageWebStreamer
+
+# Benchmarks
+from benchmarks.common import (
+    measure,
+    synthetic_frame,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def create_coords_case():
+    visualizer = CoordsHistogramVisualizer('CoordsHistogram')
+    rng = np.random.default_rng(0)
+    # NOTE: Widths of edge pairs, as `WidthBasedIntersectionFilteringComponent` draws.
+    coords = [
+        [(x, x + w) for x, w in zip(rng.integers(0, 600, 8), rng.integers(3, 30, 8))]
+        for _ in range(16)
+    ]
+    state = {'i': 0}
+
+    def update():
+        state['i'] += 1
+        visualizer(
+            coords[state['i'] % len(coords)],
+            parse_fn=(lambda x1, x2: abs(x1 - x2)),
+            parse_history_fn=(lambda li: len(li))
+        )
+    return visualizer, update
+
+
+def create_gray_histogram_case():
+    visualizer = GrayScaledImageHistogramVisualizer('GrayHistogram')
+    frames = [synthetic_frame(50, 480, 1, seed=i) for i in range(4)]
+    state = {'i': 0}
+
+    def update():
+        state['i'] += 1
+        visualizer(frames[state['i'] % len(frames)])
+    return visualizer, update
+
+
+def benchmark_case(
+    create_case,
+    use_blit: bool,
+    n_iter: int,
+) -> dict:
+    visualizer, update = create_case()
+    visualizer.use_blit = use_blit
+    if not use_blit:
+        for artist in visualizer.animated_artists:
+            artist.set_animated(False)
+    streamer = RealtimeImageWebStreamer()
+    visualizer.set_web_streamer(streamer)
+    latency = measure(update, n_iter=n_iter, n_warmup=10)
+    return {
+        'p50_ms': latency['p50_us'] / 1000,
+        'p95_ms': latency['p95_us'] / 1000,
+        'n_full_draws': visualizer.n_full_draws,
+        'image_shape': list(streamer.output_frame.shape),
+    }
+
+
+def main(
+    n_iter: int = 200,
+    json_path: str = '',
+):
+    cases = {
+        'CoordsHistogramVisualizer': create_coords_case,
+        'GrayScaledImageHistogramVisualizer': create_gray_histogram_case,
+    }
+    result = {}
+    for name, create_case in cases.items():
+        for use_blit in (False, True):
+            key = f'{name}/{"blit" if use_blit else "full"}'
+            result[key] = benchmark_case(create_case, use_blit, n_iter)
+            logger.info(
+                f'{key:45s} p50 {result[key]["p50_ms"]:6.2f}ms '
+                f'p95 {result[key]["p95_ms"]:6.2f}ms '
+                f'({result[key]["n_full_draws"]} full draws)'
+            )
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the update time of matplotlib visualizers.')
+    parser.add_argument('--n_iter', type=int, default=200, help='Number of measured updates per case.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.n_iter, args.json)
@@ -0,0 +1,99 @@
+"""! Time of `IntersectionPipeline` scanning one row, scanning a band of rows
+at once, and running one single-row pipeline per row of the band.
+
+Usage: `python3 -m benchmarks.multirow_scan [--video data/sample.avi] [--json out.json]`
+"""
+# Built-in
+import os
+import logging
+import argparse
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Pipelines
+from cvpype.python.applications.pipelines.intersection import IntersectionPipeline
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    measure,
+    read_frames,
+    create_line_tracking_pipeline,
+    disable_visualizers,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def prepare_inputs(
+    frames: list
+) -> list:
+    """! Returns the cropped color and edge images of `LineTrackingPipeline`.
+    """
+    pipeline = create_line_tracking_pipeline()
+    inputs = []
+    for frame in frames:
+        pipeline.run(frame)
+        inputs.append((
+            pipeline.cropping.outputs[0].data_container.data.copy(),
+            pipeline.edge_detecting.outputs[0].data_container.data.copy(),
+        ))
+    return inputs
+
+
+def create_pipeline(
+    roi_y: int,
+    scan_rows: list | None = None,
+) -> IntersectionPipeline:
+    pipeline = IntersectionPipeline(roi_y, width_min=10, width_max=50, scan_rows=scan_rows)
+    pipeline.autocreate_graph()
+    disable_visualizers(*pipeline.components.values())
+    pipeline.set_optimization_mode()
+    return pipeline
+
+
+def main(
+    video_path: str = os.path.join(DATA_DIR, 'sample.avi'),
+    n_rows: int = 11,
+    json_path: str = '',
+):
+    inputs = prepare_inputs(read_frames(video_path, 30))
+    roi_y = 40
+    rows = list(range(roi_y - n_rows // 2, roi_y - n_rows // 2 + n_rows))
+    single = create_pipeline(roi_y)
+    band = create_pipeline(roi_y, scan_rows=rows)
+    per_row = [create_pipeline(y) for y in rows]
+    state = {'i': 0}
+
+    def next_inputs():
+        state['i'] += 1
+        return inputs[state['i'] % len(inputs)]
+
+    def run_per_row():
+        color_image, edge_image = next_inputs()
+        for pipeline in per_row:
+            pipeline.run(color_image, edge_image)
+
+    result = {
+        'single_row_us': measure(lambda: single.run(*next_inputs()))['p50_us'],
+        f'{n_rows}_rows_at_once_us': measure(lambda: band.run(*next_inputs()))['p50_us'],
+        f'{n_rows}_rows_one_by_one_us': measure(run_per_row, n_iter=200)['p50_us'],
+    }
+    for key, value in result.items():
+        logger.info(f'{key:28s} {value:8.1f}us')
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the multi-row intersection scan.')
+    parser.add_argument('--video', type=str, default=os.path.join(DATA_DIR, 'sample.avi'), help='Path of the video.')
+    parser.add_argument('--n_rows', type=int, default=11, help='Number of scanned rows.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.video, args.n_rows, args.json)
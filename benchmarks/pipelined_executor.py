@@ -0,0 +1,95 @@
+"""! Throughput and latency of `LineTrackingPipeline` with the serial compiled
+graph versus `PipelinedExecutor` (one worker thread per stage).
+
+Usage: `python3 -m benchmarks.pipelined_executor [--video data/sample.avi] [--json out.json]`
+"""
+# Built-in
+import os
+import time
+import logging
+import argparse
+
+# Third party
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Pipelines
+from cvpype.python.core.pipelines.executors import PipelinedExecutor
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    read_frames,
+    create_line_tracking_pipeline,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def benchmark_serial(
+    frames: list,
+) -> dict:
+    graph = create_line_tracking_pipeline().compile()
+    latencies_ms = []
+    t0 = time.perf_counter()
+    for frame in frames:
+        t = time.perf_counter()
+        graph(frame.copy())
+        latencies_ms.append((time.perf_counter() - t) * 1000)
+    elapsed = time.perf_counter() - t0
+    return {
+        'throughput_fps': len(frames) / elapsed,
+        'latency_p50_ms': float(np.percentile(latencies_ms, 50)),
+        'latency_p95_ms': float(np.percentile(latencies_ms, 95)),
+        'latency_max_ms': float(np.max(latencies_ms)),
+    }
+
+
+def benchmark_pipelined(
+    frames: list,
+    queue_size: int,
+) -> dict:
+    graph = create_line_tracking_pipeline().compile()
+    with PipelinedExecutor(graph, queue_size=queue_size) as executor:
+        for _ in executor.map(frame.copy() for frame in frames):
+            pass
+        return executor.stats()
+
+
+def main(
+    video_path: str,
+    queue_size: int = 2,
+    json_path: str = '',
+):
+    frames = read_frames(video_path)
+    serial = benchmark_serial(frames)
+    pipelined = benchmark_pipelined(frames, queue_size)
+    logger.info(f'Frames: {len(frames)} ({video_path}), CPUs: {os.cpu_count()}')
+    logger.info(
+        f'serial    {serial["throughput_fps"]:8.1f} fps | '
+        f'latency p50 {serial["latency_p50_ms"]:6.2f}ms p95 {serial["latency_p95_ms"]:6.2f}ms'
+    )
+    logger.info(
+        f'pipelined {pipelined["throughput_fps"]:8.1f} fps | '
+        f'latency p50 {pipelined["latency_p50_ms"]:6.2f}ms p95 {pipelined["latency_p95_ms"]:6.2f}ms'
+    )
+    for i, stage in enumerate(pipelined['stages']):
+        logger.info(f'  stage {i}: {stage["busy_ms_per_frame"]:6.2f}ms/frame {stage["nodes"]}')
+    result = {'serial': serial, 'pipelined': pipelined}
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the stage-pipelined executor.')
+    parser.add_argument('--video', type=str, default=os.path.join(DATA_DIR, 'sample.avi'), help='Path to the video file.')
+    parser.add_argument('--queue_size', type=int, default=2, help='Capacity of the queue in front of each stage.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.video, args.queue_size, args.json)
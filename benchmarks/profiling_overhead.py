@@ -0,0 +1,102 @@
+"""! Overhead of the latency instrumentation (`PROFILER`) per sample, and
+the latency profile of `LineTrackingPipeline` on a sample video.
+
+The overhead is the difference of the trusted call of a component
+with the profiler enabled and disabled.
+
+Usage: `python3 -m benchmarks.profiling_overhead [--video data/sample.avi] [--json out.json]`
+"""
+# Built-in
+import os
+import logging
+import argparse
+
+# Project
+from cvpype.python.utils import loggerutil
+from cvpype.python.utils.profiling import PROFILER
+
+# Project-Components
+from cvpype.python.basic.components.inputs import InputsComponent
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    measure,
+    read_frames,
+    synthetic_frame,
+    create_line_tracking_pipeline,
+    dump_json
+)
+from benchmarks.component_overhead import IdentityComponent
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def measure_overhead(
+    fn,
+    n_iter: int,
+    n_samples: int,
+    n_rounds: int = 5,
+) -> dict:
+    """! The latency of `fn` with the profiler enabled and disabled,
+    and the overhead per recorded sample.
+
+    The two settings alternate for `n_rounds` rounds and the best median
+    of each is kept, so that a noisy machine affects both alike.
+    """
+    enabled = PROFILER.enabled
+    latencies = {False: [], True: []}
+    try:
+        for _ in range(n_rounds):
+            for setting in (False, True):
+                PROFILER.enabled = setting
+                latencies[setting].append(measure(fn, n_iter=n_iter)['p50_us'])
+    finally:
+        PROFILER.enabled = enabled
+    off, on = min(latencies[False]), min(latencies[True])
+    return {
+        'off_us': off,
+        'on_us': on,
+        'overhead_per_sample_us': (on - off) / n_samples,
+    }
+
+
+def main(
+    video_path: str,
+    n_iter: int = 5000,
+    json_path: str = '',
+):
+    frame = synthetic_frame(8, 8, 3)
+    component = IdentityComponent()
+    component.set_validation_frames(0)
+    spec = InputsComponent()(frame)
+    result = {'component': measure_overhead(lambda: component(spec), n_iter, 1)}
+
+    overhead = result['component']
+    logger.info(
+        f'Trusted call: off {overhead["off_us"]:.2f}us, on {overhead["on_us"]:.2f}us, '
+        f'{overhead["overhead_per_sample_us"]:.3f}us per sample'
+    )
+
+    # NOTE: The overhead is far below the noise of a whole pipeline run.
+    frames = read_frames(video_path)
+    graph = create_line_tracking_pipeline().compile()
+    PROFILER.reset()
+    for frame in frames:
+        graph(frame)
+    result['profile'] = PROFILER.stats(prefix='component.')
+    logger.info(f'Profile of {len(frames)} frames:\n{PROFILER.report(prefix="component.")}')
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the overhead of the latency instrumentation.')
+    parser.add_argument('--video', type=str, default=os.path.join(DATA_DIR, 'sample.avi'), help='Path of the video.')
+    parser.add_argument('--n_iter', type=int, default=5000, help='Number of measured calls of the component.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.video, args.n_iter, args.json)
@@ -0,0 +1,102 @@
+"""! Latency of `RoiIntersectionPipeline` (the intersection branch of
+`LineTrackingPipeline`) computing the whole crop and computing only
+the band of rows around `roi_y` (`set_row_demand()`), and the agreement
+of the intersections of the two.
+
+Usage: `python3 -m benchmarks.row_band [--videos data/sample.avi ...] [--json out.json]`
+"""
+# Built-in
+import os
+import glob
+import logging
+import argparse
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Pipelines
+from cvpype.python.applications.pipelines.linetracking import RoiIntersectionPipeline
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    measure,
+    read_frames,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def create_pipeline(
+    blur_preset: str | None,
+    row_demand: bool,
+) -> RoiIntersectionPipeline:
+    pipeline = RoiIntersectionPipeline(
+        crop_y=330,
+        crop_y_end=380,
+        roi_y=370,
+        image_h=480,
+        blur_preset=blur_preset,
+    )
+    pipeline.autocreate_graph()
+    for _, visualizer in pipeline.visualizers.items():
+        visualizer.is_operating = False
+    pipeline.set_optimization_mode()
+    pipeline.set_row_demand(row_demand)
+    return pipeline
+
+
+def main(
+    video_paths: list[str],
+    every_n: int = 3,
+    json_path: str = '',
+):
+    frames = []
+    for video_path in video_paths:
+        frames.extend(read_frames(video_path)[::every_n])
+
+    results = {}
+    for blur_preset in ('quality', 'balanced', 'fast'):
+        full = create_pipeline(blur_preset, row_demand=False)
+        band = create_pipeline(blur_preset, row_demand=True)
+        n_agreed = sum(
+            full.run(frame).data_container.data.tolist() ==
+            band.run(frame).data_container.data.tolist()
+            for frame in frames
+        )
+        result = {
+            'plan': {name: list(rows) for name, rows in band.set_row_demand().items()},
+            'agreement': n_agreed / len(frames),
+        }
+        n_iter = 100 if blur_preset == 'quality' else 1000
+        for name, pipeline in (('full', full), ('band', band)):
+            state = {'i': 0}
+            def step():
+                pipeline.run(frames[state['i']])
+                state['i'] = (state['i'] + 1) % len(frames)
+            result[f'{name}_us'] = measure(step, n_iter=n_iter, n_warmup=10)['p50_us']
+        results[blur_preset] = result
+        logger.info(
+            f'{blur_preset:10s} full {result["full_us"]:8.1f}us -> '
+            f'band {result["band_us"]:8.1f}us ({result["full_us"] / result["band_us"]:.1f}x), '
+            f'agreement {result["agreement"]:.1%}, plan {result["plan"]}'
+        )
+    if json_path:
+        dump_json({'frames': len(frames), 'presets': results}, json_path)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the row-band processing.')
+    parser.add_argument(
+        '--videos', type=str, nargs='+',
+        default=sorted(glob.glob(os.path.join(DATA_DIR, 'sample*.avi'))),
+        help='Paths of the videos.'
+    )
+    parser.add_argument('--every_n', type=int, default=3, help='Uses every n-th frame of the videos.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.videos, args.every_n, args.json)
@@ -0,0 +1,146 @@
+"""! Cost of handing a frame from a streamer to its readers.
+
+Compares the former handoff (resize, copy under the lock, and a defensive
+copy by the reader) with the pooled buffers of `BaseStreamer` (one copy
+into a preallocated buffer, read-only views for the readers).
+
+Usage: `python3 -m benchmarks.streamer_handoff [--json out.json]`
+"""
+# Built-in
+import logging
+import argparse
+from threading import Lock
+
+# Third party
+import imutils
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Streamers
+from cvpype.python.backend.base import BaseStreamer
+
+# Benchmarks
+from benchmarks.common import (
+    measure,
+    synthetic_frame,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class LegacyHandoff():
+    """! The handoff before the pooled buffers, kept as the baseline.
+    """
+    def __init__(
+        self,
+        width: int | None = None,
+    ):
+        self.width = width
+        self.lock = Lock()
+        self.frame = None
+        self.n_published = 0
+        self.n_frame_copies = 0
+
+    def publish(
+        self,
+        img
+    ):
+        resized = imutils.resize(img, width=self.width)
+        if resized is not img:
+            self.n_frame_copies += 1
+        with self.lock:
+            self.frame = resized.copy()
+            self.n_published += 1
+            self.n_frame_copies += 1
+
+    def read(
+        self
+    ):
+        with self.lock:
+            frame = self.frame
+        # NOTE: Readers copied the frame since components painted on it.
+        self.n_frame_copies += 1
+        return frame.copy()
+
+
+class BenchmarkStreamer(BaseStreamer):
+    def read_from_stream(
+        self
+    ) -> None:
+        pass
+
+    def close(
+        self
+    ) -> None:
+        pass
+
+
+def benchmark_handoff(
+    frames: list,
+    width: int | None,
+    n_iter: int,
+) -> dict:
+    legacy = LegacyHandoff(width=width)
+    streamer = BenchmarkStreamer(width=width)
+    state = {'i': 0}
+
+    def next_frame():
+        state['i'] += 1
+        return frames[state['i'] % len(frames)]
+
+    def legacy_step():
+        legacy.publish(next_frame())
+        legacy.read()
+
+    def pooled_step():
+        streamer.output_frame = next_frame()
+        streamer.output_frame
+
+    legacy_latency = measure(legacy_step, n_iter=n_iter, n_warmup=10)
+    pooled_latency = measure(pooled_step, n_iter=n_iter, n_warmup=10)
+    return {
+        'legacy_us': legacy_latency['p50_us'],
+        'pooled_us': pooled_latency['p50_us'],
+        'legacy_copies_per_frame': legacy.n_frame_copies / legacy.n_published,
+        'pooled_copies_per_frame': streamer.n_frame_copies / (streamer.frame_seq + 1),
+        'pooled_buffers': len(streamer._buffers),
+    }
+
+
+def main(
+    n_iter: int = 200,
+    json_path: str = '',
+):
+    cases = {
+        '1080p': (1080, 1920, None),
+        '1080p->480p': (1080, 1920, 640),
+        '480p': (480, 640, None),
+    }
+    result = {}
+    for name, (h, w, width) in cases.items():
+        # NOTE: Distinct frames, so that no publication is a duplicate.
+        frames = [synthetic_frame(h, w, 3, seed=i) for i in range(2)]
+        result[name] = benchmark_handoff(frames, width, n_iter)
+        logger.info(
+            f'{name:12s} '
+            f'legacy {result[name]["legacy_us"]:9.1f}us '
+            f'({result[name]["legacy_copies_per_frame"]:.0f} copies/frame) | '
+            f'pooled {result[name]["pooled_us"]:9.1f}us '
+            f'({result[name]["pooled_copies_per_frame"]:.0f} copies/frame, '
+            f'{result[name]["pooled_buffers"]} buffers)'
+        )
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the frame handoff of streamers.')
+    parser.add_argument('--n_iter', type=int, default=200, help='Number of measured frames per case.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.n_iter, args.json)
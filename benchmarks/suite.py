@@ -0,0 +1,251 @@
+"""! Throughput of every component of `LineTrackingPipeline` and of the
+whole pipeline on the frames of a sample video resized to several
+resolutions, with a compare mode that flags regressions against a baseline.
+
+Each component is measured on the inputs it receives inside the pipeline
+(captured from the compiled graph), so the crop, the blur and the
+intersection components see the data of the actual application.
+The crop band of the pipeline is scaled with the height of the frames.
+
+Peak RSS is the peak of the whole process so far (`ru_maxrss`), so it only
+grows from case to case.
+
+Usage:
+- `python3 -m benchmarks.suite [--resolutions 320x240 640x480 1280x720] [--json baseline.json]`
+- `python3 -m benchmarks.suite --compare baseline.json [--tolerance 0.2]`
+"""
+# Built-in
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import resource
+import itertools
+
+# Third party
+import cv2
+import numpy as np
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Benchmarks
+from benchmarks.common import (
+    DATA_DIR,
+    measure,
+    read_frames,
+    create_line_tracking_pipeline,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESOLUTIONS = ('320x240', '640x480', '1280x720')
+# NOTE: The crop band of `scripts/pipeline_from_video.py` on 480 rows.
+CROP_Y, CROP_Y_END, ROI_Y, IMAGE_H = 330, 380, 370, 480
+
+
+def peak_rss_mb(
+) -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # NOTE: Bytes on macOS, kilobytes on Linux.
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+def parse_resolution(
+    resolution: str,
+) -> tuple[int, int]:
+    """! `WIDTHxHEIGHT` to `(width, height)`.
+    """
+    try:
+        width, height = (int(v) for v in resolution.lower().split('x'))
+    except ValueError:
+        raise ValueError(
+            f'Unknown resolution `{resolution}`. (Expected `WIDTHxHEIGHT`, e.g. `640x480`)'
+        )
+    return width, height
+
+
+def create_pipeline(
+    height: int,
+):
+    """! `LineTrackingPipeline` with the crop band scaled to `height`.
+    """
+    scale = height / IMAGE_H
+    return create_line_tracking_pipeline(
+        crop_y=round(CROP_Y * scale),
+        crop_y_end=round(CROP_Y_END * scale),
+        roi_y=round(ROI_Y * scale),
+        image_h=height,
+    )
+
+
+def measure_case(
+    fn,
+    inputs: list,
+    budget_s: float,
+    min_iter: int = 20,
+    max_iter: int = 2000,
+) -> dict:
+    """! Measures `fn(*input)` cycling over `inputs`, for about `budget_s` seconds.
+
+    @return `fps` and the latency statistics of `measure`.
+    """
+    cycle = itertools.cycle(inputs)
+    t0 = time.perf_counter()
+    for _ in range(3):
+        fn(*next(cycle))
+    estimate_s = (time.perf_counter() - t0) / 3
+    n_iter = int(np.clip(budget_s / max(estimate_s, 1e-9), min_iter, max_iter))
+    result = measure(lambda: fn(*next(cycle)), n_iter=n_iter, n_warmup=len(inputs))
+    result['fps'] = 1e6 / result['mean_us'] if result['mean_us'] else 0.0
+    return result
+
+
+def capture_component_inputs(
+    graph,
+    frames: list[np.ndarray],
+) -> dict:
+    """! Runs the compiled graph on `frames` and copies the inputs
+    of every component for every frame.
+
+    @return the `(component, kwargs, inputs)` of each component by node name.
+    """
+    captured = {
+        node.name: (node.component, node.kwargs, [])
+        for node in graph.nodes
+        if not node.is_passthrough
+    }
+    # NOTE: The nodes are run one by one to read the inputs before they are overwritten.
+    for frame in frames:
+        graph.feed(frame)
+        for node in graph.nodes:
+            if not node.is_passthrough:
+                captured[node.name][2].append(tuple(
+                    np.copy(src.data_container.data)
+                    if isinstance(src.data_container.data, np.ndarray)
+                    else src.data_container.data
+                    for src in node.sources
+                ))
+            node.execute()
+    return captured
+
+
+def run_resolution(
+    source_frames: list[np.ndarray],
+    width: int,
+    height: int,
+    budget_s: float,
+) -> dict:
+    frames = [
+        cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+        for frame in source_frames
+    ]
+    pipeline = create_pipeline(height)
+    graph = pipeline.compile()
+    results = {}
+    for name, (component, kwargs, inputs) in capture_component_inputs(graph, frames).items():
+        results[f'component.{name}'] = measure_case(
+            lambda *args: component.run(*args, **kwargs), inputs, budget_s
+        )
+    # NOTE: `run()` validates every call (debugging mode); the graph runs the trusted schedule.
+    results['pipeline.run'] = measure_case(pipeline.run, [(f,) for f in frames], budget_s)
+    results['pipeline.graph'] = measure_case(graph, [(f,) for f in frames], budget_s)
+    for result in results.values():
+        result['peak_rss_mb'] = peak_rss_mb()
+    return results
+
+
+def compare(
+    result: dict,
+    baseline: dict,
+    tolerance: float,
+) -> list[str]:
+    """! The cases of `result` whose median latency (or the peak RSS)
+    exceeds the one of `baseline` by more than `tolerance`.
+    """
+    regressions = []
+    for key, case in result['cases'].items():
+        if key not in baseline['cases']:
+            continue
+        expected = baseline['cases'][key]['p50_us']
+        if case['p50_us'] > expected * (1 + tolerance):
+            regressions.append(
+                f'{key}: p50 {expected:.1f}us -> {case["p50_us"]:.1f}us '
+                f'({case["p50_us"] / expected - 1:+.0%})'
+            )
+    expected = baseline['peak_rss_mb']
+    if result['peak_rss_mb'] > expected * (1 + tolerance):
+        regressions.append(f'peak RSS: {expected:.0f}MB -> {result["peak_rss_mb"]:.0f}MB')
+    return regressions
+
+
+def main(
+    video_path: str,
+    resolutions: list[str] = RESOLUTIONS,
+    n_frames: int = 20,
+    budget_s: float = 0.5,
+    json_path: str = '',
+    baseline_path: str = '',
+    tolerance: float = 0.2,
+) -> int:
+    source_frames = read_frames(video_path, n_frames)
+    result = {
+        'meta': {
+            'video': os.path.basename(video_path),
+            'n_frames': len(source_frames),
+            'python': platform.python_version(),
+            'opencv': cv2.__version__,
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'cases': {},
+    }
+    for resolution in resolutions:
+        width, height = parse_resolution(resolution)
+        for name, case in run_resolution(source_frames, width, height, budget_s).items():
+            key = f'{width}x{height}/{name}'
+            result['cases'][key] = case
+            logger.info(
+                f'{key:64s} {case["fps"]:9.1f} fps | p50 {case["p50_us"]:9.1f}us '
+                f'p95 {case["p95_us"]:9.1f}us p99 {case["p99_us"]:9.1f}us | '
+                f'peak RSS {case["peak_rss_mb"]:.0f}MB'
+            )
+    result['peak_rss_mb'] = peak_rss_mb()
+    if json_path:
+        dump_json(result, json_path)
+
+    if not baseline_path:
+        return 0
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = compare(result, baseline, tolerance)
+    for regression in regressions:
+        logger.warning(f'Regression: {regression}')
+    if regressions:
+        logger.warning(f'{len(regressions)} regression(s) over {tolerance:.0%} against {baseline_path}')
+        return 1
+    logger.info(f'No regression over {tolerance:.0%} against {baseline_path}')
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the components and the pipeline.')
+    parser.add_argument('--video', type=str, default=os.path.join(DATA_DIR, 'sample.avi'), help='Path of the video.')
+    parser.add_argument('--resolutions', type=str, nargs='+', default=list(RESOLUTIONS), help='Resolutions as WIDTHxHEIGHT.')
+    parser.add_argument('--n_frames', type=int, default=20, help='Number of frames of the video to cycle through.')
+    parser.add_argument('--budget', type=float, default=0.5, help='Approximate seconds measured per case.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    parser.add_argument('--compare', type=str, default='', help='Path of a baseline JSON to compare with.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Relative slowdown reported as a regression.')
+    args = parser.parse_args()
+    sys.exit(main(
+        args.video, args.resolutions, args.n_frames, args.budget,
+        args.json, args.compare, args.tolerance,
+    ))
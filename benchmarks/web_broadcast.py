@@ -0,0 +1,126 @@
+"""! Encode cost of a web streamer versus the number of connected browsers.
+
+Every browser is simulated by a thread that consumes `push_to_browser()`.
+With the shared encoder, the number of encoded frames and the CPU time
+should not depend on the number of browsers, and an idle stream should
+not use CPU. The delivery latency (publication to browser) should stay
+close to the encode time.
+
+Usage: `python3 -m benchmarks.web_broadcast [--json out.json]`
+"""
+# Built-in
+import time
+import logging
+import argparse
+from threading import Thread
+
+# Project
+from cvpype.python.utils import loggerutil
+
+# Project-Streamers
+from cvpype.python.backend.web.streamer.base import BaseWebStreamer
+
+# Benchmarks
+from benchmarks.common import (
+    synthetic_frame,
+    dump_json
+)
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class BenchmarkWebStreamer(BaseWebStreamer):
+    def read_from_stream(
+        self
+    ) -> None:
+        pass
+
+    def close(
+        self
+    ) -> None:
+        pass
+
+
+def consume(
+    client,
+    received: list,
+) -> None:
+    for chunk in client:
+        received.append(len(chunk))
+
+
+def benchmark_viewers(
+    frames: list,
+    n_viewers: int,
+    fps: float,
+    idle_seconds: float,
+) -> dict:
+    streamer = BenchmarkWebStreamer()
+    streamer.output_frame = frames[0]
+    received = [[] for _ in range(n_viewers)]
+    for i in range(n_viewers):
+        Thread(
+            target=consume,
+            args=(streamer.push_to_browser(), received[i]),
+            daemon=True
+        ).start()
+    while streamer.n_clients < n_viewers:
+        time.sleep(0.01)
+
+    cpu0, t0 = time.process_time(), time.perf_counter()
+    for i, frame in enumerate(frames[1:], 1):
+        streamer.output_frame = frame
+        time.sleep(max(0.0, t0 + i / fps - time.perf_counter()))
+    streaming_cpu = time.process_time() - cpu0
+
+    cpu0 = time.process_time()
+    time.sleep(idle_seconds)
+    idle_cpu = time.process_time() - cpu0
+    latency = streamer.latency_stats()
+    return {
+        'n_viewers': n_viewers,
+        'n_published': len(frames),
+        'n_encoded': streamer.n_encoded,
+        'streaming_cpu_ms_per_frame': streaming_cpu / (len(frames) - 1) * 1000,
+        'idle_cpu_ms_per_second': idle_cpu / idle_seconds * 1000,
+        'min_frames_received': min(len(r) for r in received),
+        'encode_p50_ms': latency['encode_p50_ms'],
+        'delivery_p50_ms': latency['delivery_p50_ms'],
+        'delivery_p95_ms': latency['delivery_p95_ms'],
+    }
+
+
+def main(
+    n_frames: int = 60,
+    fps: float = 30.0,
+    json_path: str = '',
+):
+    # NOTE: Distinct frames, so that no publication is a duplicate.
+    frames = [synthetic_frame(720, 1280, 3, seed=i % 4) for i in range(n_frames)]
+    result = {}
+    for n_viewers in (1, 4, 16):
+        key = f'{n_viewers}_viewers'
+        result[key] = benchmark_viewers(frames, n_viewers, fps, idle_seconds=1.0)
+        logger.info(
+            f'{n_viewers:2d} viewers: '
+            f'{result[key]["n_encoded"]} encoded / {n_frames} published, '
+            f'{result[key]["streaming_cpu_ms_per_frame"]:.2f} CPU ms/frame, '
+            f'idle {result[key]["idle_cpu_ms_per_second"]:.2f} CPU ms/s, '
+            f'encode p50 {result[key]["encode_p50_ms"]:.2f}ms, '
+            f'delivery p50 {result[key]["delivery_p50_ms"]:.2f}ms '
+            f'p95 {result[key]["delivery_p95_ms"]:.2f}ms'
+        )
+    if json_path:
+        dump_json(result, json_path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the shared MJPEG encoder of web streamers.')
+    parser.add_argument('--n_frames', type=int, default=60, help='Number of published frames per case.')
+    parser.add_argument('--fps', type=float, default=30.0, help='Publication rate.')
+    parser.add_argument('--json', type=str, default='', help='Path to save the result as JSON.')
+    args = parser.parse_args()
+    main(args.n_frames, args.fps, args.json)
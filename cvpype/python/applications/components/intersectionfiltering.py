@@ -7,7 +7,7 @@ from cvpype.python.iospec import ComponentIOSpec
 
 # Project-Types
 from cvpype.python.basic.types.cvimage import RGBImageType
-from cvpype.python.applications.types.cvcoord import CVCoordinatesType
+from cvpype.python.applications.types.cvcoord import CVCoordinatesType, PackedPairs
 
 # Project-Components
 from cvpype.python.basic.components.custom import CustomComponent
@@ -47,10 +47,13 @@ class WidthBasedIntersectionFilteringComponent(CustomComponent):
         self,
         intersections,
     ) -> dict:
-        valid_pairs = [
-            (start_idx, end_idx) for start_idx, end_idx in intersections
-            if self.width_min <= end_idx - start_idx <= self.width_max
-        ]
+        pairs = np.reshape(intersections, (-1, 2))
+        widths = pairs[:, 1] - pairs[:, 0]
+        is_valid = (self.width_min <= widths) & (widths <= self.width_max)
+        if isinstance(intersections, PackedPairs):
+            valid_pairs = intersections.select(is_valid)
+        else:
+            valid_pairs = pairs[is_valid]
         self.log(f'Intersections: {len(valid_pairs)}/{len(intersections)} '
                  f'(#filtered/#input)')
         self.visualize(
@@ -66,8 +69,18 @@ class ColorBasedIntersectionFilteringComponent(CustomComponent):
     def __init__(
         self,
         y: int,
-        black_threshold: int = 230,  # FIXME: manual
+        black_threshold: int | None = None,
+        black_ratio: float = 0.5,
     ):
+        """! Keeps the pairs of edges whose inside is black in the row `y`.
+
+        @param y The row to inspect. If the pairs are `PackedPairs`,
+        the rows of the pairs are inspected instead.
+        @param black_threshold A pixel whose V (of HSV) is lower than this is black.
+        `None` derives the threshold from the histogram of the row (Otsu's method)
+        on every frame.
+        @param black_ratio The minimum ratio of black pixels between the edges.
+        """
         super().__init__(
             inputs=[
                 ComponentIOSpec(
@@ -88,31 +101,55 @@ class ColorBasedIntersectionFilteringComponent(CustomComponent):
         )
         self.y = y
         self.black_threshold = black_threshold
+        self.black_ratio = black_ratio
+        self.last_black_threshold = black_threshold
 
     def run(
         self,
         color_image,
         valid_pairs,
     ) -> dict:
-        color_row = color_image[self.y]
+        if isinstance(valid_pairs, PackedPairs):
+            color_rows = color_image[valid_pairs.rows]
+            pairs = valid_pairs.pairs
+            row_index = valid_pairs.row_index
+        else:
+            color_rows = color_image[self.y:self.y + 1]
+            pairs = np.reshape(valid_pairs, (-1, 2))
+            row_index = np.zeros((len(pairs),), dtype=np.intp)
 
         # HSV 공간을 사용하여 분석합니다. 전체 이미지를 변환하는 대신 필요한 행만 변환합니다.
-        hsv_row = cv2.cvtColor(np.array([color_row]), cv2.COLOR_BGR2HSV)
-        _, _, v_row = cv2.split(hsv_row)
-
-        BIN_COUNT = 256
-        hist = cv2.calcHist([hsv_row], [0], None, [BIN_COUNT], [0, 256])
-
-        # 에지 쌍 내부 영역이 검은색인지 확인합니다.
-        valid_black_pairs = []
-        for start, end in valid_pairs:
-            line_section = v_row[start:end] # V 채널을 사용합니다.
-            black_pixels = len(np.where(line_section < self.black_threshold)[0])
-
-            if black_pixels / (len(line_section) + 0.1) >= 0.5:
-                valid_black_pairs.append((start, end))
+        hsv_rows = cv2.cvtColor(color_rows, cv2.COLOR_BGR2HSV)
+        v_rows = hsv_rows[:, :, 2]
+
+        if self.black_threshold is None:
+            # NOTE: Otsu's method splits the histogram of the rows into
+            # dark (lines) and bright (road) pixels.
+            otsu_threshold, _ = cv2.threshold(
+                v_rows, 0, 255,
+                cv2.THRESH_BINARY | cv2.THRESH_OTSU
+            )
+            # NOTE: Otsu's dark class includes the threshold itself.
+            black_threshold = otsu_threshold + 1
+        else:
+            black_threshold = self.black_threshold
+        self.last_black_threshold = black_threshold
+
+        # NOTE: With the prefix sum, the number of black pixels
+        # in `v_rows[r, start:end]` is `n_black[r, end] - n_black[r, start]`.
+        # The row-wise prefix sums are the row differences of the integral image.
+        is_black_pixel = (v_rows < black_threshold).view(np.uint8)
+        n_black = np.diff(cv2.integral(is_black_pixel), axis=0)
+        pairs = pairs.astype(np.intp, copy=False)
+        starts, ends = pairs[:, 0], pairs[:, 1]
+        ratios = (n_black[row_index, ends] - n_black[row_index, starts]) / (ends - starts + 0.1)
+        is_black = ratios >= self.black_ratio
+        if isinstance(valid_pairs, PackedPairs):
+            valid_black_pairs = valid_pairs.select(is_black)
+        else:
+            valid_black_pairs = pairs[is_black]
 
         self.log(f'Intersections: {len(valid_black_pairs)}/{len(valid_pairs)} '
-                 f'(#filtered/#input)')
+                 f'(#filtered/#input, black threshold: {black_threshold:.0f})')
 
         return {'filtered_pairs': valid_black_pairs}
@@ -1,3 +1,6 @@
+# Built-in
+from typing import Sequence
+
 # Third party
 import numpy as np
 
@@ -6,18 +9,113 @@ from cvpype.python.iospec import ComponentIOSpec
 
 # Project-Types
 from cvpype.python.basic.types.cvimage import EdgeImageType
-from cvpype.python.applications.types.cvcoord import CVCoordinatesType
+from cvpype.python.applications.types.cvcoord import (
+    CVCoordinatesType,
+    CVPackedCoordinatesType,
+    PackedPairs
+)
 
 # Project-Components
 from cvpype.python.basic.components.custom import CustomComponent
+from cvpype.python.applications.components.lanetracking import (
+    LaneTracker,
+    is_in_one_window,
+    window_mask
+)
+
+
+def find_edge_pairs(
+    edge_idx: np.ndarray,
+    width_min: int | None = None,
+    width_max: int | None = None,
+) -> np.ndarray:
+    """! Pairs the sorted edge positions of a row.
+
+    Without a width window, each edge is paired with the next edge.
+    With a width window, every pair `(s, e)` of edges with
+    `width_min <= e - s <= width_max` is returned, found with
+    `np.searchsorted` instead of enumerating all pairs.
+
+    @param edge_idx Sorted x coordinates of the edges in a row.
+
+    @return an `(N, 2)` integer array of `(start, end)` pairs,
+    sorted by start then end.
+    """
+    n_edges = len(edge_idx)
+    if width_min is None and width_max is None:
+        if n_edges <= 1:
+            return np.empty((0, 2), dtype=np.intp)
+        return np.column_stack((edge_idx[:-1], edge_idx[1:]))
+    width_min = 1 if width_min is None else max(width_min, 1)
+    width_max = np.iinfo(np.intp).max // 2 if width_max is None else width_max
+    # NOTE: For each start, the ends within the window are contiguous.
+    first = np.searchsorted(edge_idx, edge_idx + width_min, side='left')
+    last = np.searchsorted(edge_idx, edge_idx + width_max, side='right')
+    counts = np.maximum(last - first, 0)
+    n_pairs = int(counts.sum())
+    if n_pairs == 0:
+        return np.empty((0, 2), dtype=np.intp)
+    starts = np.repeat(np.arange(n_edges), counts)
+    offsets = np.arange(n_pairs) - np.repeat(np.cumsum(counts) - counts, counts)
+    ends = first[starts] + offsets
+    return np.column_stack((edge_idx[starts], edge_idx[ends]))
+
+
+def find_edge_pairs_in_rows(
+    edge_rows: np.ndarray,
+    rows: np.ndarray,
+    width_min: int | None = None,
+    width_max: int | None = None,
+) -> PackedPairs:
+    """! Pairs the edges of several rows at once (see `find_edge_pairs`).
+
+    The edges of all rows are numbered with a key `row_index * stride + x`,
+    where `stride` is larger than a row plus the width window, so that a
+    single sorted search over all keys never pairs edges of different rows.
+
+    @param edge_rows A `(R, W)` boolean array of edges.
+    @param rows The y coordinates of the rows.
+    """
+    n_rows, width = edge_rows.shape
+    row_index, xs = np.nonzero(edge_rows)
+    if width_min is None and width_max is None:
+        same_row = row_index[:-1] == row_index[1:]
+        pairs = np.column_stack((xs[:-1][same_row], xs[1:][same_row]))
+        return PackedPairs.from_row_index(rows, row_index[:-1][same_row], pairs)
+    # NOTE: A pair is never wider than a row, and an unbounded window
+    # would reach the edges of the next rows.
+    width_max = width if width_max is None else min(max(width_max, 0), width)
+    stride = width + width_max + 1
+    keys = row_index * stride + xs
+    key_pairs = find_edge_pairs(keys, width_min, width_max)
+    return PackedPairs.from_row_index(
+        rows,
+        key_pairs[:, 0] // stride,
+        key_pairs % stride,
+    )
 
 
 class IntersectionFindingComponent(CustomComponent):
 
     def __init__(
         self,
-        y: int,
+        y: int | Sequence[int],
+        width_min: int | None = None,
+        width_max: int | None = None,
+        tracker: LaneTracker | None = None,
     ):
+        """! Finds the pairs of edges in the row `y` of an edge image.
+
+        @param y The row to scan. If several rows (e.g. `range(y0, y1)`)
+        are given, they are scanned with one 2D operation, and the result
+        is `PackedPairs` (`CVPackedCoordinatesType`) instead of an array.
+        @param width_min If a width window is given, every pair of edges
+        (not only adjacent ones) whose width lies in `[width_min, width_max]`
+        is returned. Otherwise, adjacent edges are paired.
+        @param width_max See `width_min`.
+        @param tracker If given, only the edges in the windows around the lanes
+        predicted by `tracker` are paired, unless it requests a full search.
+        """
         super().__init__(
             inputs = [
                 ComponentIOSpec(
@@ -33,18 +131,45 @@ class IntersectionFindingComponent(CustomComponent):
             ]
         )
         self.y = y
+        self.width_min = width_min
+        self.width_max = width_max
+        self.tracker = tracker
+        self.is_multirow = not isinstance(y, (int, np.integer))
+        if self.is_multirow:
+            self.rows = np.asarray(y, dtype=np.intp)
+            self.change_output_type('intersections', CVPackedCoordinatesType)
+
+    def required_rows(
+        self,
+        input_index: int,
+    ) -> tuple[int, int]:
+        if self.is_multirow:
+            return (int(self.rows.min()), int(self.rows.max()) + 1)
+        return (int(self.y), int(self.y) + 1)
 
     def run(
         self,
         edge_image,
     ) -> dict:
         EDGE_INTENSITY_THRESH = 255
+        windows = None if self.tracker is None else self.tracker.row_windows
+        if self.is_multirow:
+            edge_rows = edge_image[self.rows] >= EDGE_INTENSITY_THRESH
+            if windows is not None:
+                edge_rows &= window_mask(windows, edge_rows.shape[1])
+            edge_pairs = find_edge_pairs_in_rows(
+                edge_rows, self.rows, self.width_min, self.width_max
+            )
+            if windows is not None:
+                edge_pairs = edge_pairs.select(is_in_one_window(edge_pairs.pairs, windows))
+            return {'intersections': edge_pairs}
         edge_row = edge_image[self.y]
-        edge_idx = np.where(edge_row >= EDGE_INTENSITY_THRESH)[0]
-        if len(edge_idx) <= 1:
-            return {'intersections': []}
-        edge_pairs = [
-            (edge_idx[i], edge_idx[i + 1])
-            for i in range(len(edge_idx) - 1)
-        ]
+        is_edge = edge_row >= EDGE_INTENSITY_THRESH
+        if windows is not None:
+            is_edge &= window_mask(windows, len(edge_row))
+        edge_idx = np.flatnonzero(is_edge)
+        edge_pairs = find_edge_pairs(edge_idx, self.width_min, self.width_max)
+        if windows is not None:
+            edge_pairs = edge_pairs[is_in_one_window(edge_pairs, windows)]
         return {'intersections': edge_pairs}
+
@@ -0,0 +1,358 @@
+# Built-in
+import math
+
+# Third party
+import numpy as np
+
+# Project
+from cvpype.python.iospec import ComponentIOSpec
+
+# Project-Types
+from cvpype.python.applications.types.cvcoord import CVCoordinatesType
+from cvpype.python.applications.types.cvline import CVLinesType
+
+# Project-Components
+from cvpype.python.basic.components.custom import CustomComponent
+
+
+def merge_windows(
+    windows: list[tuple[float, float]],
+) -> np.ndarray:
+    """! Sorts `(start, end)` windows, clips them at zero and merges the overlapping ones.
+
+    @return a `(K, 2)` integer array of disjoint windows sorted by start.
+    """
+    merged = []
+    for start, end in sorted(windows):
+        start, end = max(math.floor(start), 0), math.ceil(end)
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return np.asarray(merged, dtype=np.intp).reshape(-1, 2)
+
+
+def window_mask(
+    windows: np.ndarray,
+    width: int,
+) -> np.ndarray:
+    """! Returns a boolean array of `width` that is `True` inside the windows.
+    """
+    mask = np.zeros((width,), dtype=bool)
+    for start, end in windows.tolist():
+        mask[start:end] = True
+    return mask
+
+
+def is_in_one_window(
+    pairs: np.ndarray,
+    windows: np.ndarray,
+) -> np.ndarray:
+    """! Returns whether both ends of each `(start, end)` pair are in the same
+    window, given that every end is inside a window.
+    """
+    index = np.searchsorted(windows[:, 0], pairs, side='right')
+    return index[:, 0] == index[:, 1]
+
+
+class _Lane():
+    __slots__ = ('x', 'v', 'width', 'slope', 'n_hits', 'n_misses')
+
+    def __init__(
+        self,
+        x: float,
+        width: float,
+    ) -> None:
+        self.x = x
+        self.v = 0.0
+        self.width = width
+        self.slope = None
+        self.n_hits = 1
+        self.n_misses = 0
+
+
+class LaneTracker():
+    """! Tracks the lanes (black lines) crossing the row `roi_y` from frame
+    to frame with an alpha-beta (constant velocity) filter, and predicts
+    where the finders should search them in the next frame.
+
+    The windows are `None` when the next frame should be searched entirely:
+    before any lane is found, when a lane is lost (missed more than
+    `max_misses` frames in a row), and every `redetect_every` frames
+    to pick up new lanes. The share of such frames is `fallback_rate`.
+    While fewer than `n_lanes` lanes are tracked, only the row is searched
+    entirely (which is cheap), so that a returning lane is picked up
+    without searching the lines of the whole image.
+
+    The tracker is shared by the finders (which read the windows) and
+    `LaneTrackingComponent` (which updates it), so it is not part of the
+    data flow of the graph. With a pipelined executor, the finders read
+    the windows predicted a few frames before.
+    """
+    def __init__(
+        self,
+        roi_y: int,
+        height: int,
+        margin: float = 16,
+        line_margin: float = 16,
+        max_slope: float = 2.0,
+        alpha: float = 0.6,
+        beta: float = 0.2,
+        cluster_gap: float = 8,
+        min_hits: int = 2,
+        max_misses: int = 2,
+        redetect_every: int = 30,
+        n_lanes: int = 2,
+    ) -> None:
+        """!
+        @param roi_y The row of the intersections, in the coordinates of the searched image.
+        @param height The height of the image searched for lines.
+        @param margin The margin around a lane of the window searched in `roi_y`.
+        It grows with each missed frame.
+        @param line_margin The margin around a lane of the band searched for lines.
+        @param max_slope The maximum `dx/dy` of a lane whose slope is not known yet.
+        @param alpha The gain of the position (and width) update.
+        @param beta The gain of the velocity update.
+        @param cluster_gap The pairs whose centers are closer than this belong to one lane.
+        @param min_hits The number of frames a new lane must be found in
+        before losing it triggers a full search.
+        @param max_misses The number of frames a lane is predicted without being found.
+        @param redetect_every The period (in frames) of full searches. `None` disables them.
+        @param n_lanes The number of lanes expected in the row.
+        """
+        self.roi_y = roi_y
+        self.height = height
+        self.margin = margin
+        self.line_margin = line_margin
+        self.max_slope = max_slope
+        self.alpha = alpha
+        self.beta = beta
+        self.cluster_gap = cluster_gap
+        self.min_hits = min_hits
+        self.max_misses = max_misses
+        self.redetect_every = redetect_every
+        self.n_lanes = n_lanes
+        self.reset()
+
+    def reset(
+        self
+    ) -> None:
+        self.lanes: list[_Lane] = []
+        self.row_windows: np.ndarray | None = None
+        self.line_windows: np.ndarray | None = None
+        self.n_frames = 0
+        self.n_full_searches = 0
+        self.n_lost = 0
+        self._n_since_full_search = 0
+
+    @property
+    def is_tracking(
+        self
+    ) -> bool:
+        """! `False` if the current frame is searched entirely.
+        """
+        return self.line_windows is not None
+
+    @property
+    def fallback_rate(
+        self
+    ) -> float:
+        return self.n_full_searches / self.n_frames if self.n_frames else 0.0
+
+    def _cluster(
+        self,
+        pairs: list[list[int]],
+    ) -> list[tuple[float, float]]:
+        """! Groups the pairs by their centers.
+
+        @return the center and the width of each group.
+        """
+        # NOTE: A few pairs per frame. Plain Python is faster than NumPy here.
+        groups = []
+        last_center = -math.inf
+        for center, width in sorted(((start + end) / 2, end - start) for start, end in pairs):
+            if center - last_center <= self.cluster_gap:
+                group = groups[-1]
+                group[0] += center
+                group[1] += width
+                group[2] += 1
+            else:
+                groups.append([center, width, 1])
+            last_center = center
+        return [(center / n, width / n) for center, width, n in groups]
+
+    def _fit_slopes(
+        self,
+        lines: list[list[int]],
+    ) -> None:
+        """! Updates the slope (`dx/dy`) of each lane with the lines crossing
+        `roi_y` near the lane.
+        """
+        crossings = []
+        for x1, y1, x2, y2 in lines:
+            if y1 == y2:
+                continue
+            slope = (x2 - x1) / (y2 - y1)
+            crossings.append((x1 + (self.roi_y - y1) * slope, slope))
+        for lane in self.lanes:
+            gate = lane.width / 2 + self.line_margin
+            slopes = [slope for x, slope in crossings if abs(x - lane.x) <= gate]
+            if not slopes:
+                continue
+            slope = sum(slopes) / len(slopes)
+            lane.slope = slope if lane.slope is None else (
+                lane.slope + self.alpha * (slope - lane.slope)
+            )
+
+    def _predict_windows(
+        self
+    ) -> None:
+        row_windows = []
+        line_windows = []
+        dy_top = -self.roi_y
+        dy_bottom = self.height - 1 - self.roi_y
+        for lane in self.lanes:
+            x = lane.x + lane.v
+            half_width = lane.width / 2
+            margin = self.margin * (1 + lane.n_misses)
+            row_windows.append((x - half_width - margin, x + half_width + margin + 1))
+            if lane.slope is None:
+                extent = self.max_slope * max(-dy_top, dy_bottom)
+                low, high = x - extent, x + extent
+            else:
+                low, high = sorted((x + lane.slope * dy_top, x + lane.slope * dy_bottom))
+            line_margin = half_width + self.line_margin + self.margin * lane.n_misses
+            line_windows.append((low - line_margin, high + line_margin + 1))
+        self.row_windows = merge_windows(row_windows)
+        self.line_windows = merge_windows(line_windows)
+
+    def update(
+        self,
+        pairs: np.ndarray,
+        lines: np.ndarray | None = None,
+    ) -> None:
+        """! Updates the lanes with the intersections (and the lines) found
+        in the current frame, then predicts the windows of the next frame.
+
+        @param pairs An `(N, 2)` array of the `(start, end)` intersections in `roi_y`.
+        @param lines The lines found in the current frame. They are used
+        to estimate the slope of the lanes, which shapes the windows of the line search.
+        """
+        was_full_search = not self.is_tracking
+        was_full_row_search = self.row_windows is None
+        self.n_frames += 1
+        self.n_full_searches += was_full_search
+        clusters = self._cluster(np.reshape(np.asarray(pairs), (-1, 2)).tolist())
+        n_lost = 0
+        lanes = []
+        for lane in self.lanes:
+            x = lane.x + lane.v
+            gate = lane.width / 2 + self.margin * (1 + lane.n_misses)
+            nearest = min(
+                range(len(clusters)),
+                key=lambda i: abs(clusters[i][0] - x),
+                default=None
+            )
+            if nearest is not None and abs(clusters[nearest][0] - x) <= gate:
+                center, width = clusters.pop(nearest)
+                residual = center - x
+                lane.x = x + self.alpha * residual
+                lane.v += self.beta * residual
+                lane.width += self.alpha * (width - lane.width)
+                lane.n_hits += 1
+                lane.n_misses = 0
+            else:
+                lane.x = x
+                lane.n_misses += 1
+                if lane.n_misses > self.max_misses:
+                    # NOTE: Tentative lanes (e.g. noise) are dropped silently.
+                    n_lost += lane.n_hits >= self.min_hits
+                    continue
+            lanes.append(lane)
+        if was_full_row_search:
+            lanes.extend(_Lane(center, width) for center, width in clusters)
+        self.lanes = sorted(lanes, key=lambda lane: lane.x)
+        self.n_lost += n_lost
+        if lines is not None and len(lines):
+            self._fit_slopes(np.reshape(lines, (-1, 4)).tolist())
+
+        self._n_since_full_search = 0 if was_full_search else self._n_since_full_search + 1
+        if (
+            not self.lanes or n_lost or
+            (self.redetect_every is not None and self._n_since_full_search + 1 >= self.redetect_every)
+        ):
+            self.row_windows = None
+            self.line_windows = None
+        else:
+            self._predict_windows()
+            n_confirmed = sum(lane.n_hits >= self.min_hits for lane in self.lanes)
+            if n_confirmed < self.n_lanes:
+                self.row_windows = None
+
+    def lane_pairs(
+        self
+    ) -> np.ndarray:
+        """! Returns the confirmed lanes as an `(N, 2)` array of `(start, end)` in `roi_y`.
+        """
+        lanes = [lane for lane in self.lanes if lane.n_hits >= self.min_hits]
+        if not lanes:
+            return np.empty((0, 2), dtype=np.intp)
+        return np.asarray([
+            (round(lane.x - lane.width / 2), round(lane.x + lane.width / 2))
+            for lane in lanes
+        ], dtype=np.intp)
+
+    def stats(
+        self
+    ) -> dict:
+        return {
+            'frames': self.n_frames,
+            'full_searches': self.n_full_searches,
+            'fallback_rate': self.fallback_rate,
+            'lost': self.n_lost,
+            'lanes': len(self.lanes),
+        }
+
+
+class LaneTrackingComponent(CustomComponent):
+
+    def __init__(
+        self,
+        tracker: LaneTracker,
+    ):
+        """! Updates `tracker` with the intersections and the lines of each
+        frame, so that the finders sharing `tracker` search only around
+        the predicted lanes in the next frame.
+        """
+        super().__init__(
+            inputs = [
+                ComponentIOSpec(
+                    name='intersections',
+                    data_container=CVCoordinatesType(),
+                ),
+                ComponentIOSpec(
+                    name='lines',
+                    data_container=CVLinesType(),
+                )
+            ],
+            outputs = [
+                ComponentIOSpec(
+                    name='lanes',
+                    data_container=CVCoordinatesType(),
+                )
+            ]
+        )
+        self.tracker = tracker
+
+    def run(
+        self,
+        intersections,
+        lines,
+    ) -> dict:
+        self.tracker.update(intersections, lines)
+        self.log(
+            f'Lanes: {len(self.tracker.lanes)} '
+            f'({"tracking" if self.tracker.is_tracking else "full search"} in the next frame)',
+            level='debug'
+        )
+        return {'lanes': self.tracker.lane_pairs()}
@@ -3,6 +3,7 @@ from math import pi
 
 # Third party
 import cv2
+import numpy as np
 
 # Project
 from cvpype.python.iospec import ComponentIOSpec
@@ -13,6 +14,7 @@ from cvpype.python.applications.types.cvline import CVLinesType
 
 # Project-Components
 from cvpype.python.basic.components.custom import CustomComponent
+from cvpype.python.applications.components.lanetracking import LaneTracker
 
 # Project-Visualizers
 from cvpype.python.applications.visualizer.line import (
@@ -25,12 +27,44 @@ from cvpype.python.utils.component import \
 
 
 class LineFindingComponent(CustomComponent):
-    """! Finds lines in an edge-detected image.
+    """! Finds lines in an edge-detected image. `backend` selects the detector:
+    - `hough`: probabilistic Hough transform (`cv2.HoughLinesP`).
+    - `downscaled-hough`: the Hough transform of the edge image max-pooled
+    by `scale`, with the lines scaled back.
+    - `lsd`: OpenCV's line segment detector.
+    - `fld`: the fast line detector of `cv2.ximgproc` (opencv-contrib-python).
+    - `sliding-window`: finds the lanes in the column histogram of the edges,
+    follows each lane with windows sliding up the image and fits a line
+    to the edges in the windows.
+
+    Every backend returns `(N, 4)` lines `(x1, y1, x2, y2)` (`CVLinesType`),
+    or an empty list if no line is found.
+    See `benchmarks/line_backends.py` for their latency and agreement.
     """
+    BACKENDS = ('hough', 'downscaled-hough', 'lsd', 'fld', 'sliding-window')
 
     def __init__(
-        self
+        self,
+        tracker: LaneTracker | None = None,
+        backend: str = 'hough',
+        scale: int = 2,
+        n_windows: int = 5,
+        window_margin: int = 24,
+        min_pixels: int = 20,
+        max_lanes: int = 4,
     ):
+        """!
+        @param tracker If given, only the column bands around the lanes
+        predicted by `tracker` are searched, unless it requests a full search.
+        @param backend The line detector. See the class docstring.
+        @param scale The downscaling factor of the `downscaled-hough` backend.
+        @param n_windows The number of windows per lane of the `sliding-window` backend.
+        @param window_margin The half width of the windows of the `sliding-window` backend.
+        @param min_pixels The minimum number of edge pixels of a lane
+        (in the histogram) and of a window of the `sliding-window` backend.
+        @param max_lanes The maximum number of lanes the `sliding-window` backend follows,
+        from the highest peak of the histogram.
+        """
         super().__init__(
             inputs = [
                 ComponentIOSpec(
@@ -48,6 +82,173 @@ class LineFindingComponent(CustomComponent):
                 name='LineFindingComponent'
             )
         )
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f'Unknown backend `{backend}`. (Available backends: {self.BACKENDS})'
+            )
+        if backend not in self.available_backends():
+            raise ValueError(
+                f'Backend `{backend}` requires `cv2.ximgproc` (opencv-contrib-python). '
+                f'(Available backends: {self.available_backends()})'
+            )
+        if scale < 1:
+            raise ValueError(
+                f'`scale` should be a positive integer. Current value: `{scale}`'
+            )
+        self.tracker = tracker
+        self.backend = backend
+        self.scale = scale
+        self.n_windows = n_windows
+        self.window_margin = window_margin
+        self.min_pixels = min_pixels
+        self.max_lanes = max_lanes
+        self._detector = None
+        if backend == 'lsd':
+            self._detector = cv2.createLineSegmentDetector()
+        self._detect = getattr(self, f'_{backend.replace("-", "_")}')
+
+    @classmethod
+    def available_backends(
+        cls
+    ) -> tuple[str, ...]:
+        """! The backends supported by the installed OpenCV.
+        """
+        return tuple(
+            backend for backend in cls.BACKENDS
+            if backend != 'fld' or hasattr(cv2, 'ximgproc')
+        )
+
+    def _hough(
+        self,
+        image: np.ndarray,
+        threshold: int,
+        min_line_length: int,
+        max_line_gap: int,
+    ) -> np.ndarray | None:
+        return cv2.HoughLinesP(
+            image,
+            rho=1,
+            theta=pi/180,
+            threshold=threshold,
+            minLineLength=min_line_length,
+            maxLineGap=max_line_gap
+        )
+
+    def _downscaled_hough(
+        self,
+        image: np.ndarray,
+        threshold: int,
+        min_line_length: int,
+        max_line_gap: int,
+    ) -> np.ndarray | None:
+        s = self.scale
+        h, w = image.shape[:2]
+        if h < s or w < s:
+            return None
+        # NOTE: A block with any edge is an edge (max pooling), so the thin edges
+        # are kept. Area resizing and thresholding is much faster than NumPy pooling.
+        small = cv2.resize(image, (w // s, h // s), interpolation=cv2.INTER_AREA)
+        cv2.threshold(small, 0, 255, cv2.THRESH_BINARY, dst=small)
+        lines = cv2.HoughLinesP(
+            small,
+            rho=1,
+            theta=pi/180,
+            threshold=max(threshold // s, 1),
+            minLineLength=min_line_length / s,
+            maxLineGap=max_line_gap / s
+        )
+        if lines is None:
+            return None
+        # NOTE: A pixel of the small image is the block of `s` pixels around its center.
+        return lines * s + (s - 1) // 2
+
+    def _lsd(
+        self,
+        image: np.ndarray,
+        threshold: int,
+        min_line_length: int,
+        max_line_gap: int,
+    ) -> np.ndarray | None:
+        return self._segments(self._detector.detect(image)[0], min_line_length)
+
+    def _fld(
+        self,
+        image: np.ndarray,
+        threshold: int,
+        min_line_length: int,
+        max_line_gap: int,
+    ) -> np.ndarray | None:
+        if self._detector is None:
+            self._detector = cv2.ximgproc.createFastLineDetector(
+                length_threshold=min_line_length
+            )
+        return self._segments(self._detector.detect(image), min_line_length)
+
+    @staticmethod
+    def _segments(
+        segments: np.ndarray | None,
+        min_line_length: int,
+    ) -> np.ndarray | None:
+        """! Rounds the float segments of LSD/FLD and drops the short ones.
+        """
+        if segments is None:
+            return None
+        segments = np.reshape(segments, (-1, 4))
+        lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+        return np.rint(segments[lengths >= min_line_length]).astype(np.int32)
+
+    def _sliding_window(
+        self,
+        image: np.ndarray,
+        threshold: int,
+        min_line_length: int,
+        max_line_gap: int,
+    ) -> np.ndarray | None:
+        h, w = image.shape[:2]
+        margin = self.window_margin
+        # NOTE: The column sums of the edges (255 each) of the bottom half, where
+        # the windows start, summed over a window, so that the edges of both sides
+        # of a lane fall in one peak.
+        histogram = cv2.reduce(image[h // 2:], 0, cv2.REDUCE_SUM, dtype=cv2.CV_32F)
+        histogram = cv2.boxFilter(histogram, -1, (2 * margin + 1, 1), normalize=False).ravel() / 255
+        window_edges = np.linspace(h, 0, self.n_windows + 1).round().astype(int).tolist()
+        lines = []
+        for _ in range(self.max_lanes):
+            base = int(np.argmax(histogram))
+            if histogram[base] < self.min_pixels:
+                break
+            histogram[max(base - 2 * margin, 0):base + 2 * margin + 1] = 0
+            # NOTE: The moments of the edges of each window are summed up in the
+            # coordinates of the image, which is all the least squares need.
+            x = base
+            n = sx = sy = sxy = syy = 0.0
+            y1 = y2 = None
+            for bottom, top in zip(window_edges[:-1], window_edges[1:]):
+                start = max(x - margin, 0)
+                m = cv2.moments(image[top:bottom, start:x + margin + 1], binaryImage=True)
+                m00 = m['m00']
+                if m00 < self.min_pixels // self.n_windows:
+                    continue
+                n += m00
+                sx += m['m10'] + start * m00
+                sy += m['m01'] + top * m00
+                sxy += m['m11'] + start * m['m01'] + top * m['m10'] + start * top * m00
+                syy += m['m02'] + 2 * top * m['m01'] + top * top * m00
+                x = start + int(m['m10'] / m00)
+                y1 = top
+                y2 = bottom - 1 if y2 is None else y2
+            if n < self.min_pixels or y2 - y1 < min_line_length:
+                continue
+            denominator = n * syy - sy * sy
+            if denominator <= 0:
+                continue
+            # NOTE: `x = a * y + b`, as the lanes are closer to vertical than horizontal.
+            a = (n * sxy - sx * sy) / denominator
+            b = (sx - a * sy) / n
+            lines.append((round(a * y1 + b), y1, round(a * y2 + b), y2))
+        if not lines:
+            return None
+        return np.asarray(lines, dtype=np.int32)
 
     def run(
         self,
@@ -56,16 +257,32 @@ class LineFindingComponent(CustomComponent):
         minLineLength: int = 10,
         maxLineGap: int = 100,
     ) -> dict:
-        lines = cv2.HoughLinesP(
-            image,
-            rho=1,
-            theta=pi/180,
-            threshold=threshold,
-            minLineLength=minLineLength,
-            maxLineGap=maxLineGap
-        )
+        """!
+        @param threshold The accumulator threshold of the Hough backends.
+        @param minLineLength The minimum length of a line.
+        @param maxLineGap The maximum gap between the points of a line of the Hough backends.
+        """
+        windows = None if self.tracker is None else self.tracker.line_windows
+        if windows is None:
+            lines = self._detect(image, threshold, minLineLength, maxLineGap)
+        else:
+            # NOTE: A narrow band also shrinks the accumulator of the transform.
+            found = []
+            for start, end in windows.tolist():
+                if start >= image.shape[1]:
+                    break
+                # NOTE: A contiguous copy of the band is faster to transform than a view.
+                window_image = np.ascontiguousarray(image[:, start:end])
+                window_lines = self._detect(window_image, threshold, minLineLength, maxLineGap)
+                if window_lines is not None:
+                    window_lines[..., 0::2] += start
+                    found.append(window_lines)
+            lines = np.concatenate(found) if found else None
         if lines is None:
             lines = []
+        else:
+            # NOTE: `cv2.HoughLinesP` returns `(N, 1, 4)` lines in OpenCV 4.
+            lines = np.reshape(lines, (-1, 4))
         self.log(f'found {len(lines)} lines', level='debug')
         self.visualize(image, lines)
         return {'lines': lines}
@@ -0,0 +1,90 @@
+# Built-in
+import unittest
+
+# Third party
+import numpy as np
+
+# Project-Types
+from cvpype.python.applications.types.cvcoord import PackedPairs
+
+# Project-Components
+from cvpype.python.applications.components.intersectionfiltering import (
+    WidthBasedIntersectionFilteringComponent,
+    ColorBasedIntersectionFilteringComponent
+)
+
+
+def filter_black_pairs_naive(
+    v_row: np.ndarray,
+    pairs: list,
+    black_threshold: int,
+) -> list:
+    valid_black_pairs = []
+    for start, end in pairs:
+        line_section = v_row[start:end]
+        black_pixels = len(np.where(line_section < black_threshold)[0])
+        if black_pixels / (len(line_section) + 0.1) >= 0.5:
+            valid_black_pairs.append((start, end))
+    return valid_black_pairs
+
+
+class TestWidthBasedIntersectionFilteringComponent(unittest.TestCase):
+    def test_run(self):
+        component = WidthBasedIntersectionFilteringComponent(width_min=3, width_max=5)
+        component.visualizer.is_operating = False
+        pairs = np.array([[0, 2], [0, 3], [4, 9], [10, 16]])
+        filtered = component.run(pairs)['intersections']
+        self.assertEqual([[0, 3], [4, 9]], filtered.tolist())
+        self.assertEqual((0, 2), component.run([])['intersections'].shape)
+
+
+class TestColorBasedIntersectionFilteringComponent(unittest.TestCase):
+    def setUp(self):
+        # NOTE: A bright road with two dark lines.
+        self.image = np.full((3, 100, 3), 200, dtype=np.uint8)
+        self.image[1, 10:20] = 20
+        self.image[1, 50:58] = (30, 10, 25)
+
+    def test_matches_naive_filter(self):
+        rng = np.random.default_rng(0)
+        image = rng.integers(0, 256, size=(3, 200, 3), dtype=np.uint8)
+        v_row = image[1].max(axis=-1)
+        starts = rng.integers(0, 190, size=300)
+        pairs = np.column_stack((starts, starts + rng.integers(1, 10, size=300)))
+        component = ColorBasedIntersectionFilteringComponent(y=1, black_threshold=120)
+        filtered = component.run(image, pairs)['filtered_pairs']
+        self.assertEqual(
+            filter_black_pairs_naive(v_row, pairs.tolist(), 120),
+            [tuple(p) for p in filtered.tolist()]
+        )
+
+    def test_adaptive_threshold(self):
+        component = ColorBasedIntersectionFilteringComponent(y=1)
+        pairs = np.array([[10, 20], [50, 58], [30, 40], [15, 35]])
+        filtered = component.run(self.image, pairs)['filtered_pairs']
+        self.assertEqual([[10, 20], [50, 58]], filtered.tolist())
+        self.assertTrue(30 <= component.last_black_threshold < 200)
+
+    def test_packed_pairs(self):
+        image = np.full((3, 100, 3), 200, dtype=np.uint8)
+        image[0, 30:40] = 20
+        image[2, 10:20] = 20
+        packed = PackedPairs.from_row_index(
+            rows=np.array([0, 2]),
+            row_index=np.array([0, 0, 1, 1]),
+            pairs=np.array([[10, 20], [30, 40], [10, 20], [30, 40]]),
+        )
+        component = ColorBasedIntersectionFilteringComponent(y=1)
+        filtered = component.run(image, packed)['filtered_pairs']
+        self.assertIsInstance(filtered, PackedPairs)
+        self.assertEqual([[30, 40], [10, 20]], filtered.pairs.tolist())
+        self.assertEqual([0, 2], filtered.ys.tolist())
+
+    def test_empty_pairs(self):
+        component = ColorBasedIntersectionFilteringComponent(y=1)
+        filtered = component.run(self.image, [])['filtered_pairs']
+        self.assertEqual((0, 2), filtered.shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
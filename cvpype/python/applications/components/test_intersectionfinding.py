@@ -0,0 +1,103 @@
+# Built-in
+import unittest
+
+# Third party
+import numpy as np
+
+# Project-Components
+from cvpype.python.applications.components.intersectionfinding import (
+    IntersectionFindingComponent,
+    find_edge_pairs,
+    find_edge_pairs_in_rows
+)
+
+
+def find_edge_pairs_naive(
+    edge_idx: list,
+    width_min: int,
+    width_max: int,
+) -> list:
+    return [
+        (s, e)
+        for i, s in enumerate(edge_idx)
+        for e in edge_idx[i + 1:]
+        if width_min <= e - s <= width_max
+    ]
+
+
+class TestFindEdgePairs(unittest.TestCase):
+    def test_docstring_example(self):
+        # NOTE: The example of `get_intersection_pipeline`.
+        edge_row = np.array([0, 0, 255, 0, 255, 0, 0, 255, 0, 0])
+        edge_idx = np.flatnonzero(edge_row >= 255)
+        self.assertEqual(
+            [[2, 4], [2, 7], [4, 7]],
+            find_edge_pairs(edge_idx, 0, 10).tolist()
+        )
+        self.assertEqual(
+            [[2, 4], [4, 7]],
+            find_edge_pairs(edge_idx).tolist()
+        )
+        self.assertEqual(
+            [[4, 7]],
+            find_edge_pairs(edge_idx, 3, 4).tolist()
+        )
+
+    def test_matches_naive_search(self):
+        rng = np.random.default_rng(0)
+        for n_edges in (0, 1, 2, 10, 300):
+            edge_idx = np.sort(rng.choice(640, size=n_edges, replace=False))
+            for width_min, width_max in ((3, 30), (10, 50), (0, 640), (20, 10)):
+                pairs = find_edge_pairs(edge_idx, width_min, width_max)
+                self.assertEqual((len(pairs), 2), pairs.shape)
+                self.assertEqual(
+                    find_edge_pairs_naive(edge_idx.tolist(), max(width_min, 1), width_max),
+                    [tuple(p) for p in pairs.tolist()]
+                )
+
+
+class TestFindEdgePairsInRows(unittest.TestCase):
+    def test_matches_single_rows(self):
+        rng = np.random.default_rng(0)
+        edge_rows = rng.random((8, 200)) < 0.1
+        rows = np.arange(20, 28)
+        for width_window in ((None, None), (3, 30), (0, 400), (3, None), (None, 10)):
+            packed = find_edge_pairs_in_rows(edge_rows, rows, *width_window)
+            self.assertEqual(len(rows) + 1, len(packed.offsets))
+            for i in range(len(rows)):
+                expected = find_edge_pairs(np.flatnonzero(edge_rows[i]), *width_window)
+                self.assertEqual(expected.tolist(), packed.row(i).tolist())
+                self.assertTrue(np.all(packed.ys[packed.offsets[i]:packed.offsets[i + 1]] == rows[i]))
+
+    def test_unbounded_width_max(self):
+        edge_rows = np.zeros((2, 20), dtype=bool)
+        edge_rows[0, [2, 8]] = True
+        edge_rows[1, [3, 15]] = True
+        packed = find_edge_pairs_in_rows(edge_rows, np.array([5, 6]), 1, None)
+        self.assertEqual([0, 1, 2], packed.offsets.tolist())
+        self.assertEqual([[2, 8], [3, 15]], packed.pairs.tolist())
+
+
+class TestIntersectionFindingComponent(unittest.TestCase):
+    def test_run(self):
+        edge_image = np.zeros((3, 20), dtype=np.uint8)
+        edge_image[1, [2, 4, 7, 15]] = 255
+        component = IntersectionFindingComponent(y=1, width_min=3, width_max=8)
+        pairs = component.run(edge_image)['intersections']
+        self.assertEqual([[2, 7], [4, 7], [7, 15]], pairs.tolist())
+        empty = component.run(np.zeros((3, 20), dtype=np.uint8))['intersections']
+        self.assertEqual((0, 2), empty.shape)
+
+    def test_run_multirow(self):
+        edge_image = np.zeros((4, 20), dtype=np.uint8)
+        edge_image[1, [2, 7]] = 255
+        edge_image[3, [4, 9, 19]] = 255
+        component = IntersectionFindingComponent(y=[1, 2, 3], width_min=3, width_max=8)
+        packed = component.run(edge_image)['intersections']
+        self.assertEqual([0, 1, 1, 2], packed.offsets.tolist())
+        self.assertEqual([[2, 7], [4, 9]], packed.pairs.tolist())
+        self.assertEqual([1, 3], packed.ys.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+# Built-in
+import unittest
+
+# Third party
+import numpy as np
+
+# Project-Components
+from cvpype.python.applications.components.lanetracking import (
+    LaneTracker,
+    LaneTrackingComponent,
+    merge_windows,
+    window_mask,
+    is_in_one_window
+)
+from cvpype.python.applications.components.linefinding import LineFindingComponent
+from cvpype.python.applications.components.intersectionfinding import IntersectionFindingComponent
+
+
+def lane_pairs(
+    *centers: float,
+    width: int = 20,
+) -> np.ndarray:
+    """! Returns the pairs found around each lane (a few per lane, as edges are thick).
+    """
+    return np.array([
+        (round(c - width / 2) + ds, round(c + width / 2) + de)
+        for c in centers
+        for ds in (0, 1)
+        for de in (0, 1)
+    ])
+
+
+class TestWindows(unittest.TestCase):
+    def test_merge_windows(self):
+        self.assertEqual(
+            [[0, 12], [20, 31], [40, 50]],
+            merge_windows([(40, 50), (-5.5, 10), (5, 11.2), (20, 31)]).tolist()
+        )
+        self.assertEqual((0, 2), merge_windows([]).shape)
+
+    def test_window_mask(self):
+        windows = merge_windows([(2, 4), (6, 7)])
+        self.assertEqual(
+            [False, False, True, True, False, False, True, False],
+            window_mask(windows, 8).tolist()
+        )
+
+    def test_is_in_one_window(self):
+        windows = merge_windows([(0, 10), (20, 30)])
+        pairs = np.array([[1, 5], [5, 25], [21, 29]])
+        self.assertEqual([True, False, True], is_in_one_window(pairs, windows).tolist())
+
+
+class TestLaneTracker(unittest.TestCase):
+    def test_follows_moving_lanes(self):
+        tracker = LaneTracker(roi_y=40, height=50, redetect_every=None)
+        self.assertFalse(tracker.is_tracking)
+        for t in range(20):
+            tracker.update(lane_pairs(100 + 3 * t, 500 - 2 * t))
+            self.assertTrue(tracker.is_tracking)
+        self.assertEqual(1, tracker.n_full_searches)
+        self.assertEqual(2, len(tracker.lanes))
+        self.assertAlmostEqual(3, tracker.lanes[0].v, delta=0.5)
+        self.assertAlmostEqual(-2, tracker.lanes[1].v, delta=0.5)
+        # NOTE: The windows are centered on the next positions.
+        for (start, end), x in zip(tracker.row_windows, (160, 460)):
+            self.assertLess(start, x)
+            self.assertGreater(end, x)
+        self.assertLess(window_mask(tracker.row_windows, 640).mean(), 0.25)
+
+    def test_falls_back_on_track_loss(self):
+        tracker = LaneTracker(roi_y=40, height=50, max_misses=2, redetect_every=None)
+        for _ in range(5):
+            tracker.update(lane_pairs(100, 500))
+        for _ in range(3):
+            self.assertTrue(tracker.is_tracking)
+            tracker.update(lane_pairs(100))
+        self.assertFalse(tracker.is_tracking)
+        self.assertEqual(1, tracker.n_lost)
+        tracker.update(lane_pairs(100))
+        self.assertEqual(2, tracker.n_full_searches)
+        self.assertAlmostEqual(2 / 9, tracker.fallback_rate)
+
+    def test_noise_does_not_trigger_full_search(self):
+        tracker = LaneTracker(roi_y=40, height=50, redetect_every=None)
+        tracker.update(lane_pairs(100, 300, 500))
+        tracker.update(lane_pairs(100, 500))
+        tracker.update(lane_pairs(100, 500))
+        tracker.update(lane_pairs(100, 500))
+        self.assertEqual(2, len(tracker.lanes))
+        self.assertEqual(0, tracker.n_lost)
+        self.assertTrue(tracker.is_tracking)
+
+    def test_returning_lane(self):
+        tracker = LaneTracker(roi_y=40, height=50, redetect_every=None, n_lanes=2)
+        for _ in range(3):
+            tracker.update(lane_pairs(100))
+        # NOTE: Only the row is searched entirely while a lane is missing.
+        self.assertTrue(tracker.is_tracking)
+        self.assertIsNone(tracker.row_windows)
+        for _ in range(3):
+            tracker.update(lane_pairs(100, 400))
+        self.assertEqual([100, 400], [round(lane.x) for lane in tracker.lanes])
+        self.assertIsNotNone(tracker.row_windows)
+
+    def test_periodic_full_search(self):
+        tracker = LaneTracker(roi_y=40, height=50, redetect_every=5)
+        for _ in range(20):
+            tracker.update(lane_pairs(100, 500))
+        self.assertEqual(4, tracker.n_full_searches)
+
+    def test_line_windows_follow_slope(self):
+        tracker = LaneTracker(roi_y=40, height=50, redetect_every=None)
+        # NOTE: The lane crosses `roi_y` at x=100 and moves 2px right per row.
+        lines = np.array([[20, 0, 118, 49]])
+        for _ in range(5):
+            tracker.update(lane_pairs(100), lines)
+        self.assertAlmostEqual(2, tracker.lanes[0].slope, delta=0.01)
+        (start, end), = tracker.line_windows.tolist()
+        self.assertLess(start, 20)
+        self.assertGreater(end, 118)
+        self.assertLess(end - start, 160)
+
+
+class TestWindowedSearch(unittest.TestCase):
+    def setUp(self):
+        self.tracker = LaneTracker(roi_y=40, height=50, redetect_every=None)
+        for _ in range(3):
+            self.tracker.update(lane_pairs(100, 500))
+        self.edge_image = np.zeros((50, 640), dtype=np.uint8)
+        for x in (90, 110, 300, 320, 490, 510):
+            self.edge_image[:, x] = 255
+
+    def test_intersection_finding(self):
+        full = IntersectionFindingComponent(y=40, width_min=10, width_max=50)
+        tracked = IntersectionFindingComponent(y=40, width_min=10, width_max=50, tracker=self.tracker)
+        self.assertEqual(
+            [[90, 110], [300, 320], [490, 510]],
+            full.run(self.edge_image)['intersections'].tolist()
+        )
+        self.assertEqual(
+            [[90, 110], [490, 510]],
+            tracked.run(self.edge_image)['intersections'].tolist()
+        )
+        # NOTE: Adjacent edges of two windows are not paired.
+        adjacent = IntersectionFindingComponent(y=40, tracker=self.tracker)
+        self.assertEqual(
+            [[90, 110], [490, 510]],
+            adjacent.run(self.edge_image)['intersections'].tolist()
+        )
+        multirow = IntersectionFindingComponent(y=[39, 40], width_min=10, width_max=50, tracker=self.tracker)
+        self.assertEqual(
+            [[90, 110], [490, 510]],
+            multirow.run(self.edge_image)['intersections'].row(1).tolist()
+        )
+
+    def test_line_finding(self):
+        component = LineFindingComponent(tracker=self.tracker)
+        component.visualizer.is_operating = False
+        lines = np.reshape(component.run(self.edge_image)['lines'], (-1, 4))
+        self.assertTrue(len(lines))
+        # NOTE: The lines are in the coordinates of the whole image.
+        self.assertEqual({90, 110, 490, 510}, set(lines[:, 0].tolist()) | set(lines[:, 2].tolist()))
+
+    def test_component(self):
+        tracker = LaneTracker(roi_y=40, height=50)
+        component = LaneTrackingComponent(tracker)
+        for _ in range(2):
+            lanes = component.run(lane_pairs(100, 500), [])['lanes']
+        self.assertEqual([[90, 110], [490, 510]], lanes.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
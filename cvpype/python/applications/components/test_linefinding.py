@@ -0,0 +1,107 @@
+# Built-in
+import unittest
+
+# Third party
+import cv2
+import numpy as np
+
+# Project-Components
+from cvpype.python.applications.components.lanetracking import LaneTracker
+from cvpype.python.applications.components.linefinding import LineFindingComponent
+
+
+# NOTE: Two lanes (`x` at the top and the bottom of the image), 20px wide.
+LANES = ((100, 140), (500, 470))
+
+
+def create_component(
+    **kwargs
+) -> LineFindingComponent:
+    component = LineFindingComponent(**kwargs)
+    component.visualizer.is_operating = False
+    return component
+
+
+def lanes_edge_image(
+    width: int = 20,
+) -> np.ndarray:
+    """! The edges of both sides of each lane in a 50x640 edge image.
+    """
+    image = np.zeros((50, 640), dtype=np.uint8)
+    for x_top, x_bottom in LANES:
+        for dx in (0, width):
+            cv2.line(image, (x_top + dx, 0), (x_bottom + dx, 49), 255, 1)
+    return image
+
+
+def x_at(
+    line: list[int],
+    y: float,
+) -> float:
+    x1, y1, x2, y2 = line
+    return x1 + (x2 - x1) * (y - y1) / (y2 - y1)
+
+
+class TestLineFindingComponent(unittest.TestCase):
+    def assert_lanes_found(
+        self,
+        lines,
+        tolerance: float,
+    ):
+        lines = np.reshape(lines, (-1, 4)).tolist()
+        lines = [line for line in lines if line[1] != line[3]]
+        for x_top, x_bottom in LANES:
+            # NOTE: A line of a side or of the center of the lane.
+            self.assertTrue(any(
+                abs(x_at(line, 0) - x_top - 10) <= 10 + tolerance and
+                abs(x_at(line, 49) - x_bottom - 10) <= 10 + tolerance
+                for line in lines
+            ), f'No line along the lane {(x_top, x_bottom)} in {lines}')
+
+    def test_backends(self):
+        image = lanes_edge_image()
+        for backend in LineFindingComponent.available_backends():
+            with self.subTest(backend=backend):
+                # NOTE: The votes of a thin synthetic line are spread over a few angles.
+                lines = create_component(backend=backend).run(image, threshold=20)['lines']
+                self.assertEqual(2, lines.ndim)
+                self.assertEqual(4, lines.shape[1])
+                self.assert_lanes_found(lines, tolerance=3)
+
+    def test_sliding_window_finds_the_centers(self):
+        lines = create_component(backend='sliding-window').run(lanes_edge_image())['lines']
+        self.assertEqual(len(LANES), len(lines))
+        for line, (x_top, x_bottom) in zip(sorted(lines.tolist()), LANES):
+            self.assertAlmostEqual(x_top + 10, x_at(line, 0), delta=2)
+            self.assertAlmostEqual(x_bottom + 10, x_at(line, 49), delta=2)
+
+    def test_empty_image(self):
+        image = np.zeros((50, 640), dtype=np.uint8)
+        for backend in LineFindingComponent.available_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(0, len(create_component(backend=backend).run(image)['lines']))
+
+    def test_tracker_windows(self):
+        tracker = LaneTracker(roi_y=40, height=50, redetect_every=None)
+        tracker.update(np.array([[x, x + 20] for x in (135, 475)]), [])
+        tracker.update(np.array([[x, x + 20] for x in (135, 475)]), [])
+        self.assertTrue(tracker.is_tracking)
+        for backend in ('downscaled-hough', 'sliding-window'):
+            with self.subTest(backend=backend):
+                component = create_component(backend=backend, tracker=tracker)
+                lines = component.run(lanes_edge_image(), threshold=20)['lines']
+                # NOTE: The lines are in the coordinates of the whole image.
+                self.assert_lanes_found(lines, tolerance=3)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            LineFindingComponent(backend='unknown')
+        with self.assertRaises(ValueError):
+            LineFindingComponent(backend='downscaled-hough', scale=0)
+        if 'fld' not in LineFindingComponent.available_backends():
+            with self.assertRaises(ValueError):
+                LineFindingComponent(backend='fld')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,12 @@
+# Built-in
+from typing import Sequence
+
+# Project-Types
+from cvpype.python.applications.types.cvcoord import CVPackedCoordinatesType
+
 # Project-Components
 from cvpype.python.basic.components.inputs import InputsComponent
+from cvpype.python.applications.components.lanetracking import LaneTracker
 from cvpype.python.applications.components.intersectionfinding import IntersectionFindingComponent
 from cvpype.python.applications.components.intersectionfiltering import (
     WidthBasedIntersectionFilteringComponent,
@@ -16,15 +23,33 @@ class IntersectionPipeline(CustomPipeline):
         roi_y: int,
         width_min: int,
         width_max: int,
+        scan_rows: Sequence[int] | None = None,
+        tracker: LaneTracker | None = None,
     ) -> None:
+        """! Finds black lines of `width_min` to `width_max` pixels
+        in the row `roi_y`.
+
+        @param scan_rows If given, these rows (e.g. a band around `roi_y`)
+        are scanned instead of `roi_y` alone, with one 2D operation.
+        The result is then `PackedPairs`: the pairs of all rows with
+        the offsets of each row.
+        @param tracker If given, only the windows around the lanes predicted
+        by `tracker` are searched (see `LaneTracker`).
+        """
         super().__init__()
         self.roi_y = roi_y
         self.width_min = width_min
         self.width_max = width_max
+        self.scan_rows = None if scan_rows is None else list(scan_rows)
 
         self.inputs = InputsComponent()
+        # NOTE: The width window is applied while pairing the edges,
+        # so every pair of edges in the window is found (not only adjacent ones).
         self.intersection_finding = IntersectionFindingComponent(
-            y=self.roi_y
+            y=self.roi_y if self.scan_rows is None else self.scan_rows,
+            width_min=self.width_min,
+            width_max=self.width_max,
+            tracker=tracker
         )
         self.width_based_filtering = WidthBasedIntersectionFilteringComponent(
             width_min=self.width_min,
@@ -33,6 +58,9 @@ class IntersectionPipeline(CustomPipeline):
         self.color_based_filtering = ColorBasedIntersectionFilteringComponent(
             y=self.roi_y
         )
+        if self.scan_rows is not None:
+            self.width_based_filtering.change_output_type('intersections', CVPackedCoordinatesType)
+            self.color_based_filtering.change_output_type('filtered_pairs', CVPackedCoordinatesType)
 
     def run(
         self,
@@ -42,5 +70,5 @@ class IntersectionPipeline(CustomPipeline):
         color_image, edge_image = self.inputs(color_image, edge_image)
         intersections = self.intersection_finding(edge_image)
         intersections = self.width_based_filtering(intersections)
-        # intersections = color_based_filtering(color_image, intersections)
+        intersections = self.color_based_filtering(color_image, intersections)
         return intersections
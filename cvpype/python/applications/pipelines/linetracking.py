@@ -1,3 +1,6 @@
+# Built-in
+from typing import Sequence
+
 # Project-Types
 from cvpype.python.basic.types.cvimage import RGBImageType
 
@@ -8,6 +11,7 @@ from cvpype.python.basic.components.grayscailing import GrayscailingComponent
 from cvpype.python.basic.components.blurring import BilateralBlurringComponent
 from cvpype.python.basic.components.edgedetecting import EdgeDetectingComponent
 from cvpype.python.applications.components.linefinding import LineFindingComponent
+from cvpype.python.applications.components.lanetracking import LaneTracker, LaneTrackingComponent
 from cvpype.python.applications.components.sdvlinevisualization import SDVLineVisualizationComponent
 
 # Project-Pipelines
@@ -15,19 +19,37 @@ from cvpype.python.basic.pipelines.custom import CustomPipeline
 from cvpype.python.applications.pipelines.intersection import IntersectionPipeline
 
 
-class LineTrackingPipeline(CustomPipeline):
+class RoiIntersectionPipeline(CustomPipeline):
     def __init__(
         self,
         crop_y: int,
         crop_y_end: int,
         roi_y: int,
-        image_h: int
+        image_h: int,
+        roi_rows: Sequence[int] | None = None,
+        blur_preset: str | None = None,
+        edge_mode: str = 'fixed',
+        tracker: LaneTracker | None = None,
     ) -> None:
+        """! The intersection branch of `LineTrackingPipeline` alone:
+        it finds the intersections of black lines with the row `roi_y`
+        in the band `[crop_y, crop_y_end)` of the image,
+        without the lines and the visualization.
+
+        As only the rows around `roi_y` (or `roi_rows`) are read,
+        `set_row_demand()` lets the image components compute only that band
+        instead of the whole crop.
+
+        See `LineTrackingPipeline` for the parameters.
+        @param tracker If given, the intersections are searched only around
+        the lanes predicted by `tracker` (see `IntersectionPipeline`).
+        """
         super().__init__()
         self.crop_y = crop_y
         self.crop_y_end = crop_y_end
         self.roi_y = roi_y
         self.image_h = image_h
+        self.roi_rows = None if roi_rows is None else list(roi_rows)
 
         self.inputs = InputsComponent()
         self.grayscailing = GrayscailingComponent()
@@ -36,17 +58,17 @@ class LineTrackingPipeline(CustomPipeline):
             y_end=crop_y_end,
         )
         self.cropping.change_output_type('image', RGBImageType)
-        self.blurring = BilateralBlurringComponent()
-        self.edge_detecting = EdgeDetectingComponent()
-        self.line_finding = LineFindingComponent()
+        self.blurring = BilateralBlurringComponent(preset=blur_preset)
+        self.edge_detecting = EdgeDetectingComponent(mode=edge_mode)
         self.intersection_pipeline = IntersectionPipeline(
             roi_y=(self.roi_y-self.crop_y),
             width_min=10,
             width_max=50,
-        )
-        self.line_visualizing = SDVLineVisualizationComponent(
-            y_origin=crop_y,
-            roi_y=roi_y,
+            scan_rows=(
+                None if self.roi_rows is None else
+                [y - self.crop_y for y in self.roi_rows]
+            ),
+            tracker=tracker,
         )
 
     def is_valid(
@@ -58,6 +80,77 @@ class LineTrackingPipeline(CustomPipeline):
             self.crop_y_end <=
             self.image_h
         )
+        if self.roi_rows is not None:
+            assert all(self.crop_y <= y < self.crop_y_end for y in self.roi_rows)
+
+    def run(
+        self,
+        color_image
+    ):
+        color_image = self.inputs(color_image)
+        cropped_color_image = self.cropping(color_image)
+        cropped_gray_image = self.grayscailing(cropped_color_image)
+        cropped_blurred_gray_image = self.blurring(cropped_gray_image)
+        cropped_edge_image = self.edge_detecting(cropped_blurred_gray_image)
+        return self.intersection_pipeline.run(
+            cropped_color_image,
+            cropped_edge_image
+        )
+
+
+class LineTrackingPipeline(RoiIntersectionPipeline):
+    def __init__(
+        self,
+        crop_y: int,
+        crop_y_end: int,
+        roi_y: int,
+        image_h: int,
+        roi_rows: Sequence[int] | None = None,
+        lane_tracking: bool = False,
+        blur_preset: str | None = None,
+        edge_mode: str = 'fixed',
+        line_backend: str = 'hough',
+    ) -> None:
+        """! Finds lines and the intersections of black lines with the row `roi_y`
+        in the band `[crop_y, crop_y_end)` of the image.
+
+        @param roi_rows If given, intersections are searched in these rows
+        (e.g. `range(roi_y - 5, roi_y + 6)`) instead of `roi_y` alone.
+        @param lane_tracking If `True`, the lanes are tracked from frame to frame
+        (`self.lane_tracker`), and the lines and the intersections are searched
+        only around the predicted lanes, with a full search when a lane is lost.
+        @param blur_preset The preset of the blurring (`quality`, `balanced` or `fast`,
+        see `BilateralBlurringComponent.PRESETS`). By default, the bilateral filter is used.
+        @param edge_mode `fixed` or `adaptive` thresholds of the edge detection
+        (see `EdgeDetectingComponent`).
+        @param line_backend The line detector (see `LineFindingComponent.BACKENDS`).
+        """
+        lane_tracker = LaneTracker(
+            roi_y=(roi_y-crop_y),
+            height=(crop_y_end-crop_y),
+        ) if lane_tracking else None
+        super().__init__(
+            crop_y=crop_y,
+            crop_y_end=crop_y_end,
+            roi_y=roi_y,
+            image_h=image_h,
+            roi_rows=roi_rows,
+            blur_preset=blur_preset,
+            edge_mode=edge_mode,
+            tracker=lane_tracker,
+        )
+        self.lane_tracker = lane_tracker
+        self.line_finding = LineFindingComponent(
+            tracker=self.lane_tracker,
+            backend=line_backend,
+        )
+        self.lane_tracking = LaneTrackingComponent(
+            tracker=self.lane_tracker
+        ) if lane_tracking else None
+        self.line_visualizing = SDVLineVisualizationComponent(
+            y_origin=crop_y,
+            roi_y=roi_y,
+        )
 
     def run(
         self,
@@ -73,6 +166,8 @@ class LineTrackingPipeline(CustomPipeline):
             cropped_color_image,
             cropped_edge_image
         )
+        if self.lane_tracking is not None:
+            self.lane_tracking(intersections, lines)
         self.line_visualizing(
             color_image,
             lines,
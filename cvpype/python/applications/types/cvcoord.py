@@ -1,6 +1,98 @@
+# Third party
+import numpy as np
+
 # Project-Types
 from cvpype.python.basic.types.coord import CoordinatesType
 
 
 class CVCoordinatesType(CoordinatesType):
     pass
+
+
+class PackedPairs():
+    """! Pairs of x coordinates found in several rows, packed into one array.
+
+    The pairs of the `i`-th row (`rows[i]`) are
+    `pairs[offsets[i]:offsets[i + 1]]`. Iterating over it yields the pairs
+    of every row, so it can be used where a list of pairs is expected.
+    """
+    __slots__ = ('rows', 'offsets', 'pairs')
+
+    def __init__(
+        self,
+        rows: np.ndarray,
+        offsets: np.ndarray,
+        pairs: np.ndarray,
+    ) -> None:
+        self.rows = np.asarray(rows)
+        self.offsets = np.asarray(offsets)
+        self.pairs = np.asarray(pairs)
+
+    @classmethod
+    def from_row_index(
+        cls,
+        rows: np.ndarray,
+        row_index: np.ndarray,
+        pairs: np.ndarray,
+    ) -> 'PackedPairs':
+        """! Packs pairs sorted by `row_index` (the index in `rows` of each pair).
+        """
+        offsets = np.zeros((len(rows) + 1,), dtype=np.intp)
+        np.cumsum(np.bincount(row_index, minlength=len(rows)), out=offsets[1:])
+        return cls(rows, offsets, pairs)
+
+    @property
+    def row_index(
+        self
+    ) -> np.ndarray:
+        """! The index in `rows` of each pair.
+        """
+        return np.repeat(np.arange(len(self.rows)), np.diff(self.offsets))
+
+    @property
+    def ys(
+        self
+    ) -> np.ndarray:
+        """! The row (y coordinate) of each pair.
+        """
+        return self.rows[self.row_index]
+
+    def row(
+        self,
+        i: int
+    ) -> np.ndarray:
+        return self.pairs[self.offsets[i]:self.offsets[i + 1]]
+
+    def select(
+        self,
+        mask: np.ndarray
+    ) -> 'PackedPairs':
+        """! Keeps the pairs where `mask` is `True`.
+        """
+        return PackedPairs.from_row_index(self.rows, self.row_index[mask], self.pairs[mask])
+
+    def __len__(
+        self
+    ) -> int:
+        return len(self.pairs)
+
+    def __iter__(
+        self
+    ):
+        return iter(self.pairs)
+
+    def __array__(
+        self,
+        dtype=None,
+        copy=None,
+    ) -> np.ndarray:
+        return self.pairs if dtype is None else self.pairs.astype(dtype)
+
+    def __repr__(
+        self
+    ) -> str:
+        return f'PackedPairs({len(self.rows)} rows, {len(self.pairs)} pairs)'
+
+
+class CVPackedCoordinatesType(CVCoordinatesType):
+    data_type = PackedPairs
@@ -86,9 +86,9 @@ class CoordsHistogramVisualizer(MatPltVisualizer):
         self.histogram_max_x = histogram_max_x
         self.histogram_min_y = histogram_min_y
         self.histogram_max_y = histogram_max_y
-        self.ax_hist = plt.subplot(211)
+        self.ax_hist = self.fig.add_subplot(211)
         self.ax_hist.grid()
-        self.ax_line = plt.subplot(212)
+        self.ax_line = self.fig.add_subplot(212)
         self.ax_line.grid()
         self.n_bins = 30
         self.history_maxlen = history_maxlen
@@ -102,6 +102,7 @@ class CoordsHistogramVisualizer(MatPltVisualizer):
             np.zeros((self.history_maxlen,)),
             '-o', c='salmon', alpha=0.5
         )
+        self.animate(self.hist, self.line)
         self.ax_line.set_xlim(0, self.history_maxlen)
         self.history = deque(
             [0] * self.history_maxlen,
@@ -135,7 +136,7 @@ class CoordsHistogramVisualizer(MatPltVisualizer):
             histogram_min_y = self.histogram_min_y
         else:
             histogram_min_y = self.ybound_proper_min(li)
-        if self.histogram_max_x:
+        if self.histogram_max_y:
             histogram_max_y = self.histogram_max_y
         else:
             histogram_max_y = self.ybound_proper_max(li)
@@ -152,20 +153,15 @@ class CoordsHistogramVisualizer(MatPltVisualizer):
                 self.n_bins+1
             )
         )
-        self.hist.set_xdata(x_hist)
-        self.ax_hist.set_xlim(
-            histogram_min_x,
-            histogram_max_x
-        )
-        self.hist.set_ydata(y_hist)
-        self.ax_hist.set_ylim(
-            histogram_min_y,
-            histogram_max_y
-        )
+        self.hist.set_data(x_hist, y_hist)
+        # NOTE: Changing the limits redraws the whole figure.
+        # Change them only when the data does not fit.
+        self.fit_limits(self.ax_hist, 'x', histogram_min_x, histogram_max_x)
+        self.fit_limits(self.ax_hist, 'y', histogram_min_y, histogram_max_y)
 
         # line
         self.line.set_ydata(self.history)
-        self.ax_line.set_ylim(0, max(self.history) * 2) #FIXME: slow
+        self.fit_limits(self.ax_line, 'y', 0, max(self.history), headroom=1.0)
 
     # FIXME: Dirty api
     def xbound_proper_min(
@@ -35,7 +35,7 @@ class RGBImageHistogramVisualizer(MatPltVisualizer):
         lw = 3
         alpha = 0.5
         self.bins = 255
-        self.fig, self.ax = plt.subplots()
+        self.ax = self.fig.add_subplot()
         self.line_r, = self.ax.plot(
             np.arange(self.bins),
             np.zeros((self.bins,)),
@@ -51,6 +51,7 @@ class RGBImageHistogramVisualizer(MatPltVisualizer):
             np.zeros((self.bins,)),
             c='b', lw=lw, alpha=alpha, label='Blue'
         )
+        self.animate(*self.ax.get_lines())
         self.ax.set_xlim(0, self.bins-1)
         self.ax.set_ylim(0, 1)
         self.ax.legend()
@@ -86,12 +87,13 @@ class GrayScaledImageHistogramVisualizer(MatPltVisualizer):
         super().__init__(name, is_operating)
         lw = 3
         self.bins = 255
-        self.fig, self.ax = plt.subplots()
+        self.ax = self.fig.add_subplot()
         self.line_gray, = self.ax.plot(
             np.arange(self.bins),
             np.zeros((self.bins, 1)),
             c='k', lw=lw, label='intensity'
         )
+        self.animate(*self.ax.get_lines())
         self.ax.set_xlim(0, self.bins-1)
         self.ax.set_ylim(0, 1)
         self.ax.legend()
@@ -123,7 +125,7 @@ class HSVImageHistogramVisualizer(MatPltVisualizer):
         lw = 3
         alpha = 0.5
         self.bins = 255
-        self.fig, self.ax = plt.subplots()
+        self.ax = self.fig.add_subplot()
         self.line_h, = self.ax.plot(
             np.arange(self.bins,),
             np.zeros((self.bins,)),
@@ -139,6 +141,7 @@ class HSVImageHistogramVisualizer(MatPltVisualizer):
             np.zeros((self.bins,)),
             c='k', lw=lw, alpha=alpha, label='V'
         )
+        self.animate(*self.ax.get_lines())
         self.ax.set_xlim(0, self.bins-1)
         self.ax.set_ylim(0, 1)
         self.ax.legend()
@@ -148,8 +151,8 @@ class HSVImageHistogramVisualizer(MatPltVisualizer):
         self,
         image: ImageType
     ):
-        (h, s, v) = cv2.split(image)
-        n_pixels = np.prod(image.shape[:2])
+        (h, s, v) = cv2.split(image.data)
+        n_pixels = np.prod(image.data.shape[:2])
         histogram_h = cv2.calcHist([h], [0], None, [self.bins], [0, 255]) / n_pixels
         histogram_s = cv2.calcHist([s], [0], None, [self.bins], [0, 255]) / n_pixels
         histogram_v = cv2.calcHist([v], [0], None, [self.bins], [0, 255]) / n_pixels
@@ -1,5 +1,6 @@
 # Third Party
 import cv2
+import numpy as np
 
 # Project
 from cvpype.python.iospec import ComponentIOSpec
@@ -30,11 +31,11 @@ class CVLineOnImageVisualizer(ImageVisualizer):
         lines: CVLinesType
     ):
         v_image = cv2.cvtColor(image.data, cv2.COLOR_GRAY2BGR)
-        for line in lines.data:
-            for x1, y1, x2, y2 in line:
-                cv2.line(
-                    v_image,
-                    (x1, y1), (x2, y2),
-                    (0, 0, 255), 2
-                )
+        # NOTE: `cv2.HoughLinesP` returns `(N, 1, 4)` lines in OpenCV 4, `(N, 4)` in OpenCV 5.
+        for x1, y1, x2, y2 in np.reshape(lines.data, (-1, 4)).tolist():
+            cv2.line(
+                v_image,
+                (x1, y1), (x2, y2),
+                (0, 0, 255), 2
+            )
         return v_image
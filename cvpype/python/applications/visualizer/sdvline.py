@@ -1,5 +1,6 @@
 # Third Party
 import cv2
+import numpy as np
 
 # Project
 from cvpype.python.iospec import ComponentIOSpec
@@ -7,7 +8,7 @@ from cvpype.python.iospec import ComponentIOSpec
 # Project-Types
 from cvpype.python.basic.types.cvimage import RGBImageType
 from cvpype.python.applications.types.cvline import CVLinesType
-from cvpype.python.applications.types.cvcoord import CVCoordinatesType
+from cvpype.python.applications.types.cvcoord import CVCoordinatesType, PackedPairs
 
 # Project-Visualizers
 from cvpype.python.basic.visualizer.image import ImageVisualizer
@@ -44,16 +45,18 @@ class SDVLineAndEdgePairVisualizer(ImageVisualizer):
         lines: CVLinesType,
         intersections: CVCoordinatesType
     ):
-        v_image = image.data
-        for line in lines.data:
-            for x1, y1, x2, y2 in line:
-                y1 += self.y_origin
-                y2 += self.y_origin
-                cv2.line(
-                    v_image,
-                    (x1, y1), (x2, y2),
-                    (0, 0, 255), 2
-                )
+        # NOTE: The input image may be shared with (or owned by) other readers,
+        # e.g. a read-only frame of a streamer. Draw on a copy.
+        v_image = image.data.copy()
+        # NOTE: `cv2.HoughLinesP` returns `(N, 1, 4)` lines in OpenCV 4, `(N, 4)` in OpenCV 5.
+        for x1, y1, x2, y2 in np.reshape(lines.data, (-1, 4)).tolist():
+            y1 += self.y_origin
+            y2 += self.y_origin
+            cv2.line(
+                v_image,
+                (x1, y1), (x2, y2),
+                (0, 0, 255), 2
+            )
         palette = [
             (0, 255, 0),
             (50, 200, 0),
@@ -61,9 +64,13 @@ class SDVLineAndEdgePairVisualizer(ImageVisualizer):
             (150, 100, 0),
             (200, 50, 0)
         ]
-        for i, pair in enumerate(intersections.data, 1):
-            x1, x2 = pair
-            y = self.roi_y
+        pairs = np.reshape(intersections.data, (-1, 2)).tolist()
+        if isinstance(intersections.data, PackedPairs):
+            # NOTE: Pairs of several scan rows.
+            ys = (intersections.data.ys + self.y_origin).tolist()
+        else:
+            ys = [self.roi_y] * len(pairs)
+        for i, ((x1, x2), y) in enumerate(zip(pairs, ys), 1):
             cv2.drawMarker(
                 v_image,
                 (x1, y),
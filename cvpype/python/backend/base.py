@@ -1,11 +1,21 @@
 # Built-in
+import sys
+import time
 import logging
+from collections import deque
 from abc import ABC
 from abc import abstractmethod
 from threading import Lock, Thread
 
 # Third party
-import imutils
+import cv2
+import numpy as np
+
+# Project
+from cvpype.python.backend.framequeue import FrameQueue
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
 
 
 # TODO: divide into input stream abstract class and output stream abstract class.
@@ -44,8 +54,48 @@ class BaseStreamer(ABC):
         self.__set_logger()
         self._output_frame_locker = Lock()
         self._output_frame = self.SIGNAL_NOTREADY
+        self._last_source_frame = None
+        self._buffers: list[np.ndarray] = []
+        self._buffer_cursor = 0
+        self._free_buffer_refcount = self._measure_free_buffer_refcount()
+        self.max_buffers = 16
+        self.n_frame_copies = 0
+        self._frame_queues: list[FrameQueue] = []
+        self.frame_seq = -1
+        self._publish_times = deque(maxlen=16)
+        self.n_duplicated = 0
         self.width = width
         self.height = height
+        self.set_profile_name(self.__class__.__name__)
+
+    def set_profile_name(
+        self,
+        name: str,
+    ) -> None:
+        """! Names the latencies of the streamer in `PROFILER`:
+        `streamer.<name>.<read|publish|encode>`. `read` is recorded by the
+        subclasses around reading a source frame.
+        By default, the name is the class name. `Server` uses the stream name.
+        """
+        self.profile_name = name
+        self.profile_keys = {
+            key: f'streamer.{name}.{key}'
+            for key in ('read', 'publish', 'encode')
+        }
+
+    @property
+    def publish_fps(
+        self
+    ) -> float:
+        """! Frames published per second over the latest published frames
+        (at most 16) until now, so the rate falls when the source stalls.
+        """
+        with self._output_frame_locker:
+            if len(self._publish_times) < 2:
+                return 0.0
+            n_frames = len(self._publish_times) - 1
+            first_published_at = self._publish_times[0][1]
+        return n_frames / max(time.perf_counter() - first_published_at, 1e-9)
 
     @abstractmethod
     def read_from_stream(
@@ -71,8 +121,43 @@ class BaseStreamer(ABC):
     def output_frame(
         self
     ):
+        """! The latest published frame as a read-only view.
+        The frame stays valid as long as the view (or any view of it) is alive.
+        """
+        with self._output_frame_locker:
+            if self._output_frame is self.SIGNAL_NOTREADY:
+                return self._output_frame
+            return self._readonly_view(self._output_frame)
+
+    def add_frame_queue(
+        self,
+        frame_queue: FrameQueue,
+    ) -> None:
+        """! Every frame published after this call is put into `frame_queue`
+        together with its sequence number.
+        """
         with self._output_frame_locker:
-            return self._output_frame
+            self._frame_queues.append(frame_queue)
+
+    def remove_frame_queue(
+        self,
+        frame_queue: FrameQueue,
+    ) -> None:
+        with self._output_frame_locker:
+            self._frame_queues.remove(frame_queue)
+
+    def published_at(
+        self,
+        seq: int
+    ) -> float | None:
+        """! `time.perf_counter()` when the frame `seq` was published,
+        or `None` if the frame is too old.
+        """
+        with self._output_frame_locker:
+            for published_seq, published_at in reversed(self._publish_times):
+                if published_seq == seq:
+                    return published_at
+        return None
 
     @property
     def is_ready(
@@ -81,11 +166,85 @@ class BaseStreamer(ABC):
         with self._output_frame_locker:
             return self._output_frame is not self.SIGNAL_NOTREADY
 
+    @staticmethod
+    def _readonly_view(
+        buffer: np.ndarray
+    ) -> np.ndarray:
+        # NOTE: The view keeps a reference to the buffer,
+        # so the buffer is not reused while the view is alive.
+        view = buffer.view()
+        view.flags.writeable = False
+        return view
+
+    @staticmethod
+    def _refcount_in_pool(
+        pool: list,
+        index: int,
+    ) -> int:
+        buffer = pool[index]
+        return sys.getrefcount(buffer)
+
+    def _measure_free_buffer_refcount(
+        self
+    ) -> int:
+        return self._refcount_in_pool([np.empty((1,))], 0)
+
+    def _acquire_buffer(
+        self,
+        shape: tuple,
+        dtype: np.dtype,
+    ) -> np.ndarray:
+        """! Returns a preallocated buffer that nobody refers to.
+        The latest published frame and every frame held by a reader
+        (or a frame queue) are still referenced, so they are never overwritten.
+        """
+        if self._buffers and (
+            self._buffers[0].shape != shape or
+            self._buffers[0].dtype != dtype
+        ):
+            # NOTE: Readers still holding the old buffers keep them alive.
+            self._buffers = []
+            self._buffer_cursor = 0
+        n_buffers = len(self._buffers)
+        for i in range(n_buffers):
+            index = (self._buffer_cursor + i) % n_buffers
+            if self._refcount_in_pool(self._buffers, index) <= self._free_buffer_refcount:
+                self._buffer_cursor = (index + 1) % n_buffers
+                return self._buffers[index]
+        buffer = np.empty(shape, dtype=dtype)
+        if n_buffers < self.max_buffers:
+            self._buffers.append(buffer)
+        elif n_buffers == self.max_buffers:
+            self.logger.warning(
+                f'All {self.max_buffers} frame buffers are held by readers. '
+                'Allocating a new frame for each publication. '
+                'Check whether a reader keeps frames for too long.'
+            )
+            self.max_buffers -= 1
+        return buffer
+
+    def _target_size(
+        self,
+        img: np.ndarray
+    ) -> tuple[int, int]:
+        """! `(height, width)` of the published frame, keeping the aspect ratio
+        when only one side is given (same as `imutils.resize`).
+        """
+        h, w = img.shape[0:2]
+        if self.width:
+            return int(h * self.width / float(w)), self.width
+        if self.height:
+            return self.height, int(w * self.height / float(h))
+        return h, w
+
     @output_frame.setter
     def output_frame(
         self,
         img
     ):
+        """! Publishes a frame. The frame is resized (or copied) once into a
+        preallocated buffer, which readers receive as a read-only view.
+        """
         if img is None:
             self.logger.warning(
                 'Trying to set `output_frame` to None. Ignore this frame. '
@@ -93,8 +252,34 @@ class BaseStreamer(ABC):
                 'running `read_from_stream`, or implementation of `read_from_stream`. '
             )
             return
-        img = imutils.resize(img, width=self.width, height=self.height)
+        if img is self._last_source_frame:
+            # NOTE: The source has not produced a new frame yet.
+            self.n_duplicated += 1
+            return
+        self._last_source_frame = img
+        t_publish = time.perf_counter()
+        t0_ns = time.perf_counter_ns()
+        height, width = self._target_size(img)
+        shape = (height, width) + img.shape[2:]
+        buffer = self._acquire_buffer(shape, img.dtype)
+        if img.shape == shape:
+            np.copyto(buffer, img)
+        else:
+            cv2.resize(img, (width, height), dst=buffer, interpolation=cv2.INTER_AREA)
+        self.n_frame_copies += 1
         with self._output_frame_locker:
             if (not self.height) or (not self.width):
-                self.height, self.width = img.shape[0:2]
-            self._output_frame = img.copy()
+                self.height, self.width = height, width
+            self._output_frame = buffer
+            self.frame_seq += 1
+            seq = self.frame_seq
+            self._publish_times.append((seq, t_publish))
+            frame_queues = list(self._frame_queues)
+        if PROFILER.enabled:
+            # NOTE: Without waiting for the frame queues.
+            PROFILER.record(self.profile_keys['publish'], time.perf_counter_ns() - t0_ns)
+        if frame_queues:
+            frame = self._readonly_view(buffer)
+            # NOTE: Put outside of the lock, since the `block` policy may wait.
+            for frame_queue in frame_queues:
+                frame_queue.put(seq, frame)
@@ -0,0 +1,162 @@
+# Built-in
+import weakref
+import threading
+from collections import deque
+from time import perf_counter_ns
+from typing import Any
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
+
+
+class FrameQueue():
+    """! Bounded queue of `(seq, frame)` items between a frame producer
+    (e.g. a streamer) and a consumer (e.g. a pipeline).
+
+    When the queue is full, the policy decides what happens to a new frame:
+    - `drop-oldest`: the oldest queued frame is dropped (lowest latency).
+    - `drop-newest`: the new frame is dropped (keeps the queued frames).
+    - `block`: the producer waits until the consumer takes a frame (backpressure).
+
+    The time `get` waits for a frame is recorded in `PROFILER` as
+    `queue.<name>.wait`, and the time a blocked `put` waits as `queue.<name>.block`.
+    Every open queue is listed by `FrameQueue.instances()` (e.g. for `/metrics`).
+    """
+    DROP_OLDEST = 'drop-oldest'
+    DROP_NEWEST = 'drop-newest'
+    BLOCK = 'block'
+    POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+    _instances = weakref.WeakSet()
+
+    def __init__(
+        self,
+        maxsize: int = 2,
+        policy: str = DROP_OLDEST,
+        name: str = 'frames',
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(
+                f'`maxsize` should be a positive integer. Current value: `{maxsize}`'
+            )
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f'Unknown policy `{policy}`. (Available policies: {self.POLICIES})'
+            )
+        self.maxsize = maxsize
+        self.policy = policy
+        self.name = name
+        self.profile_keys = {
+            key: f'queue.{name}.{key}'
+            for key in ('wait', 'block')
+        }
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self.n_put = 0
+        self.n_dropped = 0
+        self.n_got = 0
+        FrameQueue._instances.add(self)
+
+    @classmethod
+    def instances(
+        cls
+    ) -> list['FrameQueue']:
+        """! The queues that are alive and not closed.
+        """
+        return [queue for queue in list(cls._instances) if not queue.closed]
+
+    def put(
+        self,
+        seq: int,
+        frame: Any,
+        timeout: float | None = None,
+    ) -> bool:
+        """! Puts a frame with its sequence number.
+
+        @return `False` if the frame was dropped (or the queue is closed),
+        `True` otherwise.
+        """
+        with self._cond:
+            if self._closed:
+                return False
+            self.n_put += 1
+            if len(self._items) >= self.maxsize:
+                if self.policy == self.DROP_NEWEST:
+                    self.n_dropped += 1
+                    return False
+                if self.policy == self.DROP_OLDEST:
+                    self._items.popleft()
+                    self.n_dropped += 1
+                else:
+                    t0 = perf_counter_ns()
+                    ok = self._cond.wait_for(
+                        lambda: len(self._items) < self.maxsize or self._closed,
+                        timeout=timeout,
+                    )
+                    if PROFILER.enabled:
+                        PROFILER.record(self.profile_keys['block'], perf_counter_ns() - t0)
+                    if not ok or self._closed:
+                        self.n_dropped += 1
+                        return False
+            self._items.append((seq, frame))
+            self._cond.notify_all()
+            return True
+
+    def get(
+        self,
+        timeout: float | None = None,
+    ) -> tuple[int, Any] | None:
+        """! Takes the oldest frame, waiting until one is available.
+
+        @return a `(seq, frame)` tuple, or `None` if the queue is closed
+        (or the timeout expired).
+        """
+        t0 = perf_counter_ns()
+        with self._cond:
+            ok = self._cond.wait_for(
+                lambda: self._items or self._closed,
+                timeout=timeout,
+            )
+            if not ok or not self._items:
+                return None
+            item = self._items.popleft()
+            self.n_got += 1
+            self._cond.notify_all()
+        if PROFILER.enabled:
+            PROFILER.record(self.profile_keys['wait'], perf_counter_ns() - t0)
+        return item
+
+    def close(
+        self
+    ) -> None:
+        """! Wakes every waiting producer and consumer.
+        Queued frames are still returned by `get` until the queue is empty.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(
+        self
+    ) -> bool:
+        return self._closed
+
+    @property
+    def depth(
+        self
+    ) -> int:
+        return len(self._items)
+
+    def stats(
+        self
+    ) -> dict:
+        return {
+            'name': self.name,
+            'policy': self.policy,
+            'maxsize': self.maxsize,
+            'depth': self.depth,
+            'put': self.n_put,
+            'got': self.n_got,
+            'dropped': self.n_dropped,
+        }
@@ -0,0 +1,61 @@
+# Built-in
+import time
+import unittest
+import threading
+
+# Project
+from cvpype.python.backend.framequeue import FrameQueue
+
+
+class TestFrameQueue(unittest.TestCase):
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            FrameQueue(maxsize=0)
+        with self.assertRaises(ValueError):
+            FrameQueue(policy='unknown')
+
+    def test_drop_oldest(self):
+        q = FrameQueue(maxsize=2, policy=FrameQueue.DROP_OLDEST)
+        for seq in range(5):
+            self.assertTrue(q.put(seq, f'frame{seq}'))
+        self.assertEqual(3, q.n_dropped)
+        self.assertEqual((3, 'frame3'), q.get())
+        self.assertEqual((4, 'frame4'), q.get())
+
+    def test_drop_newest(self):
+        q = FrameQueue(maxsize=2, policy=FrameQueue.DROP_NEWEST)
+        results = [q.put(seq, f'frame{seq}') for seq in range(5)]
+        self.assertEqual([True, True, False, False, False], results)
+        self.assertEqual(3, q.n_dropped)
+        self.assertEqual((0, 'frame0'), q.get())
+        self.assertEqual((1, 'frame1'), q.get())
+
+    def test_block(self):
+        q = FrameQueue(maxsize=1, policy=FrameQueue.BLOCK)
+        q.put(0, 'frame0')
+        self.assertFalse(q.put(1, 'frame1', timeout=0.01))
+
+        def consume():
+            time.sleep(0.05)
+            q.get()
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        self.assertTrue(q.put(2, 'frame2'))
+        consumer.join()
+        self.assertEqual((2, 'frame2'), q.get())
+
+    def test_close(self):
+        q = FrameQueue(maxsize=2)
+        q.put(0, 'frame0')
+        q.close()
+        self.assertFalse(q.put(1, 'frame1'))
+        self.assertEqual((0, 'frame0'), q.get())
+        self.assertIsNone(q.get())
+
+    def test_get_timeout(self):
+        q = FrameQueue(maxsize=2)
+        self.assertIsNone(q.get(timeout=0.01))
+
+
+if __name__ == '__main__':
+    unittest.main()
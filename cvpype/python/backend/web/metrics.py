@@ -0,0 +1,142 @@
+# Project
+from cvpype.python.backend.framequeue import FrameQueue
+from cvpype.python.backend.web.streamer.base import BaseWebStreamer
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER, Profiler, LatencyHistogram
+
+
+# NOTE: The upper bounds (in seconds) of the buckets of the latency histograms.
+LATENCY_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+def _escape(
+    value: str,
+) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_sample(
+    name: str,
+    labels: dict,
+    value: float,
+) -> str:
+    label_text = ','.join(f'{key}="{_escape(v)}"' for key, v in labels.items())
+    # NOTE: Integers are kept exact (`:g` rounds large counters).
+    value_text = str(value) if isinstance(value, int) else repr(float(value))
+    return f'{name}{{{label_text}}} {value_text}'
+
+
+class _MetricFamily():
+    def __init__(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+    ) -> None:
+        self.lines = [
+            f'# HELP {name} {help_text}',
+            f'# TYPE {name} {metric_type}',
+        ]
+        self.name = name
+
+    def add(
+        self,
+        labels: dict,
+        value: float,
+        suffix: str = '',
+    ) -> None:
+        self.lines.append(_format_sample(self.name + suffix, labels, value))
+
+
+def _bucket_counts(
+    histogram: LatencyHistogram,
+    bounds_ns: list[int],
+) -> list[int]:
+    """! The cumulative counts of `histogram` below each bound. A bucket of
+    the histogram is counted by its middle, so a count is accurate up to
+    the width of a bucket (about 3% of the bound).
+    """
+    counts = [0] * len(bounds_ns)
+    for index, count in enumerate(histogram.counts):
+        if not count:
+            continue
+        lower, upper = LatencyHistogram.bucket_range(index)
+        middle = (lower + upper - 1) / 2
+        for i, bound in enumerate(bounds_ns):
+            if middle <= bound:
+                counts[i] += count
+                break
+    cumulative = 0
+    for i, count in enumerate(counts):
+        cumulative += count
+        counts[i] = cumulative
+    return counts
+
+
+def render_metrics(
+    streamers: dict[str, BaseWebStreamer],
+    profiler: Profiler = PROFILER,
+) -> str:
+    """! Renders the metrics of the streamers, of every open `FrameQueue`
+    and the latency histograms of `profiler` in the Prometheus text
+    exposition format.
+
+    Every value is a counter or a gauge that is updated on the hot path
+    anyway (or, for the latencies, the buckets of the profiler), so the
+    cost of a scrape does not depend on how long the server has run.
+
+    @param streamers The streamers by stream name (see `Server.add_videostream`).
+    """
+    fps = _MetricFamily('cvpype_stream_fps', 'gauge', 'Frames published per second over the latest frames.')
+    published = _MetricFamily('cvpype_stream_published_frames_total', 'counter', 'Frames published by the streamer.')
+    duplicated = _MetricFamily('cvpype_stream_duplicated_frames_total', 'counter', 'Source frames ignored because they were not new.')
+    encoded = _MetricFamily('cvpype_stream_encoded_frames_total', 'counter', 'Frames encoded to JPEG for the connected clients.')
+    clients = _MetricFamily('cvpype_stream_clients', 'gauge', 'Connected clients.')
+    for name, streamer in streamers.items():
+        labels = {'stream': name}
+        fps.add(labels, streamer.publish_fps)
+        published.add(labels, streamer.frame_seq + 1)
+        duplicated.add(labels, streamer.n_duplicated)
+        encoded.add(labels, streamer.n_encoded)
+        clients.add(labels, streamer.n_clients)
+
+    depth = _MetricFamily('cvpype_queue_depth', 'gauge', 'Frames waiting in the queue.')
+    capacity = _MetricFamily('cvpype_queue_capacity', 'gauge', 'The capacity of the queue.')
+    put = _MetricFamily('cvpype_queue_put_frames_total', 'counter', 'Frames put into the queue.')
+    dropped = _MetricFamily('cvpype_queue_dropped_frames_total', 'counter', 'Frames dropped by the policy of the queue.')
+    # NOTE: Queues with the same name (e.g. the queues of a pipeline run twice) are summed.
+    queue_stats = {}
+    for queue in FrameQueue.instances():
+        stats = queue_stats.setdefault(queue.name, {'depth': 0, 'maxsize': 0, 'put': 0, 'dropped': 0})
+        for key, value in queue.stats().items():
+            if key in stats:
+                stats[key] += value
+    for name, stats in sorted(queue_stats.items()):
+        labels = {'queue': name}
+        depth.add(labels, stats['depth'])
+        capacity.add(labels, stats['maxsize'])
+        put.add(labels, stats['put'])
+        dropped.add(labels, stats['dropped'])
+
+    latency = _MetricFamily(
+        'cvpype_latency_seconds', 'histogram',
+        'Latency of the sections timed by the profiler '
+        '(component runs, visualizer paints, queue waits, streamer reads and encodes).'
+    )
+    bounds_ns = [int(bound * 1e9) for bound in LATENCY_BUCKETS]
+    for key, histogram in sorted(profiler.histograms().items()):
+        count = histogram.count
+        if not count:
+            continue
+        for bound, bucket_count in zip(LATENCY_BUCKETS, _bucket_counts(histogram, bounds_ns)):
+            latency.add({'section': key, 'le': f'{bound:g}'}, bucket_count, '_bucket')
+        latency.add({'section': key, 'le': '+Inf'}, count, '_bucket')
+        latency.add({'section': key}, histogram.total_ns / 1e9, '_sum')
+        latency.add({'section': key}, count, '_count')
+
+    families = (fps, published, duplicated, encoded, clients, depth, capacity, put, dropped, latency)
+    return '\n'.join(line for family in families for line in family.lines) + '\n'
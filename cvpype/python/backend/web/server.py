@@ -5,6 +5,7 @@ import argparse
 import flask
 
 # Project
+from cvpype.python.backend.web.metrics import render_metrics
 from cvpype.python.backend.web.streamer.base import BaseWebStreamer
 from cvpype.python.backend.web.streamer.camera import CameraWebStreamer
 
@@ -50,6 +51,9 @@ class Server():
         self.app.add_url_rule(
             rule='/', view_func=self.index,
         )
+        self.app.add_url_rule(
+            rule='/metrics', view_func=self.metrics,
+        )
         self.streamers = {}
 
     def get_streamer(
@@ -97,6 +101,17 @@ class Server():
                 links.append((url, rule.endpoint))
         return links
 
+    def metrics(
+        self
+    ):
+        """! The metrics of the streams, the frame queues and the latencies
+        of the `PROFILER` in the Prometheus text exposition format.
+        """
+        return flask.Response(
+            render_metrics(self.streamers),
+            mimetype='text/plain; version=0.0.4; charset=utf-8'
+        )
+
     def add_videostream(
         self,
         name: str,
@@ -110,6 +125,10 @@ class Server():
             raise KeyError(
                 f'Videostream `{name}` already exists.'
             )
+        if name == 'metrics':
+            raise KeyError('`metrics` is reserved for the metrics endpoint.')
+        # NOTE: The latencies of the streamer are reported per stream.
+        streamer.set_profile_name(name)
         streamer.open()
         self.streamers[name] = streamer
         self.app.add_url_rule(
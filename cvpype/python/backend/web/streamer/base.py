@@ -1,26 +1,181 @@
 # Built-in
-from abc import abstractmethod
+import time
+from collections import deque
+from threading import Condition, Lock, Thread
 
 # Third party
+import cv2
 import flask
+import numpy as np
 
 # Project
 from cvpype.python.backend.base import BaseStreamer
+from cvpype.python.backend.framequeue import FrameQueue
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
+from cvpype.python.utils.tracing import TRACER
 
 
 class BaseWebStreamer(BaseStreamer):
+    """! Streams the published frames to browsers as MJPEG.
+
+    Every connected browser shares a single encoder: a background thread
+    encodes each new frame exactly once and wakes every client through a
+    condition variable. The encoder only receives frames while at least
+    one browser is connected, and it waits (without polling) for a new frame.
+    The encoder thread and its frame queue are created for the first
+    browser and kept for the lifetime of the streamer, so the counters of
+    the queue (see `render_metrics`) keep growing across client sessions.
+    """
     def __init__(
         self,
         width: int | None = None,
         height: int | None = None
     ):
         super().__init__(width=width, height=height)
+        self._jpeg_cond = Condition()
+        self._jpeg = None
+        self._jpeg_seq = -1
+        self._clients_locker = Lock()
+        self._encoder_queue: FrameQueue | None = None
+        self.n_clients = 0
+        self.n_encoded = 0
+        self._encode_ms = deque(maxlen=1000)
+        self._delivery_ms = deque(maxlen=1000)
+
+    def encode(
+        self,
+        frame
+    ) -> bytes | None:
+        """! Encodes a frame into a multipart JPEG chunk.
+
+        @return the chunk, or `None` if the frame cannot be encoded.
+        """
+        (ok, encoded_frame) = cv2.imencode(
+            ext=".jpg",
+            img=frame
+        )
+        if not ok:
+            return None
+        return (
+            b'--frame\r\n'
+            b'Content-Type: image/jpeg\r\n\r\n' +
+            encoded_frame.tobytes() + b'\r\n'
+        )
+
+    def _broadcast(
+        self,
+        seq: int,
+        frame,
+    ) -> None:
+        with self._jpeg_cond:
+            if seq <= self._jpeg_seq:
+                return
+        TRACER.set_frame_id(seq)
+        t0 = time.perf_counter_ns()
+        jpeg = self.encode(frame)
+        if jpeg is None:
+            return
+        duration_ns = time.perf_counter_ns() - t0
+        self._encode_ms.append(duration_ns / 1e6)
+        if PROFILER.enabled:
+            PROFILER.record(self.profile_keys['encode'], duration_ns)
+        with self._jpeg_cond:
+            self.n_encoded += 1
+            self._jpeg = jpeg
+            self._jpeg_seq = seq
+            self._jpeg_cond.notify_all()
+
+    def _run_encoder(
+        self,
+        frame_queue: FrameQueue,
+    ) -> None:
+        while True:
+            item = frame_queue.get()
+            if item is None:
+                break
+            self._broadcast(*item)
+
+    def _add_client(
+        self
+    ) -> None:
+        with self._clients_locker:
+            self.n_clients += 1
+            if self.n_clients > 1:
+                return
+            if self._encoder_queue is None:
+                # NOTE: Only the latest frame is worth encoding.
+                self._encoder_queue = FrameQueue(
+                    maxsize=1,
+                    policy=FrameQueue.DROP_OLDEST,
+                    name=f'{self.profile_name}.encoder',
+                )
+                thread = Thread(
+                    target=self._run_encoder,
+                    args=(self._encoder_queue,),
+                    daemon=True
+                )
+                thread.start()
+            self.add_frame_queue(self._encoder_queue)
+            # NOTE: The frame published before the first client connected.
+            with self._output_frame_locker:
+                seq = self.frame_seq
+            frame = self.output_frame
+            if frame is not self.SIGNAL_NOTREADY:
+                self._encoder_queue.put(seq, frame)
+
+    def _remove_client(
+        self
+    ) -> None:
+        with self._clients_locker:
+            self.n_clients -= 1
+            if self.n_clients > 0:
+                return
+            # NOTE: Nobody is watching. Stop encoding; the encoder waits idle.
+            self.remove_frame_queue(self._encoder_queue)
 
-    @abstractmethod
     def push_to_browser(
         self
     ):
-        raise NotImplementedError
+        """! Yields a multipart JPEG chunk whenever a new frame is encoded.
+        """
+        self._add_client()
+        try:
+            last_seq = -1
+            while True:
+                with self._jpeg_cond:
+                    self._jpeg_cond.wait_for(lambda: self._jpeg_seq > last_seq)
+                    last_seq = self._jpeg_seq
+                    jpeg = self._jpeg
+                published_at = self.published_at(last_seq)
+                if published_at is not None:
+                    self._delivery_ms.append((time.perf_counter() - published_at) * 1000)
+                yield jpeg
+        finally:
+            # NOTE: The generator is closed when the browser disconnects.
+            self._remove_client()
+
+    def latency_stats(
+        self
+    ) -> dict:
+        """! Returns the latency from the publication of a frame to its
+        delivery to a browser, and the encode time, in milliseconds.
+        """
+        stats = {
+            'n_encoded': self.n_encoded,
+            'n_clients': self.n_clients,
+        }
+        for key, samples in (('delivery', self._delivery_ms), ('encode', self._encode_ms)):
+            samples = list(samples)
+            if not samples:
+                continue
+            stats.update({
+                f'{key}_p50_ms': float(np.percentile(samples, 50)),
+                f'{key}_p95_ms': float(np.percentile(samples, 95)),
+                f'{key}_max_ms': float(np.max(samples)),
+            })
+        return stats
 
     def response(
         self,
@@ -9,6 +9,10 @@ from imutils.video import VideoStream
 # Project
 from cvpype.python.backend.web.streamer.base import BaseWebStreamer
 
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
+from cvpype.python.utils.tracing import TRACER
+
 
 class CameraWebStreamer(BaseWebStreamer):
     def __init__(
@@ -18,36 +22,32 @@ class CameraWebStreamer(BaseWebStreamer):
         src: int = 0,
     ):
         super().__init__(width=width, height=height)
+        self._last_camera_frame = None
         self.video_stream = VideoStream(src=src).start()
         time.sleep(3.0)
 
     def read_from_stream(self):
         while True:
-            # TODO: Should be benchmarked in the parent classes
             # NOTE: 이 연산들은 매우 무거운 편임.
             # 여기가 더 무거워지면, push_to_browser 이 아무리 빨라도
             # 화면을 제대로 출력하지 못하는 문제가 발생함.
+            # The latencies are in `PROFILER` (`streamer.<class>.read` and `.publish`).
+            # NOTE: The sequence number the frame gets when it is published.
+            TRACER.set_frame_id(self.frame_seq + 1)
+            t0 = time.perf_counter_ns()
             frame = self.video_stream.read()
+            if frame is self._last_camera_frame:
+                # NOTE: The camera has not grabbed a new frame yet.
+                self.n_duplicated += 1
+                time.sleep(0.001)
+                continue
+            self._last_camera_frame = frame
             frame = imutils.resize(frame, width=self.width, height=self.height)
             frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if PROFILER.enabled:
+                PROFILER.record(self.profile_keys['read'], time.perf_counter_ns() - t0)
             self.output_frame = frame_gray
 
-    def push_to_browser(self):
-        while True:
-            # TODO: Should be benchmarked in the parent classes
-            if self.output_frame is not None:
-                (ok, encoded_frame) = cv2.imencode(
-                    ext=".jpg",
-                    img=self.output_frame
-                )
-                if not ok:
-                    continue
-                yield(
-                    b'--frame\r\n'
-                    b'Content-Type: image/jpeg\r\n\r\n' +
-                    bytearray(encoded_frame) + b'\r\n'
-                )
-
     def close(
         self
     ):
@@ -1,51 +1,39 @@
-# Built-in
-import time
-from threading import Lock
-
-# Third party
-import cv2
-
 # Project
 from cvpype.python.backend.web.streamer.base import BaseWebStreamer
 
 
 class RealtimeImageWebStreamer(BaseWebStreamer):
+    """! Streams the images pushed by a producer (e.g. `ImageVisualizer`)
+    to browsers. Each call publishes the image immediately, which wakes
+    the shared encoder; there is no polling thread.
+    """
     def __init__(
         self,
         width: int | None = None,
         height: int | None = None,
     ):
         super().__init__(width=width, height=height)
-        self.temp_frame = None
-        self.temp_frame_lock = Lock()
 
-    def read_from_stream(self):
-        # FIXME: dirty api, not safe
-        while True:
-            time.sleep(0.05)
-            with self.temp_frame_lock:
-                self.output_frame = self.temp_frame
+    def read_from_stream(
+        self
+    ) -> None:
+        # NOTE: Frames are pushed by `__call__`.
+        pass
 
-    def __call__(self, frame):
-        # FIXME: dirty api
-        with self.temp_frame_lock:
-            self.temp_frame = frame
+    def open(
+        self
+    ) -> None:
+        # NOTE: Nothing to read. Frames are pushed by `__call__`.
+        pass
 
-    def push_to_browser(self):
-        while True:
-            # TODO: Should be benchmarked in the parent classes
-            if self.output_frame is not None:
-                (ok, encoded_frame) = cv2.imencode(
-                    ext=".jpg",
-                    img=self.output_frame
-                )
-                if not ok:
-                    continue
-                yield(
-                    b'--frame\r\n'
-                    b'Content-Type: image/jpeg\r\n\r\n' +
-                    bytearray(encoded_frame) + b'\r\n'
-                )
+    def __call__(
+        self,
+        frame
+    ) -> None:
+        # NOTE: Every pushed image is a new frame,
+        # even if the producer reuses the same array.
+        self._last_source_frame = None
+        self.output_frame = frame
 
     def close(
         self
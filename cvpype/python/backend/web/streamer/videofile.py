@@ -3,11 +3,14 @@ import time
 
 # Third party
 import cv2
-import imutils
 
 # Project
 from cvpype.python.backend.web.streamer.base import BaseWebStreamer
 
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
+from cvpype.python.utils.tracing import TRACER
+
 
 class VideofileWebStreamer(BaseWebStreamer):
     def __init__(
@@ -31,43 +34,30 @@ class VideofileWebStreamer(BaseWebStreamer):
 
     def read_from_stream(self):
         while self.cap.isOpened():
-            # TODO: Should be benchmarked in the parent classes
             # NOTE: 이 연산들은 매우 무거운 편임.
             # 여기가 더 무거워지면, push_to_browser 이 아무리 빨라도
             # 화면을 제대로 출력하지 못하는 문제가 발생함.
-            ret, frame = self.cap.read()
+            # The latencies are in `PROFILER` (`streamer.<class>.read` and `.publish`).
+            # NOTE: The sequence number the frame gets when it is published.
+            TRACER.set_frame_id(self.frame_seq + 1)
+            ret, frame = PROFILER.call(self.profile_keys['read'], self.cap.read)
             if not ret:
                 if self.replay:
                     self.logger.info(f'Replay video `{self.video_path}`')
                     self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
                     continue
                 break
-            frame = imutils.resize(frame, width=self.width, height=self.height)
+            # NOTE: The frame is resized while it is published.
             self.output_frame = frame
             try:
                 cv2.waitKey(self.delay)
             except:
                 # FIXME: dirty
                 # NOTE: https://github.com/opencv/opencv/issues/22602
-                time.sleep(self.delay)
+                # `self.delay` is in milliseconds.
+                time.sleep(self.delay / 1000)
         self.logger.warning('Broken pipe')
 
-    def push_to_browser(self):
-        while True:
-            # TODO: Should be benchmarked in the parent classes
-            if self.output_frame is not None:
-                (ok, encoded_frame) = cv2.imencode(
-                    ext=".jpg",
-                    img=self.output_frame
-                )
-                if not ok:
-                    continue
-                yield(
-                    b'--frame\r\n'
-                    b'Content-Type: image/jpeg\r\n\r\n' +
-                    bytearray(encoded_frame) + b'\r\n'
-                )
-
     def close(
         self
     ):
@@ -1,5 +1,6 @@
 # Third party
 import cv2
+import numpy as np
 
 # Project
 from cvpype.python.iospec import ComponentIOSpec
@@ -18,13 +19,73 @@ from cvpype.python.utils.component import \
     run_component_with_singular_input_of_ImageType
 
 
+def sample_gradient_magnitudes(
+    image: np.ndarray,
+    step: int = 4,
+) -> np.ndarray:
+    """! Estimates the gradient magnitudes `cv2.Canny` computes (the L1 norm
+    of the 3x3 Sobel derivatives) on every `step`-th row and column of `image`.
+
+    The derivatives are the central differences of the full-resolution
+    image at the sampled pixels, so subsampling does not change their scale.
+    As the 3x3 Sobel kernel sums 4 central differences, they are scaled by 4.
+
+    @return a flat integer array of the sampled magnitudes.
+    """
+    h, w = image.shape[:2]
+    if h < 3 or w < 3:
+        return np.zeros((0,), dtype=np.int32)
+    n_rows = len(range(1, h - 1, step))
+    n_cols = len(range(1, w - 1, step))
+    # NOTE: Only the sampled pixels are converted, not the whole image.
+    rows = image[1:h - 1:step]
+    cols = np.s_[1:w - 1:step]
+    dx = rows[:, 2::step][:, :n_cols].astype(np.int32) - rows[:, :-2:step][:, :n_cols]
+    dy = image[2::step, cols][:n_rows].astype(np.int32) - image[:-2:step, cols][:n_rows]
+    np.abs(dx, out=dx)
+    np.abs(dy, out=dy)
+    dx += dy
+    dx <<= 2
+    return dx.ravel()
+
+
 class EdgeDetectingComponent(IOBaseComponent):
-    """Applies edge detection to a grayscaled image.
+    """! Applies edge detection (Canny) to a grayscaled image.
+
+    With `mode='fixed'`, the thresholds are the arguments of `run()`.
+    With `mode='adaptive'`, the high threshold is the `percentile` of the
+    gradient magnitudes of the image, sampled on every `step`-th row and
+    column, and the low threshold is `ratio` of it. The high threshold is
+    smoothed across frames with an exponential moving average, so that
+    the density of the edges (and the cost of the stages consuming them)
+    stays stable under changing lighting without flickering.
     """
+    MODES = ('fixed', 'adaptive')
+    # NOTE: The gradients and the non-maximum suppression need 2 rows.
+    # The hysteresis follows weak edges across the whole image, so the
+    # extra rows keep the edges of a band close to the ones of the whole image.
+    row_halo = 4
 
     def __init__(
-        self
+        self,
+        mode: str = 'fixed',
+        percentile: float = 98,
+        ratio: float = 0.5,
+        smoothing: float = 0.2,
+        step: int = 4,
+        min_threshold: float = 40,
     ):
+        """!
+        @param mode `fixed` or `adaptive`. See the class docstring.
+        @param percentile The percentile of the gradient magnitudes used as the high threshold.
+        The default keeps about the edges of the fixed thresholds on the sample videos.
+        @param ratio The low threshold relative to the high threshold.
+        @param smoothing The weight of the current frame in the moving average of the high threshold.
+        `1` uses the current frame alone.
+        @param step The sampling step (in pixels) of the gradient magnitudes.
+        @param min_threshold The lower bound of the high threshold, so that noise
+        is not detected as edges in flat images.
+        """
         super().__init__(
             inputs = [
                 ComponentIOSpec(
@@ -42,6 +103,55 @@ class EdgeDetectingComponent(IOBaseComponent):
                 name='EdgeDetectingComponent'
             )
         )
+        if mode not in self.MODES:
+            raise ValueError(
+                f'Unknown mode `{mode}`. (Available modes: {self.MODES})'
+            )
+        if not 0 < smoothing <= 1:
+            raise ValueError(
+                f'`smoothing` should be in (0, 1]. Current value: `{smoothing}`'
+            )
+        if step < 1:
+            raise ValueError(
+                f'`step` should be a positive integer. Current value: `{step}`'
+            )
+        self.mode = mode
+        self.percentile = percentile
+        self.ratio = ratio
+        self.smoothing = smoothing
+        self.step = step
+        self.min_threshold = min_threshold
+        self.reset()
+
+    def reset(
+        self
+    ) -> None:
+        """! Forgets the thresholds of the previous frames.
+        """
+        self.high_threshold: float | None = None
+        self.thresholds: tuple[float, float] | None = None
+
+    def update_thresholds(
+        self,
+        image: np.ndarray,
+    ) -> tuple[float, float]:
+        """! Updates the moving average of the high threshold with the
+        statistics of `image`.
+
+        @return the `(low, high)` thresholds for `image`.
+        """
+        magnitudes = sample_gradient_magnitudes(image, self.step)
+        if len(magnitudes):
+            # NOTE: `np.partition` is much cheaper than `np.percentile` for a single value.
+            k = min(int(len(magnitudes) * self.percentile / 100), len(magnitudes) - 1)
+            high = max(float(np.partition(magnitudes, k)[k]), self.min_threshold)
+            if self.high_threshold is None:
+                self.high_threshold = high
+            else:
+                self.high_threshold += self.smoothing * (high - self.high_threshold)
+        elif self.high_threshold is None:
+            self.high_threshold = float(self.min_threshold)
+        return (self.ratio * self.high_threshold, self.high_threshold)
 
     def run(
         self,
@@ -49,7 +159,20 @@ class EdgeDetectingComponent(IOBaseComponent):
         threshold1: int = 100,
         threshold2: int = 200,
     ) -> dict:
-        edge_image = cv2.Canny(
+        """!
+        @param threshold1 The low threshold of the `fixed` mode.
+        @param threshold2 The high threshold of the `fixed` mode.
+        """
+        if self.mode == 'adaptive':
+            rows = self.required_rows(0)
+            # NOTE: Only the rows that are computed (see `set_output_rows`)
+            # are valid, so the statistics are taken from them.
+            threshold1, threshold2 = self.update_thresholds(
+                image if rows is None else image[rows[0]:rows[1]]
+            )
+        self.thresholds = (threshold1, threshold2)
+        edge_image = self.run_on_output_rows(
+            cv2.Canny,
             image,
             threshold1,
             threshold2
@@ -20,6 +20,7 @@ from cvpype.python.utils.component import \
 class GrayscailingComponent(IOBaseComponent):
     """Converts an RGB image to a grayscaled image.
     """
+    row_halo = 0
 
     def __init__(
         self
@@ -46,7 +47,7 @@ class GrayscailingComponent(IOBaseComponent):
         self,
         image
     ) -> dict:
-        grayscale_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        grayscale_image = self.run_on_output_rows(cv2.cvtColor, image, cv2.COLOR_BGR2GRAY)
         self.visualize(grayscale_image)
         self.log('completed grayscale transformation.', level='debug')
         return {'image': grayscale_image}
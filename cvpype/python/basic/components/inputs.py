@@ -32,6 +32,8 @@ class InputsComponent(BaseComponent):
         *args: Any,
         **kwargs
     ):
+        if self._tracer is not None:
+            return self._tracer.record(self, args, kwargs)
         if not self.outputs: # NOTE: run once
             self._init_output(args)
         for arg, output in zip(args, self.outputs):
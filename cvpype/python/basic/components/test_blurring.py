@@ -0,0 +1,104 @@
+# Built-in
+import unittest
+
+# Third party
+import numpy as np
+
+# Project-Components
+from cvpype.python.basic.components.blurring import BilateralBlurringComponent
+
+
+def create_component(
+    **kwargs
+) -> BilateralBlurringComponent:
+    component = BilateralBlurringComponent(**kwargs)
+    component.visualizer.is_operating = False
+    return component
+
+
+def step_image(
+    seed: int = 0,
+) -> np.ndarray:
+    """! A dark stripe on a bright background with noise.
+    """
+    rng = np.random.default_rng(seed)
+    image = np.full((50, 160), 200, dtype=np.float64)
+    image[:, 60:90] = 40
+    image += rng.normal(0, 8, size=image.shape)
+    return np.clip(image, 0, 255).astype(np.uint8)
+
+
+class TestBilateralBlurringComponent(unittest.TestCase):
+    def test_modes(self):
+        image = step_image()
+        for mode in BilateralBlurringComponent.MODES:
+            with self.subTest(mode=mode):
+                blurred = create_component(mode=mode, ksize=5).run(image)['image']
+                self.assertEqual(image.shape, blurred.shape)
+                self.assertEqual(np.uint8, blurred.dtype)
+                # NOTE: The noise is reduced and the stripe is kept.
+                self.assertLess(blurred[:, 5:55].std(), image[:, 5:55].std())
+                self.assertLess(blurred[:, 65:85].mean(), 60)
+                self.assertGreater(blurred[:, 100:150].mean(), 180)
+
+    def test_constant_image(self):
+        image = np.full((20, 40), 123, dtype=np.uint8)
+        for mode in BilateralBlurringComponent.MODES:
+            with self.subTest(mode=mode):
+                blurred = create_component(mode=mode).run(image)['image']
+                self.assertTrue((np.abs(blurred.astype(int) - 123) <= 1).all())
+
+    def test_guided_preserves_edges(self):
+        image = step_image()
+        box = create_component(mode='box', ksize=9).run(image)['image'].astype(int)
+        guided = create_component(mode='guided', ksize=9, scale=1).run(image)['image'].astype(int)
+        # NOTE: The contrast across the edge at x=60.
+        self.assertGreater(
+            (guided[:, 57] - guided[:, 62]).mean(),
+            (box[:, 57] - box[:, 62]).mean(),
+        )
+
+    def test_presets(self):
+        for preset, params in BilateralBlurringComponent.PRESETS.items():
+            component = create_component(preset=preset)
+            self.assertEqual(params['mode'], component.mode)
+            self.assertEqual(preset, component.preset)
+        self.assertEqual('bilateral', create_component().mode)
+
+    def test_output_rows(self):
+        image = step_image()
+        for mode in BilateralBlurringComponent.MODES:
+            with self.subTest(mode=mode):
+                expected = create_component(mode=mode).run(image)['image']
+                component = create_component(mode=mode)
+                component.set_output_rows((20, 30))
+                actual = component.run(image)['image']
+                self.assertEqual(image.shape, actual.shape)
+                self.assertFalse(actual[:20].any())
+                self.assertFalse(actual[30:].any())
+                # NOTE: The downsampled modes are exact for a band aligned to the downsampling.
+                self.assertEqual(expected[20:30].tolist(), actual[20:30].tolist())
+
+    def test_output_rows_sigma_space(self):
+        image = step_image()
+        expected = create_component(sigma_space=20).run(image)['image']
+        component = create_component(sigma_space=20)
+        self.assertEqual(30, component.row_halo)
+        component.set_output_rows((20, 30))
+        self.assertEqual(expected[20:30].tolist(), component.run(image)['image'][20:30].tolist())
+        with self.assertRaises(ValueError):
+            component.run(image, sigma_space=10)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            BilateralBlurringComponent(mode='unknown')
+        with self.assertRaises(ValueError):
+            BilateralBlurringComponent(preset='unknown')
+        with self.assertRaises(ValueError):
+            BilateralBlurringComponent(mode='median', ksize=4)
+        with self.assertRaises(ValueError):
+            BilateralBlurringComponent(mode='guided', scale=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Built-in
+import unittest
+
+# Third party
+import cv2
+import numpy as np
+
+# Project-Components
+from cvpype.python.basic.components.edgedetecting import (
+    EdgeDetectingComponent,
+    sample_gradient_magnitudes
+)
+
+
+def create_component(
+    **kwargs
+) -> EdgeDetectingComponent:
+    component = EdgeDetectingComponent(**kwargs)
+    component.visualizer.is_operating = False
+    return component
+
+
+def stripes_image(
+    gain: float = 1.0,
+    seed: int = 0,
+) -> np.ndarray:
+    """! Blurred dark stripes on a bright background with noise, scaled by `gain`.
+    """
+    rng = np.random.default_rng(seed)
+    image = np.full((50, 320), 200, dtype=np.float64)
+    for x in (40, 150, 260):
+        image[:, x:x + 20] = 40
+    image += rng.normal(0, 6, size=image.shape)
+    image = cv2.GaussianBlur(image, (5, 5), 0)
+    return np.clip(image * gain, 0, 255).astype(np.uint8)
+
+
+def edge_density(
+    edge_image: np.ndarray,
+) -> float:
+    return np.count_nonzero(edge_image) / edge_image.size
+
+
+class TestSampleGradientMagnitudes(unittest.TestCase):
+    def test_matches_sobel(self):
+        # NOTE: On a linear ramp, the Sobel derivatives are 4 central differences.
+        y, x = np.mgrid[0:20, 0:40]
+        image = (3 * x + 2 * y).astype(np.uint8)
+        dx = cv2.Sobel(image, cv2.CV_16S, 1, 0).astype(int)
+        dy = cv2.Sobel(image, cv2.CV_16S, 0, 1).astype(int)
+        expected = (np.abs(dx) + np.abs(dy))[1:-1:4, 1:-1:4].ravel()
+        self.assertEqual(expected.tolist(), sample_gradient_magnitudes(image, step=4).tolist())
+
+    def test_small_image(self):
+        self.assertEqual(0, len(sample_gradient_magnitudes(np.zeros((2, 10), dtype=np.uint8))))
+
+
+class TestEdgeDetectingComponent(unittest.TestCase):
+    def test_fixed_mode(self):
+        image = stripes_image()
+        expected = cv2.Canny(image, 100, 200)
+        self.assertEqual(expected.tolist(), create_component().run(image)['image'].tolist())
+
+    def test_adaptive_density_is_stable(self):
+        fixed = create_component()
+        densities = {'fixed': [], 'adaptive': []}
+        for gain in (0.3, 1.0):
+            adaptive = create_component(mode='adaptive')
+            densities['fixed'].append(edge_density(fixed.run(stripes_image(gain))['image']))
+            densities['adaptive'].append(edge_density(adaptive.run(stripes_image(gain))['image']))
+        # NOTE: The fixed thresholds lose the edges of the dark image.
+        self.assertLess(densities['fixed'][0], densities['fixed'][1] / 2)
+        self.assertAlmostEqual(densities['adaptive'][0], densities['adaptive'][1], delta=0.01)
+        self.assertGreater(densities['adaptive'][0], 0)
+
+    def test_smoothing(self):
+        component = create_component(mode='adaptive', smoothing=0.5)
+        component.run(stripes_image(1.0))
+        bright = component.high_threshold
+        component.run(stripes_image(0.5, seed=1))
+        once = component.high_threshold
+        for seed in range(2, 12):
+            component.run(stripes_image(0.5, seed=seed))
+        settled = component.high_threshold
+        self.assertLess(settled, once)
+        self.assertLess(once, bright)
+        # NOTE: Halfway to the threshold of the darker image, which is about half.
+        self.assertAlmostEqual(bright * 0.75, once, delta=bright * 0.1)
+        self.assertEqual((component.ratio * settled, settled), component.thresholds)
+
+        component.reset()
+        self.assertIsNone(component.high_threshold)
+
+    def test_flat_image(self):
+        component = create_component(mode='adaptive')
+        edge_image = component.run(np.full((20, 40), 100, dtype=np.uint8))['image']
+        self.assertFalse(edge_image.any())
+        self.assertEqual(component.min_threshold, component.high_threshold)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            EdgeDetectingComponent(mode='unknown')
+        with self.assertRaises(ValueError):
+            EdgeDetectingComponent(smoothing=0)
+        with self.assertRaises(ValueError):
+            EdgeDetectingComponent(step=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
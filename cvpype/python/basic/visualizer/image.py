@@ -43,10 +43,14 @@ class ImageVisualizer(BaseVisualizer):
         self.web_streaming = True
         self.is_threading = True
 
-    def __call__(self, *args, **kwargs):
-        ret = super().__call__(*args, **kwargs)
-        if self.is_operating:
-            self.show(ret)
+    def render(
+        self,
+        *args,
+        **kwargs
+    ):
+        ret = super().render(*args, **kwargs)
+        self.show(ret)
+        return ret
 
     def paint(
         self,
@@ -1,11 +1,28 @@
 # Third party
+import cv2
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 # Project-Visualizers
 from cvpype.python.core.visualizer.base import BaseVisualizer
 
+# Project-Outputstream
+from cvpype.python.backend.web.streamer.rtimage import RealtimeImageWebStreamer # FIXME
+
 
 class MatPltVisualizer(BaseVisualizer):
+    """! Visualizer that draws on a matplotlib figure.
+
+    Artists registered with `animate` are updated by blitting: the static
+    part of the figure (axes, ticks, grid, legend) is drawn once and cached,
+    and each update only restores the cache and redraws the animated
+    artists. The whole figure is redrawn only when the layout changes
+    (e.g. axis limits), so subclasses should change limits rarely
+    (see `fit_limits`).
+    """
     def __init__(
         self,
         name: str,
@@ -13,26 +30,133 @@ class MatPltVisualizer(BaseVisualizer):
     ) -> None:
         super().__init__(name, is_operating)
         self.fig = plt.figure()
+        self.animated_artists: list[Artist] = []
+        self.use_blit = True
+        self.web_streaming = False  # FIXME: dirty
+        self._background = None
+        self._layout = None
+        self.n_full_draws = 0
+
+    def animate(
+        self,
+        *artists: Artist
+    ) -> None:
+        """! Registers artists that change every update.
+        """
+        for artist in artists:
+            artist.set_animated(True)
+            self.animated_artists.append(artist)
 
-    def __call__(
+    # FIXME: dirty
+    def set_web_streamer(
+        self,
+        streamer: RealtimeImageWebStreamer
+    ):
+        """! Renders the figure headless (into an Agg buffer) and publishes
+        it to `streamer` as a BGR image, instead of showing a window.
+        """
+        FigureCanvasAgg(self.fig)
+        self.web_streamer = streamer
+        self.web_streaming = True
+        self.is_threading = True
+        self._background = None
+
+    @staticmethod
+    def fit_limits(
+        ax: Axes,
+        axis: str,
+        low: float,
+        high: float,
+        headroom: float = 0.25,
+    ) -> bool:
+        """! Changes the limits of `ax` only when `[low, high]` does not fit
+        in the current limits, or fills less than a quarter of them.
+        Changing the limits forces a full redraw of the figure.
+
+        @param axis `x` or `y`.
+        @param headroom The margin added above `high`, relative to `high - low`.
+
+        @return `True` if the limits were changed.
+        """
+        get_lim, set_lim = (
+            (ax.get_xlim, ax.set_xlim) if axis == 'x' else (ax.get_ylim, ax.set_ylim)
+        )
+        current_low, current_high = get_lim()
+        span = max(high - low, 1)
+        if (
+            current_low <= low and high <= current_high and
+            (current_high - current_low) <= span * 4
+        ):
+            return False
+        set_lim(low, high + span * headroom)
+        return True
+
+    def _layout_key(
+        self
+    ) -> tuple:
+        return (
+            self.fig.bbox.bounds,
+            tuple((ax.get_xlim(), ax.get_ylim()) for ax in self.fig.axes),
+        )
+
+    def render(
         self,
         *args,
         **kwargs
     ):
-        super().__call__(*args, **kwargs)
-        if self.is_operating:
-            self.draw()
+        ret = super().render(*args, **kwargs)
+        self.draw()
+        return ret
 
     def draw(
         self,
         *args,
         **kwargs
     ) -> None:
-        self.fig.canvas.draw()
+        canvas = self.fig.canvas
+        if self.animated_artists and self.use_blit and not canvas.supports_blit:
+            self.logger.warning(
+                f'The backend of `{self.name}` does not support blitting. '
+                'Redraw the whole figure every update.'
+            )
+            self.use_blit = False
+            for artist in self.animated_artists:
+                artist.set_animated(False)
+        if not (self.animated_artists and self.use_blit):
+            canvas.draw()
+            self.n_full_draws += 1
+        else:
+            layout = self._layout_key()
+            if self._background is None or layout != self._layout:
+                # NOTE: Animated artists are excluded from a full draw.
+                canvas.draw()
+                self._background = canvas.copy_from_bbox(self.fig.bbox)
+                self._layout = layout
+                self.n_full_draws += 1
+            else:
+                canvas.restore_region(self._background)
+            for artist in self.animated_artists:
+                self.fig.draw_artist(artist)
+            if not self.web_streaming:
+                canvas.blit(self.fig.bbox)
+        if self.web_streaming:
+            self.web_streamer(self.to_image())
+        else:
+            canvas.flush_events()
+
+    def to_image(
+        self
+    ) -> np.ndarray:
+        """! Returns the last rendered figure as a BGR image.
+        """
+        rgba = np.asarray(self.fig.canvas.buffer_rgba())
+        return cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGR)
 
     def runtime_init(
         self
     ):
+        if self.web_streaming:
+            return
         plt.show()
         try:
             self.fig.canvas.set_window_title(self.name)
@@ -0,0 +1,89 @@
+# Built-in
+import unittest
+
+# Third party
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Project-Visualizers
+from cvpype.python.applications.visualizer.coord import CoordsHistogramVisualizer
+
+# Project-Streamers
+from cvpype.python.backend.web.streamer.rtimage import RealtimeImageWebStreamer
+
+
+class TestMatPltVisualizer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # NOTE: The figures are rendered headless, and the global state of
+        # pyplot is restored for the other tests of the session.
+        cls.backend = matplotlib.get_backend()
+        cls.interactive = plt.isinteractive()
+        plt.switch_backend('Agg')
+
+    @classmethod
+    def tearDownClass(cls):
+        plt.switch_backend(cls.backend)
+        plt.interactive(cls.interactive)
+
+    def setUp(self):
+        self.visualizer = CoordsHistogramVisualizer('histogram')
+        self.streamer = RealtimeImageWebStreamer()
+        self.visualizer.set_web_streamer(self.streamer)
+
+    def tearDown(self):
+        plt.close(self.visualizer.fig)
+
+    def update(
+        self,
+        widths: list[int]
+    ) -> None:
+        self.visualizer(
+            [(0, w) for w in widths],
+            parse_fn=(lambda x1, x2: abs(x1 - x2)),
+            parse_history_fn=(lambda li: len(li))
+        )
+
+    def test_headless_rendering_is_published(self):
+        self.update([5, 10, 15])
+        frame = self.streamer.output_frame
+        width, height = self.visualizer.fig.canvas.get_width_height()
+        self.assertEqual((height, width, 3), frame.shape)
+        self.assertEqual(np.uint8, frame.dtype)
+
+    def test_blitting_redraws_only_when_limits_change(self):
+        for _ in range(10):
+            self.update([5, 10, 15])
+        self.assertEqual(1, self.visualizer.n_full_draws)
+        # NOTE: The data still fits in the current limits.
+        for _ in range(10):
+            self.update([6, 11, 14])
+        self.assertEqual(1, self.visualizer.n_full_draws)
+        self.update([5, 10, 100])
+        self.assertEqual(2, self.visualizer.n_full_draws)
+
+    def test_blitted_image_matches_full_redraw(self):
+        for i in range(5):
+            self.update([5, 10 + i, 15])
+        blitted = self.streamer.output_frame.copy()
+        for artist in self.visualizer.animated_artists:
+            artist.set_animated(False)
+        self.visualizer.fig.canvas.draw()
+        redrawn = self.visualizer.to_image()
+        # NOTE: Blitted artists are drawn above the grid, so a few pixels differ.
+        different = np.any(blitted != redrawn, axis=2)
+        self.assertLess(different.mean(), 0.01)
+
+    def test_fit_limits(self):
+        ax = self.visualizer.ax_line
+        ax.set_ylim(0, 10)
+        self.assertFalse(self.visualizer.fit_limits(ax, 'y', 0, 8))
+        self.assertTrue(self.visualizer.fit_limits(ax, 'y', 0, 20))
+        self.assertEqual((0, 25), ax.get_ylim())
+        # NOTE: Shrinks when the data fills less than a quarter.
+        self.assertTrue(self.visualizer.fit_limits(ax, 'y', 0, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
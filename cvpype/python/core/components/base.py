@@ -1,8 +1,12 @@
 # Built-in
 import logging
+from time import perf_counter_ns
 from abc import ABC, abstractmethod
 from typing import Any
 
+# Third party
+import numpy as np
+
 # Project
 from cvpype.python.iospec import ComponentIOSpec
 
@@ -12,6 +16,9 @@ from cvpype.python.core.types.base import BaseType
 # Project-Visualizers
 from cvpype.python.core.visualizer.base import BaseVisualizer
 
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
+
 # Configure the root logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -244,7 +251,33 @@ class _OutputsComponentTool():
             output.data_container.data = ret
 
 
+class _CallPlan():
+    """! Precompiled call plan of a component in the trusted mode.
+
+    The plan holds everything `__call__` needs after validation has been
+    done, so that a trusted call is reduced to unwrapping the arguments,
+    calling `run()` and writing the returned values into the output specs.
+    """
+    __slots__ = ('outputs_by_name', 'returns')
+
+    def __init__(
+        self,
+        outputs_by_name: dict,
+        returns: Any,
+    ) -> None:
+        self.outputs_by_name = outputs_by_name
+        self.returns = returns
+
+
 class BaseComponent(ABC):
+    # NOTE: The number of input rows above and below an output row that
+    # the output row depends on (e.g. the radius of a filter kernel).
+    # `None` if the component cannot compute a band of rows of its output.
+    row_halo: int | None = None
+    # NOTE: The minimum number of rows of a band, for operations that are
+    # slower on short images.
+    min_band_rows: int = 0
+
     def __init__(
         self,
         visualizer: BaseVisualizer,
@@ -252,6 +285,14 @@ class BaseComponent(ABC):
     ) -> None:
         self.do_logging = do_logging
         self.visualizer = visualizer
+        self.validation_frames = None
+        self.output_rows = None
+        self._n_validated_calls = 0
+        self._call_plan = None
+        self._tracer = None
+        # NOTE: The key of the latency of `run()` in `PROFILER`.
+        # Pipelines replace it with the attribute name of the component.
+        self.profile_key = f'component.{self.__class__.__name__}'
 
     @abstractmethod
     def __call__(
@@ -276,6 +317,120 @@ class BaseComponent(ABC):
     ):
         self.visualizer(*args, **kwargs)
 
+    def set_validation_frames(
+        self,
+        validation_frames: int | None,
+    ):
+        """! The function `set_validation_frames` selects how many calls of
+        the component are fully validated before the component is trusted.
+
+        While validating, every call checks the given arguments and the
+        return value of `run()` against the input and output specs.
+        Once `validation_frames` calls have passed, a call plan is compiled
+        and later calls skip all the checks (trusted mode).
+
+        @param validation_frames The number of validated calls before
+        switching to the trusted mode. `None` validates every call
+        (debugging mode), and `0` trusts the component from the first call.
+        """
+        if validation_frames is not None and validation_frames < 0:
+            raise ValueError(
+                '`validation_frames` should be None or a non-negative integer. '
+                f'Current value: `{validation_frames}`'
+            )
+        self.validation_frames = validation_frames
+        self._n_validated_calls = 0
+        self._call_plan = None
+        if validation_frames == 0:
+            self._call_plan = self.compile_call_plan()
+
+    @property
+    def is_trusted(
+        self
+    ) -> bool:
+        return self._call_plan is not None
+
+    def compile_call_plan(
+        self
+    ) -> _CallPlan | None:
+        """! The function `compile_call_plan` builds the call plan used
+        in the trusted mode. Components without specs have nothing
+        to precompile and return `None`.
+        """
+        return None
+
+    def set_output_rows(
+        self,
+        rows: tuple[int, int] | None,
+    ):
+        """! The function `set_output_rows` lets the component compute
+        only the rows `[start, end)` of its output image. The other rows
+        of the output are zeros. It is usually called by
+        `PipelineGraph.plan_rows` with the rows the consumers of the output read.
+
+        @param rows The `(start, end)` rows to compute. `None` computes every row.
+        """
+        if rows is not None and self.row_halo is None:
+            raise ValueError(
+                f'`{self.__class__.__name__}` cannot compute a band of rows of its output.'
+            )
+        self.output_rows = None if rows is None else (int(rows[0]), int(rows[1]))
+
+    def required_rows(
+        self,
+        input_index: int,
+    ) -> tuple[int, int] | None:
+        """! The function `required_rows` returns the rows `[start, end)`
+        of the `input_index`-th input that `run()` reads, or `None` if it
+        reads every row. By default, a component computing `output_rows`
+        reads them with `row_halo` rows above and below, extended to
+        `min_band_rows` rows.
+        """
+        if self.output_rows is None or self.row_halo is None:
+            return None
+        output_start, output_end = self.output_rows
+        start = max(output_start - self.row_halo, 0)
+        end = output_end + self.row_halo
+        if self.min_band_rows:
+            # NOTE: The height of the image is not known here, so the band
+            # is extended both ways to keep `min_band_rows` rows
+            # even when it is clipped at the top or the bottom of the image.
+            end = max(end, start + self.min_band_rows)
+            start = max(min(start, output_end - self.min_band_rows), 0)
+        return (start, end)
+
+    def run_on_output_rows(
+        self,
+        fn,
+        image: np.ndarray,
+        *args: Any,
+    ) -> np.ndarray:
+        """! The function `run_on_output_rows` applies a row-local image
+        operation `fn(image, *args)` to the rows of `image` given by
+        `required_rows(0)`, and places the `output_rows` of the result
+        in a zero image of the height of `image`.
+        Without `output_rows`, it simply returns `fn(image, *args)`.
+        """
+        if self.output_rows is None:
+            return fn(image, *args)
+        height = image.shape[0]
+        start, end = self.required_rows(0)
+        band = fn(image[start:end], *args)
+        output = np.zeros((height,) + band.shape[1:], dtype=band.dtype)
+        output_start, output_end = self.output_rows
+        output_end = min(output_end, height)
+        output[output_start:output_end] = band[output_start - start:output_end - start]
+        return output
+
+    def _count_validated_call(
+        self
+    ):
+        if self.validation_frames is None:
+            return
+        self._n_validated_calls += 1
+        if self._n_validated_calls >= self.validation_frames:
+            self._call_plan = self.compile_call_plan()
+
 
 class InputsOnlyBaseComponent(BaseComponent, _InputsComponentTool):
     def __init__(
@@ -291,12 +446,29 @@ class InputsOnlyBaseComponent(BaseComponent, _InputsComponentTool):
         *args: ComponentIOSpec,
         **kwargs: Any,
     ):
+        if self._call_plan is not None:
+            PROFILER.call(
+                self.profile_key,
+                self.run,
+                *[arg.data_container.data for arg in args],
+                **kwargs
+            )
+            return
+        if self._tracer is not None:
+            return self._tracer.record(self, args, kwargs)
+
         self.move_to_input(args)
         unwrapped_args = []
         for input_ in self.inputs:
             unwrapped_args.append(input_.data_container.data)
 
-        self.run(*unwrapped_args, **kwargs)
+        PROFILER.call(self.profile_key, self.run, *unwrapped_args, **kwargs)
+        self._count_validated_call()
+
+    def compile_call_plan(
+        self
+    ) -> _CallPlan:
+        return _CallPlan(outputs_by_name={}, returns=None)
 
     @abstractmethod
     def run(
@@ -323,18 +495,45 @@ class IOBaseComponent(BaseComponent, _InputsComponentTool, _OutputsComponentTool
         *args: Any,
         **kwargs: Any
     ) -> Any:
+        plan = self._call_plan
+        if plan is not None:
+            unwrapped_args = [arg.data_container.data for arg in args]
+            if PROFILER.enabled:
+                t0 = perf_counter_ns()
+                rets = self.run(*unwrapped_args, **kwargs)
+                PROFILER.record(self.profile_key, perf_counter_ns() - t0)
+            else:
+                rets = self.run(*unwrapped_args, **kwargs)
+            outputs_by_name = plan.outputs_by_name
+            for name, ret in rets.items():
+                outputs_by_name[name].data_container.data = ret
+            return plan.returns
+        if self._tracer is not None:
+            return self._tracer.record(self, args, kwargs)
+
         self.move_to_input(args)
         unwrapped_args = []
         for input_ in self.inputs:
             unwrapped_args.append(input_.data_container.data)
 
-        rets = self.run(*unwrapped_args, **kwargs)
+        rets = PROFILER.call(self.profile_key, self.run, *unwrapped_args, **kwargs)
 
         self.move_to_output(rets)
+        self._count_validated_call()
         if len(self.outputs) > 1:
             return self.outputs
         return self.outputs[0]
 
+    def compile_call_plan(
+        self
+    ) -> _CallPlan:
+        # NOTE: Specs are stored instead of data containers because
+        # `change_output_type` replaces the data container of a spec.
+        return _CallPlan(
+            outputs_by_name={o.name: o for o in self.outputs},
+            returns=(self.outputs if len(self.outputs) > 1 else self.outputs[0]),
+        )
+
     @abstractmethod
     def run(
         self,
@@ -0,0 +1,483 @@
+# Built-in
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Iterable, Iterator, Union
+
+# Third party
+import numpy as np
+
+# Project
+from cvpype.python.iospec import ComponentIOSpec
+
+# Project-Pipelines
+from cvpype.python.core.pipelines.graph import PipelineGraph, PipelineNode
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
+from cvpype.python.utils.tracing import TRACER
+
+
+class _StageFailure():
+    """! Carries an exception raised in a stage to the consumer of the executor.
+    """
+    __slots__ = ('seq', 'stage', 'error')
+
+    def __init__(
+        self,
+        seq: int,
+        stage: str,
+        error: BaseException,
+    ) -> None:
+        self.seq = seq
+        self.stage = stage
+        self.error = error
+
+
+_STOP = object()
+
+
+class PipelinedExecutor():
+    """! Runs each stage of a compiled pipeline graph on its own worker thread.
+
+    Stages are connected by bounded queues, so frame N+1 can be processed by
+    an upstream stage while frame N is still in a downstream stage.
+    Throughput approaches `1 / (slowest stage)` instead of
+    `1 / (sum of stages)` as long as the stages release the GIL
+    (which most OpenCV functions do).
+
+    Unlike `PipelineGraph.__call__`, the data of each frame travels between
+    the stages in its own dictionary instead of the shared output specs,
+    so the results are returned as plain data (not `ComponentIOSpec`).
+    Results are returned in the order of submission.
+
+    Visualizers are called from the worker threads. Turn them off or
+    use the web streaming mode, because some OS cannot show windows
+    from a thread.
+    """
+
+    def __init__(
+        self,
+        graph: PipelineGraph,
+        queue_size: int = 2,
+        stages: list[list[str]] | None = None,
+        latency_history: int = 1000,
+    ) -> None:
+        """! Starts one worker thread per stage.
+
+        @param graph The compiled graph of a pipeline (see `BasePipeline.compile`).
+        @param queue_size The capacity of the queue in front of each stage.
+        `submit` blocks when the first queue is full.
+        @param stages Node names grouped by stage, in topological order.
+        By default, each node that calls `run()` becomes its own stage,
+        and passthrough nodes (e.g. `InputsComponent`) join the next stage.
+        @param latency_history The number of recent frame latencies to keep.
+        """
+        if queue_size < 1:
+            raise ValueError(
+                f'`queue_size` should be a positive integer. Current value: `{queue_size}`'
+            )
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.graph = graph
+        self.stages = self._group_stages(stages)
+        self._constants = self._collect_constants()
+        self._queues = [
+            queue.Queue(maxsize=queue_size)
+            for _ in range(len(self.stages) + 1)
+        ]
+        self._busy_ns = [0] * len(self.stages)
+        self._latencies_ns = deque(maxlen=latency_history)
+        self._n_submitted = 0
+        self._n_completed = 0
+        self._started_at = None
+        self._closed = False
+        self._workers = []
+        for i, stage in enumerate(self.stages):
+            worker = threading.Thread(
+                target=self._work,
+                args=(i, stage),
+                name=f'{self.__class__.__name__}-stage{i}',
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _group_stages(
+        self,
+        stages: list[list[str]] | None,
+    ) -> list[list[PipelineNode]]:
+        if stages is not None:
+            grouped = [[self.graph.node(name) for name in stage] for stage in stages]
+            names = [node.name for stage in grouped for node in stage]
+            expected = [node.name for node in self.graph.nodes]
+            if sorted(names) != sorted(expected):
+                raise ValueError(
+                    'Every node of the graph should be assigned to exactly one stage. '
+                    f'(Nodes: {expected})'
+                )
+            order = {node.name: i for i, node in enumerate(self.graph.nodes)}
+            flattened = [order[name] for name in names]
+            if flattened != sorted(flattened):
+                raise ValueError(
+                    'Stages should follow the topological order of the graph. '
+                    f'(Nodes: {expected})'
+                )
+            return grouped
+        grouped = []
+        pending = []
+        for node in self.graph.nodes:
+            pending.append(node)
+            if not node.is_passthrough:
+                grouped.append(pending)
+                pending = []
+        if pending:
+            if grouped:
+                grouped[-1].extend(pending)
+            else:
+                grouped.append(pending)
+        return grouped
+
+    def _collect_constants(
+        self
+    ) -> dict[int, Any]:
+        known = {id(input_) for input_ in self.graph.inputs}
+        known.update(self.graph.producers.keys())
+        constants = {}
+        for node in self.graph.nodes:
+            for src in node.sources:
+                if id(src) not in known:
+                    constants[id(src)] = src.data_container.data
+        return constants
+
+    @staticmethod
+    def _execute(
+        node: PipelineNode,
+        values: dict[int, Any],
+    ) -> None:
+        if node.is_passthrough:
+            for src, dst in zip(node.sources, node.outputs):
+                values[id(dst)] = values[id(src)]
+            return
+        rets = PROFILER.call(
+            node.component.profile_key,
+            node.component.run,
+            *[values[id(src)] for src in node.sources],
+            **node.kwargs
+        )
+        if node.outputs:
+            outputs_by_name = node.outputs_by_name
+            for name, ret in rets.items():
+                values[id(outputs_by_name[name])] = ret
+
+    def _work(
+        self,
+        index: int,
+        stage: list[PipelineNode],
+    ) -> None:
+        in_queue = self._queues[index]
+        out_queue = self._queues[index + 1]
+        name = ', '.join(node.name for node in stage)
+        while True:
+            item = in_queue.get()
+            if item is _STOP:
+                out_queue.put(_STOP)
+                return
+            seq, values, submitted_at = item
+            if not isinstance(values, _StageFailure):
+                TRACER.set_frame_id(seq)
+                t0 = time.perf_counter_ns()
+                try:
+                    for node in stage:
+                        self._execute(node, values)
+                except Exception as e:
+                    self.logger.exception(f'Stage {index} ({name}) failed on frame {seq}.')
+                    values = _StageFailure(seq, name, e)
+                self._busy_ns[index] += time.perf_counter_ns() - t0
+            out_queue.put((seq, values, submitted_at))
+
+    def submit(
+        self,
+        *args: Any
+    ) -> int:
+        """! Submits the arguments of a single pipeline call.
+        Blocks while the first stage queue is full.
+
+        @return the sequence number of the submitted frame.
+        """
+        if self._closed:
+            raise RuntimeError('The executor is already closed.')
+        assert len(args) == len(self.graph.inputs), (
+            f'The graph has {len(self.graph.inputs)} inputs, '
+            f'but {len(args)} input(s) was given.'
+        )
+        values = dict(self._constants)
+        for arg, input_ in zip(args, self.graph.inputs):
+            if isinstance(arg, ComponentIOSpec):
+                values[id(input_)] = arg.data_container.data
+            else:
+                values[id(input_)] = arg
+        if self._started_at is None:
+            self._started_at = time.perf_counter_ns()
+        seq = self._n_submitted
+        self._n_submitted += 1
+        self._queues[0].put((seq, values, time.perf_counter_ns()))
+        return seq
+
+    def get(
+        self,
+        timeout: float | None = None,
+    ) -> Any:
+        """! Returns the outputs of the oldest submitted frame that is not
+        returned yet. Raises the exception of a failed stage, if any.
+        """
+        item = self._queues[-1].get(timeout=timeout)
+        if item is _STOP:
+            raise RuntimeError('The executor is closed.')
+        seq, values, submitted_at = item
+        self._n_completed += 1
+        self._latencies_ns.append(time.perf_counter_ns() - submitted_at)
+        if isinstance(values, _StageFailure):
+            raise RuntimeError(
+                f'Stage ({values.stage}) failed on frame {values.seq}.'
+            ) from values.error
+        outputs = self.graph.outputs
+        if outputs is None:
+            return None
+        if isinstance(outputs, list):
+            return [values[id(o)] for o in outputs]
+        return values[id(outputs)]
+
+    def map(
+        self,
+        iterable: Iterable,
+    ) -> Iterator:
+        """! Runs the pipeline on every element of `iterable` while keeping
+        every stage busy, and yields the outputs in order.
+        Each element is either a single argument or a tuple of arguments.
+        """
+        n_pending = 0
+        depth = len(self.stages) * (self._queues[0].maxsize + 1)
+        for args in iterable:
+            if not isinstance(args, tuple):
+                args = (args,)
+            self.submit(*args)
+            n_pending += 1
+            if n_pending >= depth:
+                yield self.get()
+                n_pending -= 1
+        for _ in range(n_pending):
+            yield self.get()
+
+    def stats(
+        self
+    ) -> dict:
+        """! Returns the throughput, the latency percentiles of the completed
+        frames and the busy time of each stage.
+        """
+        latencies_ms = np.array(self._latencies_ns, dtype=np.float64) / 1e6
+        elapsed_s = (
+            (time.perf_counter_ns() - self._started_at) / 1e9
+            if self._started_at is not None else 0.0
+        )
+        stats = {
+            'n_completed': self._n_completed,
+            'throughput_fps': (self._n_completed / elapsed_s) if elapsed_s else 0.0,
+            'stages': [
+                {
+                    'nodes': [node.name for node in stage],
+                    'busy_ms_per_frame': (
+                        busy / 1e6 / self._n_completed if self._n_completed else 0.0
+                    ),
+                }
+                for stage, busy in zip(self.stages, self._busy_ns)
+            ],
+        }
+        if len(latencies_ms):
+            stats.update({
+                'latency_p50_ms': float(np.percentile(latencies_ms, 50)),
+                'latency_p95_ms': float(np.percentile(latencies_ms, 95)),
+                'latency_max_ms': float(latencies_ms.max()),
+            })
+        return stats
+
+    def close(
+        self
+    ) -> None:
+        """! Stops the workers after every submitted frame is processed.
+        Results that were not taken with `get` are discarded.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        # NOTE: When every queue is full, the stop sentinel only fits after
+        # the results are taken, so they are drained while it waits.
+        while True:
+            try:
+                self._queues[0].put(_STOP, timeout=0.01)
+                break
+            except queue.Full:
+                try:
+                    self._queues[-1].get_nowait()
+                except queue.Empty:
+                    pass
+        while True:
+            if self._queues[-1].get() is _STOP:
+                break
+        for worker in self._workers:
+            worker.join()
+
+    def __enter__(
+        self
+    ):
+        return self
+
+    def __exit__(
+        self,
+        *args
+    ):
+        self.close()
+
+
+class BranchParallelExecutor():
+    """! Runs independent branches of a compiled pipeline graph concurrently.
+
+    A node becomes ready when all of its producers have finished. When more
+    than one node is ready (e.g. `LineFindingComponent` and the intersection
+    branch, which both only depend on the edge image), all but one of them
+    are dispatched to a thread pool and the last one runs on the calling
+    thread. Passthrough nodes (e.g. the inputs of a nested pipeline) run
+    inline as soon as they are ready. Consumers with several producers (e.g.
+    `SDVLineVisualizationComponent`) wait until every branch has joined.
+    A graph without branches runs exactly like `PipelineGraph.__call__`.
+
+    Frames are processed one at a time and the results are written into the
+    output specs, so the executor is a drop-in replacement for the graph.
+    Since OpenCV releases the GIL, branches overlap on multi-core machines.
+    Visualizers of the dispatched nodes are called from the pool threads.
+    """
+
+    def __init__(
+        self,
+        graph: PipelineGraph,
+        max_workers: int = 2,
+    ) -> None:
+        """! Creates the thread pool.
+
+        @param graph The compiled graph of a pipeline (see `BasePipeline.compile`).
+        @param max_workers The maximum number of branches dispatched at the same time,
+        in addition to the calling thread.
+        """
+        if max_workers < 1:
+            raise ValueError(
+                f'`max_workers` should be a positive integer. Current value: `{max_workers}`'
+            )
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.graph = graph
+        self._nodes_by_index = {node.index: node for node in graph.nodes}
+        self._n_predecessors = {
+            index: len(predecessors)
+            for index, predecessors in graph.predecessors.items()
+        }
+        self._roots = [
+            node for node in graph.nodes
+            if not graph.predecessors[node.index]
+        ]
+        self.branch_points = [
+            node for node in graph.nodes
+            if len(graph.successors[node.index]) > 1
+        ]
+        self._pool = None
+        if self.branch_points:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=self.__class__.__name__,
+            )
+        else:
+            self.logger.info(
+                'The graph has no independent branches. Nodes run serially.'
+            )
+
+    @staticmethod
+    def _execute_in_frame(
+        node: PipelineNode,
+        frame_id: int | None,
+    ) -> None:
+        # NOTE: The events of the pool thread belong to the frame of the caller.
+        TRACER.set_frame_id(frame_id)
+        node.execute()
+
+    def _release(
+        self,
+        node: PipelineNode,
+        n_pending: dict[int, int],
+        ready: list[PipelineNode],
+    ) -> None:
+        for successor in self.graph.successors[node.index]:
+            n_pending[successor] -= 1
+            if n_pending[successor] == 0:
+                ready.append(self._nodes_by_index[successor])
+
+    def __call__(
+        self,
+        *args: Any
+    ) -> Union[ComponentIOSpec, list[ComponentIOSpec], None]:
+        if self._pool is None:
+            return self.graph(*args)
+        self.graph.feed(*args)
+        n_pending = dict(self._n_predecessors)
+        ready = list(self._roots)
+        futures = {}
+        try:
+            while ready or futures:
+                while ready:
+                    # NOTE: Passthrough nodes (e.g. the `InputsComponent` that starts
+                    # a nested pipeline) only forward data, so they run inline first
+                    # and the components behind them are dispatched like any other.
+                    passthrough = [node for node in ready if node.is_passthrough]
+                    if passthrough:
+                        ready = [node for node in ready if not node.is_passthrough]
+                        for node in sorted(passthrough, key=lambda n: n.index):
+                            node.execute()
+                            self._release(node, n_pending, ready)
+                        continue
+                    # NOTE: Keep the traced order; the first ready node runs inline.
+                    ready.sort(key=lambda n: n.index, reverse=True)
+                    node = ready.pop()
+                    for other in ready:
+                        futures[self._pool.submit(
+                            self._execute_in_frame, other, TRACER.frame_id
+                        )] = other
+                    ready = []
+                    node.execute()
+                    self._release(node, n_pending, ready)
+                if futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node = futures.pop(future)
+                        future.result()
+                        self._release(node, n_pending, ready)
+        except BaseException:
+            if futures:
+                wait(futures)
+            raise
+        return self.graph.outputs
+
+    def close(
+        self
+    ) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    def __enter__(
+        self
+    ):
+        return self
+
+    def __exit__(
+        self,
+        *args
+    ):
+        self.close()
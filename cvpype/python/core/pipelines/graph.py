@@ -0,0 +1,364 @@
+# Built-in
+from time import perf_counter_ns
+from typing import Any, Union
+
+# Project
+from cvpype.python.iospec import ComponentIOSpec
+
+# Project-Types
+from cvpype.python.core.types.any import AnyType
+
+# Project-Components
+from cvpype.python.core.components.base import (
+    BaseComponent,
+    InputsOnlyBaseComponent,
+    IOBaseComponent
+)
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
+
+
+def _union_rows(
+    rows: tuple[int, int] | None,
+    other: tuple[int, int] | None,
+) -> tuple[int, int] | None:
+    """! The smallest band covering two bands of rows. `None` is every row.
+    """
+    if rows is None or other is None:
+        return None
+    return (min(rows[0], other[0]), max(rows[1], other[1]))
+
+
+class PipelineNode():
+    """! A single component call recorded while tracing `run()` of a pipeline.
+    """
+    __slots__ = (
+        'index', 'name', 'component', 'sources', 'kwargs',
+        'outputs', 'outputs_by_name'
+    )
+
+    def __init__(
+        self,
+        index: int,
+        name: str,
+        component: BaseComponent,
+        sources: list[ComponentIOSpec],
+        kwargs: dict,
+        outputs: list[ComponentIOSpec],
+    ) -> None:
+        self.index = index
+        self.name = name
+        self.component = component
+        self.sources = sources
+        self.kwargs = kwargs
+        self.outputs = outputs
+        self.outputs_by_name = {o.name: o for o in outputs}
+
+    @property
+    def is_passthrough(
+        self
+    ) -> bool:
+        """! `True` if the node only forwards its sources to its outputs
+        (e.g. `InputsComponent`) instead of calling `run()`.
+        """
+        return not isinstance(
+            self.component,
+            (InputsOnlyBaseComponent, IOBaseComponent)
+        )
+
+    def execute(
+        self
+    ) -> None:
+        """! Executes the node on the data currently stored in its sources
+        and writes the results into its output specs.
+        """
+        if self.is_passthrough:
+            for src, dst in zip(self.sources, self.outputs):
+                dst.data_container.data = src.data_container.data
+            return
+        rets = PROFILER.call(
+            self.component.profile_key,
+            self.component.run,
+            *[src.data_container.data for src in self.sources],
+            **self.kwargs
+        )
+        if self.outputs:
+            outputs_by_name = self.outputs_by_name
+            for name, ret in rets.items():
+                outputs_by_name[name].data_container.data = ret
+
+    def __repr__(
+        self
+    ) -> str:
+        return f'PipelineNode({self.index}, {self.name})'
+
+
+class PipelineGraph():
+    """! Executable DAG of a pipeline, created by tracing its `run()` method
+    once with sentinel `ComponentIOSpec`s.
+
+    Nodes are kept in a topologically sorted order. Calling the graph runs
+    the nodes as a flat schedule: each step calls `run()` of the component
+    directly and stores the results in the output specs of the component,
+    so the returned specs are identical to the ones `run()` of the pipeline
+    returns.
+    """
+
+    def __init__(
+        self,
+        inputs: list[ComponentIOSpec],
+        nodes: list[PipelineNode],
+        outputs: Union[ComponentIOSpec, list[ComponentIOSpec], None],
+    ) -> None:
+        self.inputs = inputs
+        self.outputs = outputs
+        self.producers: dict[int, PipelineNode] = {}
+        for node in nodes:
+            for output in node.outputs:
+                self.producers[id(output)] = node
+        self.predecessors: dict[int, list[int]] = {}
+        self.successors: dict[int, list[int]] = {n.index: [] for n in nodes}
+        for node in nodes:
+            predecessors = []
+            for src in node.sources:
+                producer = self.producers.get(id(src))
+                if producer is not None and producer.index not in predecessors:
+                    predecessors.append(producer.index)
+                    self.successors[producer.index].append(node.index)
+            self.predecessors[node.index] = predecessors
+        self.nodes = self._topological_sort(nodes)
+        self._schedule = self._compile_schedule()
+
+    @property
+    def output_specs(
+        self
+    ) -> list[ComponentIOSpec]:
+        if self.outputs is None:
+            return []
+        if isinstance(self.outputs, ComponentIOSpec):
+            return [self.outputs]
+        return list(self.outputs)
+
+    @property
+    def edges(
+        self
+    ) -> list[tuple[PipelineNode, PipelineNode, ComponentIOSpec]]:
+        """! Producer→consumer edges as `(producer, consumer, spec)` tuples.
+        """
+        edges = []
+        for node in self.nodes:
+            for src in node.sources:
+                producer = self.producers.get(id(src))
+                if producer is not None:
+                    edges.append((producer, node, src))
+        return edges
+
+    def node(
+        self,
+        name: str
+    ) -> PipelineNode:
+        for node in self.nodes:
+            if node.name == name:
+                return node
+        raise KeyError(
+            f'Node `{name}` does not exist. '
+            f'(Exist names: {[n.name for n in self.nodes]})'
+        )
+
+    def _topological_sort(
+        self,
+        nodes: list[PipelineNode],
+    ) -> list[PipelineNode]:
+        by_index = {n.index: n for n in nodes}
+        n_pending = {n.index: len(self.predecessors[n.index]) for n in nodes}
+        ready = [n.index for n in nodes if n_pending[n.index] == 0]
+        ordered = []
+        while ready:
+            # NOTE: Keep the traced order among ready nodes.
+            ready.sort()
+            index = ready.pop(0)
+            ordered.append(by_index[index])
+            for successor in self.successors[index]:
+                n_pending[successor] -= 1
+                if n_pending[successor] == 0:
+                    ready.append(successor)
+        if len(ordered) != len(nodes):
+            raise ValueError('The traced pipeline graph has a cycle.')
+        return ordered
+
+    def plan_rows(
+        self
+    ) -> dict[str, tuple[int, int] | None]:
+        """! Propagates the rows each consumer reads (`required_rows`) back
+        through the graph, and lets every component that can compute a band
+        of rows (`row_halo` is not `None`) compute only the rows its consumers read.
+
+        The outputs of the graph are demanded entirely, and an output read
+        by several consumers is computed on the union of their bands.
+
+        @return the planned `output_rows` of each band-capable node by name
+        (`None` is every row).
+        """
+        demands: dict[int, tuple[int, int] | None] = {}
+
+        def demand(
+            spec: ComponentIOSpec,
+            rows: tuple[int, int] | None,
+        ) -> None:
+            key = id(spec)
+            demands[key] = _union_rows(demands[key], rows) if key in demands else rows
+
+        for output in self.output_specs:
+            demand(output, None)
+        plan = {}
+        for node in reversed(self.nodes):
+            if node.is_passthrough:
+                for src, dst in zip(node.sources, node.outputs):
+                    if id(dst) in demands:
+                        demand(src, demands[id(dst)])
+                continue
+            component = node.component
+            if component.row_halo is not None:
+                # NOTE: An output nobody reads (e.g. only visualized) is computed entirely.
+                read_outputs = [o for o in node.outputs if id(o) in demands]
+                rows = demands[id(read_outputs[0])] if read_outputs else None
+                for output in read_outputs[1:]:
+                    rows = _union_rows(rows, demands[id(output)])
+                component.set_output_rows(rows)
+                plan[node.name] = rows
+            for i, src in enumerate(node.sources):
+                demand(src, component.required_rows(i))
+        return plan
+
+    def _compile_schedule(
+        self
+    ) -> list:
+        schedule = []
+        for node in self.nodes:
+            if node.is_passthrough:
+                schedule.append((None, None, node.sources, node.outputs, None))
+            else:
+                schedule.append((
+                    node.component.profile_key,
+                    node.component.run,
+                    node.sources,
+                    node.outputs_by_name,
+                    node.kwargs,
+                ))
+        return schedule
+
+    def feed(
+        self,
+        *args: Any
+    ) -> None:
+        """! Stores the arguments of a pipeline call in the graph inputs.
+        """
+        assert len(args) == len(self.inputs), (
+            f'The graph has {len(self.inputs)} inputs, '
+            f'but {len(args)} input(s) was given.'
+        )
+        for arg, input_ in zip(args, self.inputs):
+            if isinstance(arg, ComponentIOSpec):
+                input_.data_container.data = arg.data_container.data
+            else:
+                input_.data_container.data = arg
+
+    def __call__(
+        self,
+        *args: Any
+    ) -> Union[ComponentIOSpec, list[ComponentIOSpec], None]:
+        self.feed(*args)
+        profile = PROFILER.enabled
+        for key, run, sources, outputs, kwargs in self._schedule:
+            if run is None:
+                for src, dst in zip(sources, outputs):
+                    dst.data_container.data = src.data_container.data
+                continue
+            args = [src.data_container.data for src in sources]
+            if profile:
+                t0 = perf_counter_ns()
+                rets = run(*args, **kwargs)
+                PROFILER.record(key, perf_counter_ns() - t0)
+            else:
+                rets = run(*args, **kwargs)
+            if outputs:
+                for name, ret in rets.items():
+                    outputs[name].data_container.data = ret
+        return self.outputs
+
+    def __repr__(
+        self
+    ) -> str:
+        names = {n.index: n.name for n in self.nodes}
+        lines = [f'PipelineGraph({len(self.inputs)} inputs, {len(self.nodes)} nodes)']
+        for node in self.nodes:
+            predecessors = [names[i] for i in self.predecessors[node.index]]
+            lines.append(f'  {node.name} <- {predecessors if predecessors else "inputs"}')
+        return '\n'.join(lines)
+
+
+class GraphTracer():
+    """! Records component calls instead of executing them.
+
+    While a tracer is attached to a component, calling the component
+    returns its output specs without running it, so `run()` of a pipeline
+    can be executed once with sentinel specs to record the data flow.
+    """
+
+    def __init__(
+        self,
+        names: dict[int, str],
+    ) -> None:
+        self.names = names
+        self.nodes: list[PipelineNode] = []
+        self._recorded_ids = set()
+
+    def record(
+        self,
+        component: BaseComponent,
+        args: tuple,
+        kwargs: dict,
+    ) -> Union[ComponentIOSpec, list[ComponentIOSpec], None]:
+        if id(component) in self._recorded_ids:
+            raise ValueError(
+                f'Component `{self.names.get(id(component))}` '
+                f'(class: `{component.__class__.__name__}`) is called more than once. '
+                'A compiled graph requires each component to be called once per run. '
+                'Use separate component instances instead.'
+            )
+        self._recorded_ids.add(id(component))
+
+        sources = []
+        for arg in args:
+            if isinstance(arg, ComponentIOSpec):
+                sources.append(arg)
+            else:
+                # NOTE: A non-spec argument is a constant of the graph.
+                constant = ComponentIOSpec('constant', AnyType())
+                constant.data_container.data = arg
+                sources.append(constant)
+
+        if isinstance(component, IOBaseComponent):
+            outputs = list(component.outputs)
+        elif isinstance(component, InputsOnlyBaseComponent):
+            outputs = []
+        else:
+            # NOTE: e.g. `InputsComponent` creates its outputs on the first call.
+            if not component.outputs:
+                component._init_output(args)
+            outputs = list(component.outputs)
+
+        self.nodes.append(PipelineNode(
+            index=len(self.nodes),
+            name=self.names.get(id(component), component.__class__.__name__),
+            component=component,
+            sources=sources,
+            kwargs=dict(kwargs),
+            outputs=outputs,
+        ))
+        if not outputs:
+            return None
+        if len(outputs) > 1:
+            return outputs
+        return outputs[0]
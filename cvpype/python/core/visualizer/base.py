@@ -1,9 +1,20 @@
 # Built-in
+import copy
+import time
 import logging
 from abc import ABC, abstractmethod
+from threading import Thread
+
+# Third party
+import numpy as np
 
 # Project
 from cvpype.python.iospec import ComponentIOSpec
+from cvpype.python.backend.framequeue import FrameQueue
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
+from cvpype.python.utils.tracing import TRACER
 
 # Configure the root logger
 logging.basicConfig(level=logging.INFO)
@@ -23,6 +34,113 @@ class BaseVisualizer(ABC):
         self.is_operating = is_operating
         self.logger = logging.getLogger(self.__class__.__name__)
         self.__did_runtime_init = False
+        # NOTE: `inputs` is declared on the class.
+        # Each instance holds its own specs, since instances may render concurrently.
+        self.inputs = copy.deepcopy(self.inputs)
+        self._render_queue: FrameQueue | None = None
+        self._render_seq = 0
+        self.n_rendered = 0
+        self.every_n = 1
+        self.min_render_interval = 0.0
+        self._n_until_render = 0
+        self._next_render_time = 0.0
+        self.n_skipped = 0
+        # NOTE: The key of the latency of `paint()` in `PROFILER`.
+        self.profile_key = f'visualizer.{name}'
+
+    def set_sampling(
+        self,
+        every_n: int = 1,
+        max_rate_hz: float | None = None,
+    ) -> None:
+        """! Renders only a part of the calls. A skipped call costs
+        only a counter (and a clock) check.
+
+        @param every_n Renders every `every_n`-th call, starting from the next one.
+        @param max_rate_hz Renders at most `max_rate_hz` times per second.
+        `None` does not limit the rate.
+        """
+        if type(every_n) is not int or every_n < 1:
+            raise ValueError(
+                f'`every_n` should be a positive integer. Current value: `{every_n}`'
+            )
+        if max_rate_hz is not None and max_rate_hz <= 0:
+            raise ValueError(
+                f'`max_rate_hz` should be positive or None. Current value: `{max_rate_hz}`'
+            )
+        self.every_n = every_n
+        self.min_render_interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self._n_until_render = 0
+        self._next_render_time = 0.0
+
+    @property
+    def is_async(
+        self
+    ) -> bool:
+        return self._render_queue is not None
+
+    def set_async(
+        self,
+        enabled: bool = True,
+        queue_size: int = 1,
+    ) -> None:
+        """! In the asynchronous mode, calling the visualizer only puts a
+        snapshot of its inputs into a bounded queue. A background thread
+        renders them, and the oldest snapshot is dropped when the renderer
+        falls behind, so rendering is no longer on the critical path.
+
+        @param enabled `False` stops the renderer and renders synchronously again.
+        @param queue_size The number of snapshots waiting to be rendered.
+        """
+        if self._render_queue is not None:
+            # NOTE: The renderer renders the queued snapshots, then stops.
+            self._render_queue.close()
+            self._render_queue = None
+        if not enabled:
+            return
+        self._render_queue = FrameQueue(
+            maxsize=queue_size,
+            policy=FrameQueue.DROP_OLDEST,
+            name=f'{self.name}.render',
+        )
+        thread = Thread(
+            target=self._run_renderer,
+            args=(self._render_queue,),
+            daemon=True
+        )
+        thread.start()
+
+    def render_stats(
+        self
+    ) -> dict:
+        stats = {'rendered': self.n_rendered, 'skipped': self.n_skipped}
+        if self._render_queue is not None:
+            stats.update(self._render_queue.stats())
+        return stats
+
+    def _run_renderer(
+        self,
+        render_queue: FrameQueue,
+    ) -> None:
+        while True:
+            item = render_queue.get()
+            if item is None:
+                break
+            _, (args, kwargs, frame_id) = item
+            TRACER.set_frame_id(frame_id)
+            try:
+                self.render(*args, **kwargs)
+            except Exception:
+                self.logger.exception(f'Failed to render `{self.name}`.')
+
+    @staticmethod
+    def _snapshot(
+        arg
+    ):
+        # NOTE: The caller may change its data after the call returns.
+        if isinstance(arg, np.ndarray):
+            return arg.copy()
+        return copy.deepcopy(arg)
 
     def __call__(
         self,
@@ -31,6 +149,36 @@ class BaseVisualizer(ABC):
     ):
         if not self.is_operating:
             return
+        if self._n_until_render:
+            self._n_until_render -= 1
+            self.n_skipped += 1
+            return
+        if self.min_render_interval:
+            now = time.perf_counter()
+            if now < self._next_render_time:
+                self.n_skipped += 1
+                return
+            self._next_render_time = now + self.min_render_interval
+        self._n_until_render = self.every_n - 1
+        render_queue = self._render_queue
+        if render_queue is not None:
+            snapshot = (
+                [self._snapshot(arg) for arg in args],
+                {key: self._snapshot(value) for key, value in kwargs.items()},
+                TRACER.frame_id,
+            )
+            self._render_seq += 1
+            render_queue.put(self._render_seq, snapshot)
+            return
+        return self.render(*args, **kwargs)
+
+    def render(
+        self,
+        *args,
+        **kwargs,
+    ):
+        """! Paints the inputs. Subclasses extend it to show the result.
+        """
         if not self.__did_runtime_init:
             self.runtime_init()
             self.__did_runtime_init = True
@@ -39,7 +187,9 @@ class BaseVisualizer(ABC):
         for arg, input_spec in zip(args, self.inputs):
             input_spec.data_container.data = arg
             wrapped.append(input_spec.data_container)
-        return self.paint(*wrapped, **kwargs)
+        ret = PROFILER.call(self.profile_key, self.paint, *wrapped, **kwargs)
+        self.n_rendered += 1
+        return ret
 
     def runtime_init(
         self,
@@ -0,0 +1,134 @@
+# Built-in
+import time
+import threading
+import unittest
+
+# Third party
+import numpy as np
+
+# Project
+from cvpype.python.iospec import ComponentIOSpec
+
+# Project-Types
+from cvpype.python.basic.types.cvimage import ImageType
+
+# Project-Visualizers
+from cvpype.python.core.visualizer.base import BaseVisualizer
+
+
+class ExampleRecordingVisualizer(BaseVisualizer):
+    inputs = [
+        ComponentIOSpec(
+            name='image',
+            data_container=ImageType(),
+        )
+    ]
+
+    def __init__(
+        self,
+        name: str,
+        seconds: float = 0.0,
+    ) -> None:
+        super().__init__(name)
+        self.seconds = seconds
+        self.values = []
+        self.threads = set()
+
+    def paint(
+        self,
+        image: ImageType,
+        offset: int = 0,
+    ):
+        time.sleep(self.seconds)
+        self.values.append(int(image.data[0, 0]) + offset)
+        self.threads.add(threading.get_ident())
+        return image.data
+
+
+def wait_until(
+    condition,
+    timeout: float = 2.0,
+) -> bool:
+    t0 = time.time()
+    while not condition():
+        if time.time() - t0 > timeout:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestBaseVisualizer(unittest.TestCase):
+    def test_sync(self):
+        visualizer = ExampleRecordingVisualizer('sync')
+        image = np.full((2, 2), 3, dtype=np.uint8)
+        self.assertIs(image, visualizer(image, offset=1))
+        self.assertEqual([4], visualizer.values)
+        self.assertEqual({threading.get_ident()}, visualizer.threads)
+
+    def test_instances_do_not_share_inputs(self):
+        a = ExampleRecordingVisualizer('a')
+        b = ExampleRecordingVisualizer('b')
+        self.assertIsNot(a.inputs[0], b.inputs[0])
+
+    def test_async_renders_snapshots_off_thread(self):
+        visualizer = ExampleRecordingVisualizer('async')
+        visualizer.set_async(queue_size=10)
+        image = np.zeros((2, 2), dtype=np.uint8)
+        for i in range(5):
+            image[:] = i
+            self.assertIsNone(visualizer(image, offset=10))
+        self.assertTrue(wait_until(lambda: visualizer.n_rendered == 5))
+        # NOTE: The caller changed `image` in place after each call.
+        self.assertEqual([10, 11, 12, 13, 14], visualizer.values)
+        self.assertNotIn(threading.get_ident(), visualizer.threads)
+        visualizer.set_async(False)
+
+    def test_async_drops_frames_when_behind(self):
+        visualizer = ExampleRecordingVisualizer('slow', seconds=0.05)
+        visualizer.set_async(queue_size=1)
+        t0 = time.perf_counter()
+        for i in range(20):
+            visualizer(np.full((2, 2), i, dtype=np.uint8))
+        elapsed = time.perf_counter() - t0
+        # NOTE: Rendering every frame synchronously would take 1 second.
+        self.assertLess(elapsed, 0.5)
+        self.assertTrue(wait_until(lambda: visualizer.render_stats()['depth'] == 0))
+        self.assertTrue(wait_until(lambda: 19 in visualizer.values))
+        self.assertGreater(visualizer.render_stats()['dropped'], 0)
+        self.assertLess(visualizer.n_rendered, 20)
+        visualizer.set_async(False)
+
+    def test_every_n(self):
+        visualizer = ExampleRecordingVisualizer('every_n')
+        visualizer.set_sampling(every_n=3)
+        for i in range(10):
+            visualizer(np.full((2, 2), i, dtype=np.uint8))
+        self.assertEqual([0, 3, 6, 9], visualizer.values)
+        self.assertEqual(6, visualizer.n_skipped)
+        with self.assertRaises(ValueError):
+            visualizer.set_sampling(every_n=0)
+
+    def test_max_rate(self):
+        visualizer = ExampleRecordingVisualizer('max_rate')
+        visualizer.set_sampling(max_rate_hz=20)
+        t0 = time.perf_counter()
+        while time.perf_counter() - t0 < 0.25:
+            visualizer(np.zeros((2, 2), dtype=np.uint8))
+            time.sleep(0.001)
+        self.assertLessEqual(visualizer.n_rendered, 6)
+        self.assertGreaterEqual(visualizer.n_rendered, 2)
+        self.assertGreater(visualizer.n_skipped, 0)
+        with self.assertRaises(ValueError):
+            visualizer.set_sampling(max_rate_hz=0)
+
+    def test_off(self):
+        visualizer = ExampleRecordingVisualizer('off')
+        visualizer.set_async()
+        visualizer.off()
+        visualizer(np.zeros((2, 2), dtype=np.uint8))
+        self.assertEqual(0, visualizer.render_stats()['put'])
+        visualizer.set_async(False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+# Built-in
+import os
+import unittest
+
+# Third party
+import cv2
+
+# Project-Pipelines
+from cvpype.python.core.pipelines.executors import (
+    PipelinedExecutor,
+    BranchParallelExecutor
+)
+from cvpype.python.applications.pipelines.linetracking import (
+    LineTrackingPipeline,
+    RoiIntersectionPipeline
+)
+
+# Project-Utils
+from cvpype.python.utils.tracing import TRACER
+
+
+VIDEO_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', '..', '..', 'data', 'sample.avi'
+)
+
+
+def read_frames(
+    video_path: str,
+    n_frames: int,
+) -> list:
+    cap = cv2.VideoCapture(video_path)
+    frames = []
+    while cap.isOpened() and len(frames) < n_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def create_pipeline(
+    pipeline_class: type = LineTrackingPipeline,
+    **kwargs
+) -> LineTrackingPipeline:
+    pipeline = pipeline_class(
+        crop_y=330,
+        crop_y_end=380,
+        roi_y=370,
+        image_h=480,
+        **kwargs
+    )
+    pipeline.autocreate_graph()
+    for _, visualizer in pipeline.visualizers.items():
+        visualizer.is_operating = False
+    return pipeline
+
+
+class TestCompiledLineTrackingPipeline(unittest.TestCase):
+    def setUp(self):
+        self.frames = read_frames(VIDEO_PATH, 30)
+        self.assertTrue(self.frames, f'Cannot read {VIDEO_PATH}')
+
+    def test_compiled_graph_matches_run(self):
+        eager = create_pipeline()
+        compiled = create_pipeline()
+        graph = compiled.compile()
+        for frame in self.frames:
+            expected = eager.run(frame.copy()).data_container.data
+            actual = graph(frame.copy()).data_container.data
+            self.assertEqual(
+                [tuple(map(int, e)) for e in expected],
+                [tuple(map(int, e)) for e in actual],
+            )
+
+    def test_pipelined_executor_matches_run(self):
+        eager = create_pipeline()
+        expected = [
+            [tuple(map(int, e)) for e in eager.run(frame.copy()).data_container.data]
+            for frame in self.frames
+        ]
+        graph = create_pipeline().compile()
+        with PipelinedExecutor(graph) as executor:
+            actual = [
+                [tuple(map(int, e)) for e in intersections]
+                for intersections in executor.map(frame.copy() for frame in self.frames)
+            ]
+        self.assertEqual(expected, actual)
+
+    def test_branch_parallel_executor_matches_run(self):
+        eager = create_pipeline()
+        graph = create_pipeline().compile()
+        with BranchParallelExecutor(graph) as executor:
+            self.assertIn(
+                'edge_detecting',
+                [node.name for node in executor.branch_points]
+            )
+            for frame in self.frames:
+                expected = eager.run(frame.copy()).data_container.data
+                actual = executor(frame.copy()).data_container.data
+                self.assertEqual(
+                    [tuple(map(int, e)) for e in expected],
+                    [tuple(map(int, e)) for e in actual],
+                )
+
+    def test_multirow_scan(self):
+        single = create_pipeline()
+        multirow = create_pipeline(roi_rows=range(365, 376))
+        multirow.set_optimization_mode()
+        for frame in self.frames:
+            expected = single.run(frame.copy()).data_container.data
+            packed = multirow.run(frame.copy()).data_container.data
+            self.assertEqual(11, len(packed.rows))
+            # NOTE: The row `roi_y` is one of the scanned rows.
+            self.assertEqual(expected.tolist(), packed.row(5).tolist())
+
+    def test_lane_tracking(self):
+        full = create_pipeline()
+        tracked = create_pipeline(lane_tracking=True)
+        tracked.set_optimization_mode()
+        n_agreed = 0
+        for frame in self.frames:
+            expected = full.run(frame.copy()).data_container.data
+            actual = tracked.run(frame.copy()).data_container.data
+            n_agreed += expected.tolist() == actual.tolist()
+        self.assertGreaterEqual(n_agreed, len(self.frames) - 1)
+        self.assertLess(tracked.lane_tracker.fallback_rate, 0.2)
+        self.assertEqual(2, len(tracked.lane_tracking.outputs[0].data_container.data))
+
+    def test_branch_parallel_executor_runs_branches_on_threads(self):
+        # NOTE: The intersection branch starts with the passthrough
+        # `intersection_pipeline.inputs`, and still runs beside the lines.
+        graph = create_pipeline().compile()
+        TRACER.clear()
+        TRACER.start()
+        try:
+            with BranchParallelExecutor(graph) as executor:
+                for frame in self.frames[:5]:
+                    executor(frame.copy())
+        finally:
+            TRACER.stop()
+        events = TRACER.to_chrome_trace()['traceEvents']
+        TRACER.clear()
+        tids = {
+            name: {event['tid'] for event in events if event.get('name') == f'component.{name}'}
+            for name in ('line_finding', 'intersection_pipeline.intersection_finding')
+        }
+        self.assertTrue(all(tids.values()))
+        self.assertTrue(tids['line_finding'].isdisjoint(
+            tids['intersection_pipeline.intersection_finding']
+        ))
+
+    def test_row_demand(self):
+        # NOTE: The lines are searched in the whole crop.
+        self.assertEqual(
+            {'grayscailing': None, 'blurring': None, 'edge_detecting': None},
+            create_pipeline().set_row_demand()
+        )
+        for blur_preset in (None, 'fast'):
+            full = create_pipeline(RoiIntersectionPipeline, blur_preset=blur_preset)
+            band = create_pipeline(RoiIntersectionPipeline, blur_preset=blur_preset)
+            # NOTE: Only the intersection branch is built.
+            self.assertNotIn('line_finding', band.components)
+            self.assertNotIn('line_visualizing', band.components)
+            plan = band.set_row_demand()
+            self.assertEqual((40, 41), plan['edge_detecting'])
+            self.assertLess(plan['grayscailing'][1] - plan['grayscailing'][0], 50)
+            n_agreed = 0
+            for frame in self.frames:
+                expected = full.run(frame.copy()).data_container.data
+                actual = band.run(frame.copy()).data_container.data
+                n_agreed += expected.tolist() == actual.tolist()
+            self.assertGreaterEqual(n_agreed, len(self.frames) - 1)
+
+    def test_graph_edges(self):
+        graph = create_pipeline().compile()
+        edges = [(p.name, c.name) for p, c, _ in graph.edges]
+        self.assertIn(('edge_detecting', 'line_finding'), edges)
+        self.assertIn(('edge_detecting', 'intersection_pipeline.inputs'), edges)
+        self.assertIn(('line_finding', 'line_visualizing'), edges)
+
+
+if __name__ == '__main__':
+    unittest.main()
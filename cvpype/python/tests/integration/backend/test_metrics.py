@@ -0,0 +1,146 @@
+# Built-in
+import os
+import time
+import unittest
+
+# Third party
+import cv2
+import numpy as np
+
+# Project
+from cvpype.python.backend.framequeue import FrameQueue
+from cvpype.python.backend.web.server import Server
+from cvpype.python.backend.web.metrics import render_metrics
+from cvpype.python.backend.web.streamer.base import BaseWebStreamer
+from cvpype.python.backend.web.streamer.videofile import VideofileWebStreamer
+
+# Project-Utils
+from cvpype.python.utils.profiling import Profiler
+
+
+VIDEO_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', '..', '..', 'data', 'sample.avi'
+)
+
+
+class ExampleWebStreamer(BaseWebStreamer):
+    def read_from_stream(
+        self
+    ) -> None:
+        pass
+
+    def close(
+        self
+    ) -> None:
+        pass
+
+
+def parse_samples(
+    text: str,
+) -> dict[str, float]:
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith('#'):
+            continue
+        name, value = line.rsplit(' ', 1)
+        samples[name] = float(value)
+    return samples
+
+
+class TestRenderMetrics(unittest.TestCase):
+    def test_latency_histogram(self):
+        profiler = Profiler()
+        for duration_ns in (3_000, 3_000, 200_000, 2_000_000_000):
+            profiler.record('component.a', duration_ns)
+        samples = parse_samples(render_metrics({}, profiler))
+        section = 'section="component.a"'
+        self.assertEqual(2, samples[f'cvpype_latency_seconds_bucket{{{section},le="1e-05"}}'])
+        self.assertEqual(2, samples[f'cvpype_latency_seconds_bucket{{{section},le="0.0001"}}'])
+        self.assertEqual(3, samples[f'cvpype_latency_seconds_bucket{{{section},le="0.0005"}}'])
+        self.assertEqual(3, samples[f'cvpype_latency_seconds_bucket{{{section},le="1"}}'])
+        self.assertEqual(4, samples[f'cvpype_latency_seconds_bucket{{{section},le="+Inf"}}'])
+        self.assertEqual(4, samples[f'cvpype_latency_seconds_count{{{section}}}'])
+        self.assertAlmostEqual(2.000206, samples[f'cvpype_latency_seconds_sum{{{section}}}'])
+
+    def test_queues(self):
+        queue = FrameQueue(maxsize=1, name='example "queue"')
+        for seq in range(3):
+            queue.put(seq, None)
+        samples = parse_samples(render_metrics({}, Profiler()))
+        labels = '{queue="example \\"queue\\""}'
+        self.assertEqual(1, samples[f'cvpype_queue_depth{labels}'])
+        self.assertEqual(1, samples[f'cvpype_queue_capacity{labels}'])
+        self.assertEqual(3, samples[f'cvpype_queue_put_frames_total{labels}'])
+        self.assertEqual(2, samples[f'cvpype_queue_dropped_frames_total{labels}'])
+        queue.close()
+        self.assertNotIn('example', render_metrics({}, Profiler()))
+
+
+class TestServerMetrics(unittest.TestCase):
+    def test_metrics_endpoint(self):
+        server = Server(port=0)
+        streamer = ExampleWebStreamer()
+        server.add_videostream('stream', streamer)
+        for value in range(3):
+            streamer.output_frame = np.full((16, 16, 3), value, dtype=np.uint8)
+        client = streamer.push_to_browser()
+        next(client)
+
+        response = server.app.test_client().get('/metrics')
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.content_type.startswith('text/plain'))
+        samples = parse_samples(response.get_data(as_text=True))
+        labels = '{stream="stream"}'
+        self.assertEqual(3, samples[f'cvpype_stream_published_frames_total{labels}'])
+        self.assertEqual(1, samples[f'cvpype_stream_encoded_frames_total{labels}'])
+        self.assertEqual(1, samples[f'cvpype_stream_clients{labels}'])
+        self.assertGreater(samples[f'cvpype_stream_fps{labels}'], 0)
+        # NOTE: The latencies of the streamer are named after the stream.
+        self.assertGreaterEqual(
+            samples['cvpype_latency_seconds_count{section="streamer.stream.encode"}'], 1
+        )
+        self.assertIn('cvpype_queue_depth{queue="stream.encoder"}', samples)
+        client.close()
+
+        with self.assertRaises(KeyError):
+            server.add_videostream('metrics', ExampleWebStreamer())
+
+    def test_reconnect_keeps_encoder_queue(self):
+        streamer = ExampleWebStreamer()
+        labels = '{queue="session.encoder"}'
+        n_puts = []
+        for session in range(3):
+            client = streamer.push_to_browser()
+            next(client)
+            for value in range(2):
+                streamer.output_frame = np.full((16, 16, 3), value, dtype=np.uint8)
+            client.close()
+            samples = parse_samples(render_metrics({'session': streamer}, Profiler()))
+            n_puts.append(samples[f'cvpype_queue_put_frames_total{labels}'])
+            # NOTE: Frames published without clients are not encoded.
+            streamer.output_frame = np.zeros((16, 16, 3), dtype=np.uint8)
+        # NOTE: The frame published between two sessions is put when a client connects.
+        self.assertEqual([2, 5, 8], n_puts)
+        names = [queue.name for queue in FrameQueue.instances()]
+        self.assertEqual(1, names.count('session.encoder'))
+
+    def test_videofile_streamer(self):
+        server = Server(port=0)
+        streamer = VideofileWebStreamer(VIDEO_PATH, playback_speed=30, replay=False)
+        self.assertGreater(streamer.fps, 0)
+        n_frames = int(streamer.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        server.add_videostream('video', streamer)
+        # NOTE: The reading thread stops by itself at the end of the video,
+        # and the capture is not released while it may still read.
+        deadline = time.monotonic() + 30
+        while streamer.frame_seq + 1 < n_frames and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        response = server.app.test_client().get('/metrics')
+        self.assertEqual(200, response.status_code)
+        samples = parse_samples(response.get_data(as_text=True))
+        self.assertEqual(n_frames, samples['cvpype_stream_published_frames_total{stream="video"}'])
+        self.assertIn('cvpype_stream_fps{stream="video"}', samples)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+# Built-in
+import threading
+import unittest
+
+# Third party
+import numpy as np
+
+# Project
+from cvpype.python.iospec import ComponentIOSpec
+
+# Project-Types
+from cvpype.python.basic.types.cvimage import ImageType
+
+# Project-Components
+from cvpype.python.core.components.base import IOBaseComponent
+from cvpype.python.basic.components.inputs import InputsComponent
+
+# Project-Pipelines
+from cvpype.python.core.pipelines.base import BasePipeline
+
+# Project-Streamers
+from cvpype.python.backend.base import BaseStreamer
+from cvpype.python.backend.framequeue import FrameQueue
+
+
+class ExampleStreamer(BaseStreamer):
+    def __init__(
+        self,
+        frames: list,
+    ):
+        super().__init__()
+        self.frames = frames
+
+    def read_from_stream(
+        self
+    ) -> None:
+        pass
+
+    def publish_all(
+        self
+    ) -> None:
+        for frame in self.frames:
+            self.output_frame = frame
+            # NOTE: Publishing the same frame again is a duplicate.
+            self.output_frame = frame
+
+    def close(
+        self
+    ) -> None:
+        pass
+
+
+class ExampleRecordingComponent(IOBaseComponent):
+    def __init__(
+        self
+    ):
+        super().__init__(
+            inputs = [
+                ComponentIOSpec(
+                    name='image',
+                    data_container=ImageType()
+                )
+            ],
+            outputs = [
+                ComponentIOSpec(
+                    name='image',
+                    data_container=ImageType()
+                )
+            ]
+        )
+        self.values = []
+
+    def run(
+        self,
+        image
+    ) -> dict:
+        self.values.append(int(image[0, 0]))
+        return {'image': image}
+
+
+class ExampleRecordingPipeline(BasePipeline):
+    def __init__(
+        self
+    ) -> None:
+        super().__init__()
+        self.input = InputsComponent()
+        self.recording = ExampleRecordingComponent()
+
+    def run(
+        self,
+        x
+    ):
+        x = self.input(x)
+        return self.recording(x)
+
+
+class TestRunFromStreamer(unittest.TestCase):
+    def setUp(self):
+        self.frames = [np.full((4, 4), i, dtype=np.uint8) for i in range(20)]
+        self.streamer = ExampleStreamer(self.frames)
+        # NOTE: Make the stream ready.
+        self.streamer.output_frame = np.zeros((4, 4), dtype=np.uint8)
+        self.pipeline = ExampleRecordingPipeline()
+
+    def test_block_policy_processes_every_frame_once(self):
+        fn = self.pipeline.run_from_streamer(
+            self.streamer, queue_size=2, policy=FrameQueue.BLOCK
+        )
+        consumer = threading.Thread(target=fn)
+        consumer.start()
+        self.streamer.publish_all()
+        self.pipeline.frame_queue.close()
+        consumer.join()
+        self.assertEqual(list(range(20)), self.pipeline.recording.values)
+        self.assertEqual(20, self.streamer.n_duplicated)
+        self.assertEqual(0, self.pipeline.frame_queue.n_dropped)
+        self.assertEqual(0, self.pipeline.n_skipped_frames)
+        self.assertEqual(20, self.pipeline.n_processed_frames)
+
+    def test_drop_oldest_policy_keeps_latest_frames(self):
+        fn = self.pipeline.run_from_streamer(
+            self.streamer, queue_size=2, policy=FrameQueue.DROP_OLDEST
+        )
+        # NOTE: Publish before consuming, so the queue overflows.
+        self.streamer.publish_all()
+        self.pipeline.frame_queue.close()
+        fn()
+        self.assertEqual([18, 19], self.pipeline.recording.values)
+        self.assertEqual(18, self.pipeline.frame_queue.n_dropped)
+
+
+class TestFrameHandoff(unittest.TestCase):
+    def setUp(self):
+        self.streamer = ExampleStreamer([])
+
+    def test_output_frame_is_readonly_copy(self):
+        source = np.full((4, 6, 3), 7, dtype=np.uint8)
+        self.streamer.output_frame = source
+        frame = self.streamer.output_frame
+        self.assertFalse(frame.flags.writeable)
+        self.assertFalse(np.shares_memory(frame, source))
+        np.testing.assert_array_equal(source, frame)
+        with self.assertRaises(ValueError):
+            frame[0, 0] = 0
+
+    def test_one_copy_per_published_frame(self):
+        self.streamer.width = 3
+        for i in range(10):
+            self.streamer.output_frame = np.full((4, 6), i, dtype=np.uint8)
+            self.assertEqual((2, 3), self.streamer.output_frame.shape)
+        self.assertEqual(10, self.streamer.n_frame_copies)
+        self.assertEqual(9, self.streamer.frame_seq)
+
+    def test_held_frame_is_not_overwritten(self):
+        self.streamer.output_frame = np.full((4, 4), 1, dtype=np.uint8)
+        held = self.streamer.output_frame
+        for i in range(2, 10):
+            self.streamer.output_frame = np.full((4, 4), i, dtype=np.uint8)
+        self.assertTrue(np.all(held == 1))
+        self.assertTrue(np.all(self.streamer.output_frame == 9))
+        # NOTE: Buffers are reused once nobody holds them.
+        self.assertLessEqual(len(self.streamer._buffers), 3)
+
+    def test_buffers_follow_frame_shape(self):
+        self.streamer.output_frame = np.zeros((4, 4), dtype=np.uint8)
+        self.streamer.width = None
+        self.streamer.height = None
+        self.streamer.output_frame = np.ones((8, 8, 3), dtype=np.uint8)
+        self.assertEqual((8, 8, 3), self.streamer.output_frame.shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# Built-in
+import time
+import threading
+import unittest
+
+# Third party
+import numpy as np
+
+# Project-Streamers
+from cvpype.python.backend.web.streamer.base import BaseWebStreamer
+from cvpype.python.backend.web.streamer.rtimage import RealtimeImageWebStreamer
+
+
+class ExampleWebStreamer(BaseWebStreamer):
+    def read_from_stream(
+        self
+    ) -> None:
+        pass
+
+    def close(
+        self
+    ) -> None:
+        pass
+
+
+def wait_until(
+    condition,
+    timeout: float = 2.0,
+) -> bool:
+    t0 = time.time()
+    while not condition():
+        if time.time() - t0 > timeout:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestBroadcast(unittest.TestCase):
+    def setUp(self):
+        self.streamer = ExampleWebStreamer()
+
+    def publish(
+        self,
+        value: int
+    ) -> None:
+        self.streamer.output_frame = np.full((16, 16, 3), value, dtype=np.uint8)
+
+    def test_each_frame_is_encoded_once_for_every_client(self):
+        self.publish(0)
+        clients = [self.streamer.push_to_browser() for _ in range(3)]
+        first_chunks = [next(client) for client in clients]
+        self.assertEqual(3, self.streamer.n_clients)
+        self.assertEqual(1, self.streamer.n_encoded)
+        self.assertTrue(first_chunks[0].startswith(b'--frame\r\n'))
+        self.assertTrue(all(chunk is first_chunks[0] for chunk in first_chunks))
+
+        self.publish(255)
+        second_chunks = [next(client) for client in clients]
+        self.assertEqual(2, self.streamer.n_encoded)
+        self.assertNotEqual(first_chunks[0], second_chunks[0])
+        self.assertTrue(all(chunk is second_chunks[0] for chunk in second_chunks))
+        for client in clients:
+            client.close()
+
+    def test_no_encoding_without_clients(self):
+        self.publish(0)
+        client = self.streamer.push_to_browser()
+        next(client)
+        client.close()
+        self.assertEqual(0, self.streamer.n_clients)
+        encoder_queue_count = len(self.streamer._frame_queues)
+        for i in range(1, 5):
+            self.publish(i)
+        self.assertEqual(0, encoder_queue_count)
+        self.assertEqual(1, self.streamer.n_encoded)
+
+    def test_encoder_skips_to_the_latest_frame(self):
+        self.publish(0)
+        client = self.streamer.push_to_browser()
+        next(client)
+        for i in range(1, 50):
+            self.publish(i)
+        self.assertTrue(wait_until(
+            lambda: self.streamer._jpeg_seq == self.streamer.frame_seq
+        ))
+        self.assertLessEqual(self.streamer.n_encoded, 50)
+        client.close()
+
+
+class TestRealtimeImageWebStreamer(unittest.TestCase):
+    def test_pushed_frames_are_delivered_without_polling(self):
+        streamer = RealtimeImageWebStreamer()
+        n_threads = threading.active_count()
+        streamer.open()
+        self.assertEqual(n_threads, threading.active_count())
+
+        frame = np.zeros((16, 16, 3), dtype=np.uint8)
+        streamer(frame)
+        client = streamer.push_to_browser()
+        next(client)
+        for i in range(1, 10):
+            # NOTE: The same array pushed again is still a new frame.
+            frame[:] = i
+            streamer(frame)
+            next(client)
+        client.close()
+
+        stats = streamer.latency_stats()
+        self.assertEqual(10, stats['n_encoded'])
+        self.assertEqual(0, streamer.n_duplicated)
+        self.assertIn('delivery_p50_ms', stats)
+        self.assertIn('encode_p50_ms', stats)
+        # NOTE: The former polling thread alone added up to 50 ms.
+        self.assertLess(stats['delivery_p50_ms'], 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
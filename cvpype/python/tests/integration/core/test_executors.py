@@ -0,0 +1,281 @@
+# Built-in
+import time
+import unittest
+import threading
+
+# Project
+from cvpype.python.iospec import ComponentIOSpec
+
+# Project-Types
+from cvpype.python.core.types.base import BaseType
+
+# Project-Components
+from cvpype.python.core.components.base import IOBaseComponent
+from cvpype.python.basic.components.inputs import InputsComponent
+
+# Project-Pipelines
+from cvpype.python.core.pipelines.base import BasePipeline
+from cvpype.python.core.pipelines.executors import (
+    PipelinedExecutor,
+    BranchParallelExecutor
+)
+
+# Project-Utils
+from cvpype.python.utils.tracing import TRACER
+
+
+class ExampleSleepyAddComponent(IOBaseComponent):
+    def __init__(
+        self,
+        value: int,
+        seconds: float = 0.0,
+    ):
+        super().__init__(
+            inputs = [
+                ComponentIOSpec(
+                    name='example_input',
+                    data_container=BaseType()
+                )
+            ],
+            outputs = [
+                ComponentIOSpec(
+                    name='example_output',
+                    data_container=BaseType()
+                )
+            ]
+        )
+        self.value = value
+        self.seconds = seconds
+
+    def run(
+        self,
+        x
+    ) -> dict:
+        if self.seconds:
+            time.sleep(self.seconds)
+        if x is None:
+            raise ValueError('x should not be None.')
+        return {'example_output': x + self.value}
+
+
+class ExampleChainPipeline(BasePipeline):
+    def __init__(
+        self,
+        seconds: float = 0.0,
+    ) -> None:
+        super().__init__()
+        self.input = InputsComponent()
+        self.add_one = ExampleSleepyAddComponent(1, seconds)
+        self.add_ten = ExampleSleepyAddComponent(10, seconds)
+        self.add_hundred = ExampleSleepyAddComponent(100, seconds)
+
+    def run(
+        self,
+        x
+    ):
+        x = self.input(x)
+        x = self.add_one(x)
+        x = self.add_ten(x)
+        x = self.add_hundred(x)
+        return x
+
+
+class ExampleSumComponent(IOBaseComponent):
+    def __init__(
+        self
+    ):
+        super().__init__(
+            inputs = [
+                ComponentIOSpec(
+                    name='a',
+                    data_container=BaseType()
+                ),
+                ComponentIOSpec(
+                    name='b',
+                    data_container=BaseType()
+                )
+            ],
+            outputs = [
+                ComponentIOSpec(
+                    name='sum',
+                    data_container=BaseType()
+                )
+            ]
+        )
+
+    def run(
+        self,
+        a,
+        b
+    ) -> dict:
+        return {'sum': a + b}
+
+
+class ExampleForkPipeline(BasePipeline):
+    def __init__(
+        self,
+        seconds: float = 0.0,
+    ) -> None:
+        super().__init__()
+        self.input = InputsComponent()
+        self.add_one = ExampleSleepyAddComponent(1)
+        self.left = ExampleSleepyAddComponent(10, seconds)
+        self.right_1 = ExampleSleepyAddComponent(100, seconds / 2)
+        self.right_2 = ExampleSleepyAddComponent(1000, seconds / 2)
+        self.join = ExampleSumComponent()
+
+    def run(
+        self,
+        x
+    ):
+        x = self.input(x)
+        x = self.add_one(x)
+        left = self.left(x)
+        right = self.right_1(x)
+        right = self.right_2(right)
+        return self.join(left, right)
+
+
+class TestPipelinedExecutor(unittest.TestCase):
+    def test_stages(self):
+        graph = ExampleChainPipeline().compile()
+        with PipelinedExecutor(graph) as executor:
+            self.assertEqual(
+                [['input', 'add_one'], ['add_ten'], ['add_hundred']],
+                [[node.name for node in stage] for stage in executor.stages]
+            )
+
+    def test_order_preserved(self):
+        graph = ExampleChainPipeline().compile()
+        with PipelinedExecutor(graph, queue_size=3) as executor:
+            outputs = list(executor.map(range(200)))
+        self.assertEqual([i + 111 for i in range(200)], outputs)
+
+    def test_custom_stages(self):
+        graph = ExampleChainPipeline().compile()
+        with PipelinedExecutor(
+            graph, stages=[['input', 'add_one', 'add_ten'], ['add_hundred']]
+        ) as executor:
+            self.assertEqual(2, len(executor.stages))
+            self.assertEqual([111, 112], list(executor.map([0, 1])))
+        with self.assertRaises(ValueError):
+            PipelinedExecutor(graph, stages=[['add_hundred'], ['input', 'add_one', 'add_ten']])
+
+    def test_overlapping_stages(self):
+        seconds = 0.02
+        n_frames = 20
+        graph = ExampleChainPipeline(seconds).compile()
+        with PipelinedExecutor(graph) as executor:
+            t0 = time.perf_counter()
+            list(executor.map(range(n_frames)))
+            elapsed = time.perf_counter() - t0
+            stats = executor.stats()
+        # NOTE: The serial execution takes `3 * seconds` per frame.
+        self.assertLess(elapsed, 3 * seconds * n_frames * 0.7)
+        self.assertEqual(n_frames, stats['n_completed'])
+        self.assertGreaterEqual(stats['latency_p50_ms'], 3 * seconds * 1000)
+
+    def test_close_with_full_queues(self):
+        graph = ExampleChainPipeline().compile()
+        executor = PipelinedExecutor(graph, queue_size=1)
+        # NOTE: 4 queues and 3 workers hold 7 frames, and no result is taken.
+        for i in range(7):
+            executor.submit(i)
+        closing = threading.Thread(target=executor.close, daemon=True)
+        closing.start()
+        closing.join(timeout=5)
+        self.assertFalse(closing.is_alive())
+        with self.assertRaises(RuntimeError):
+            executor.submit(0)
+
+    def test_failure(self):
+        graph = ExampleChainPipeline().compile()
+        with PipelinedExecutor(graph) as executor:
+            executor.submit(None)
+            executor.submit(1)
+            with self.assertRaises(RuntimeError):
+                executor.get()
+            self.assertEqual(112, executor.get())
+
+
+class TestBranchParallelExecutor(unittest.TestCase):
+    def test_branch_points(self):
+        with BranchParallelExecutor(ExampleForkPipeline().compile()) as executor:
+            self.assertEqual(['add_one'], [n.name for n in executor.branch_points])
+        with BranchParallelExecutor(ExampleChainPipeline().compile()) as executor:
+            self.assertEqual([], executor.branch_points)
+            self.assertEqual(111, executor(0).data_container.data)
+
+    def test_run(self):
+        pipeline = ExampleForkPipeline()
+        with BranchParallelExecutor(pipeline.compile()) as executor:
+            for i in range(-100, 100):
+                expected = (i + 11) + (i + 1101)
+                self.assertEqual(expected, executor(i).data_container.data)
+            self.assertIs(pipeline.run(0), executor(0))
+
+    def test_concurrent_branches(self):
+        seconds = 0.1
+        n_frames = 5
+        with BranchParallelExecutor(ExampleForkPipeline(seconds).compile()) as executor:
+            t0 = time.perf_counter()
+            for i in range(n_frames):
+                executor(i)
+            elapsed = time.perf_counter() - t0
+        # NOTE: The serial execution takes `2 * seconds` per frame.
+        self.assertLess(elapsed, 2 * seconds * n_frames * 0.8)
+
+    def test_failure(self):
+        with BranchParallelExecutor(ExampleForkPipeline().compile()) as executor:
+            with self.assertRaises(TypeError):
+                executor('string')
+            self.assertEqual(1112, executor(0).data_container.data)
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        TRACER.clear()
+        TRACER.start()
+
+    def tearDown(self):
+        TRACER.stop()
+        TRACER.clear()
+
+    def component_events(
+        self
+    ) -> list[dict]:
+        return [
+            event for event in TRACER.to_chrome_trace()['traceEvents']
+            if event.get('cat') == 'component'
+        ]
+
+    def test_branch_frame_ids(self):
+        with BranchParallelExecutor(ExampleForkPipeline(0.01).compile()) as executor:
+            for frame_id in range(3):
+                TRACER.set_frame_id(frame_id)
+                executor(frame_id)
+        TRACER.set_frame_id(None)
+        events = self.component_events()
+        frame_ids = {}
+        for event in events:
+            frame_ids.setdefault(event['args']['frame'], []).append(event['name'])
+        self.assertEqual([0, 1, 2], sorted(frame_ids))
+        for names in frame_ids.values():
+            self.assertEqual(
+                sorted(f'component.{name}' for name in ('add_one', 'left', 'right_1', 'right_2', 'join')),
+                sorted(names)
+            )
+        # NOTE: A branch runs on a thread of the pool.
+        self.assertGreater(len({event['tid'] for event in events}), 1)
+
+    def test_pipelined_frame_ids(self):
+        with PipelinedExecutor(ExampleChainPipeline().compile()) as executor:
+            list(executor.map(range(4)))
+        events = self.component_events()
+        self.assertEqual(12, len(events))
+        for event in events:
+            self.assertIn(event['args']['frame'], range(4))
+
+
+if __name__ == '__main__':
+    unittest.main()
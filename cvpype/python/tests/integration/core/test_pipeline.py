@@ -2,6 +2,7 @@
 import unittest
 
 # Third party
+import cv2
 import numpy as np
 
 # Project
@@ -17,6 +18,10 @@ from cvpype.python.basic.components.inputs import InputsComponent
 
 # Project-Pipelines
 from cvpype.python.core.pipelines.base import BasePipeline
+from cvpype.python.core.pipelines.graph import PipelineGraph
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER
 
 
 class ExampleAddComponent(IOBaseComponent):
@@ -107,6 +112,43 @@ class ExampleIdenticalComponentExistentPipeline(BasePipeline):
         return x3
 
 
+class ExampleNestedPipeline(BasePipeline):
+    def __init__(
+        self
+    ) -> None:
+        super().__init__()
+        self.input = InputsComponent()
+        self.add_one = ExampleAddComponent()
+        self.inner = ExamplePipeline()
+
+    def run(
+        self,
+        x
+    ):
+        x1 = self.input(x)
+        x2 = self.add_one(x1)
+        x3 = self.inner.run(x2)
+        return x3
+
+
+class ExampleRepeatedCallPipeline(BasePipeline):
+    def __init__(
+        self
+    ) -> None:
+        super().__init__()
+        self.input = InputsComponent()
+        self.add_one = ExampleAddComponent()
+
+    def run(
+        self,
+        x
+    ):
+        x1 = self.input(x)
+        x2 = self.add_one(x1)
+        x3 = self.add_one(x2)
+        return x3
+
+
 class ExampleImagePipeline(BasePipeline):
     def __init__(
         self
@@ -124,6 +166,91 @@ class ExampleImagePipeline(BasePipeline):
         return x2
 
 
+class ExampleRowBlurComponent(IOBaseComponent):
+    row_halo = 1
+
+    def __init__(
+        self
+    ):
+        super().__init__(
+            inputs = [
+                ComponentIOSpec(
+                    name='example_input',
+                    data_container=ImageType()
+                )
+            ],
+            outputs = [
+                ComponentIOSpec(
+                    name='example_output',
+                    data_container=ImageType()
+                )
+            ]
+        )
+
+    def run(
+        self,
+        image
+    ) -> dict:
+        return {'example_output': self.run_on_output_rows(cv2.blur, image, (3, 3))}
+
+
+class ExampleRowReadingComponent(IOBaseComponent):
+    def __init__(
+        self,
+        y: int,
+    ):
+        super().__init__(
+            inputs = [
+                ComponentIOSpec(
+                    name='example_input',
+                    data_container=ImageType()
+                )
+            ],
+            outputs = [
+                ComponentIOSpec(
+                    name='example_output',
+                    data_container=BaseType()
+                )
+            ]
+        )
+        self.y = y
+
+    def required_rows(
+        self,
+        input_index: int,
+    ) -> tuple[int, int]:
+        return (self.y, self.y + 1)
+
+    def run(
+        self,
+        image
+    ) -> dict:
+        return {'example_output': image[self.y].copy()}
+
+
+class ExampleRowBandPipeline(BasePipeline):
+    def __init__(
+        self
+    ) -> None:
+        super().__init__()
+        self.input = InputsComponent()
+        self.blur_1 = ExampleRowBlurComponent()
+        self.blur_2 = ExampleRowBlurComponent()
+        self.read_5 = ExampleRowReadingComponent(5)
+        self.read_10 = ExampleRowReadingComponent(10)
+
+    def run(
+        self,
+        x
+    ):
+        x1 = self.input(x)
+        x2 = self.blur_1(x1)
+        x3 = self.blur_2(x2)
+        row_5 = self.read_5(x3)
+        row_10 = self.read_10(x3)
+        return [row_5, row_10]
+
+
 class TestPipeline(unittest.TestCase):
     def setUp(self):
         self.pipeline = ExamplePipeline()
@@ -205,5 +332,167 @@ class TestImagePipeline(unittest.TestCase):
         )
 
 
+class TestOptimizationModePipeline(unittest.TestCase):
+    def setUp(self):
+        self.pipeline = ExampleIdenticalComponentExistentPipeline()
+        self.pipeline.autocreate_graph()
+
+    def test_trusted_after_validation_frames(self):
+        self.pipeline.set_optimization_mode(validation_frames=3)
+        for i in range(3):
+            self.assertFalse(self.pipeline.add_one_1.is_trusted)
+            self.assertEqual(i+2, self.pipeline.run(i).data_container.data)
+        self.assertTrue(self.pipeline.add_one_1.is_trusted)
+        self.assertTrue(self.pipeline.add_one_2.is_trusted)
+        for i in range(-100, 100):
+            self.assertEqual(i+2, self.pipeline.run(i).data_container.data)
+
+    def test_trusted_call_returns_output_spec(self):
+        eager = self.pipeline.run(1)
+        self.pipeline.set_optimization_mode(validation_frames=0)
+        trusted = self.pipeline.run(1)
+        self.assertIs(eager, trusted)
+
+    def test_trusted_call_skips_validation(self):
+        self.pipeline.set_optimization_mode(validation_frames=1)
+        self.pipeline.run(1)
+        # NOTE: `ImageType` would reject a float in the debugging mode.
+        self.pipeline.add_one_2.change_input_type('example_input', ImageType)
+        self.assertEqual(3.5, self.pipeline.run(1.5).data_container.data)
+
+    def test_debugging_mode(self):
+        self.pipeline.set_optimization_mode(validation_frames=0)
+        self.pipeline.set_debugging_mode()
+        for _ in range(10):
+            self.pipeline.run(1)
+        self.assertFalse(self.pipeline.add_one_1.is_trusted)
+        self.pipeline.add_one_2.change_input_type('example_input', ImageType)
+        with self.assertRaises(TypeError):
+            self.pipeline.run(1.5)
+
+
+class TestCompiledPipeline(unittest.TestCase):
+    def test_compile(self):
+        pipeline = ExampleIdenticalComponentExistentPipeline()
+        graph = pipeline.compile()
+        self.assertIsInstance(graph, PipelineGraph)
+        self.assertIs(graph, pipeline.graph)
+        self.assertEqual(
+            ['input', 'add_one_1', 'add_one_2'],
+            [node.name for node in graph.nodes]
+        )
+        self.assertEqual(
+            [('input', 'add_one_1'), ('add_one_1', 'add_one_2')],
+            [(p.name, c.name) for p, c, _ in graph.edges]
+        )
+
+    def test_run(self):
+        pipeline = ExampleIdenticalComponentExistentPipeline()
+        graph = pipeline.compile()
+        for i in range(-100, 100):
+            self.assertEqual(i+2, graph(i).data_container.data)
+        self.assertIs(pipeline.run(0), graph(0))
+
+    def test_nested_pipeline(self):
+        pipeline = ExampleNestedPipeline()
+        graph = pipeline.compile()
+        self.assertIn('inner.add_one', [node.name for node in graph.nodes])
+        self.assertEqual(
+            ['input', 'add_one', 'inner.input', 'inner.add_one'],
+            [node.name for node in graph.nodes]
+        )
+        for i in range(-100, 100):
+            self.assertEqual(i+2, graph(i).data_container.data)
+
+    def test_compile_trusted_pipeline(self):
+        pipeline = ExampleIdenticalComponentExistentPipeline()
+        pipeline.autocreate_graph()
+        pipeline.set_optimization_mode(validation_frames=0)
+        graph = pipeline.compile()
+        self.assertTrue(pipeline.add_one_1.is_trusted)
+        self.assertEqual(3, graph(1).data_container.data)
+        self.assertEqual(3, pipeline.run(1).data_container.data)
+
+    def test_repeated_call(self):
+        pipeline = ExampleRepeatedCallPipeline()
+        with self.assertRaises(ValueError):
+            pipeline.compile()
+        # NOTE: A failed trace should not leave the components in tracing mode.
+        self.assertEqual(3, pipeline.run(1).data_container.data)
+
+
+class TestRowDemand(unittest.TestCase):
+    def setUp(self):
+        self.image = np.random.default_rng(0).integers(0, 256, size=(40, 32), dtype=np.uint8)
+
+    def test_plan(self):
+        pipeline = ExampleRowBandPipeline()
+        plan = pipeline.set_row_demand()
+        # NOTE: The union of the rows read by the consumers, widened by each halo.
+        self.assertEqual({'blur_2': (5, 11), 'blur_1': (4, 12)}, plan)
+        self.assertEqual((3, 13), pipeline.blur_1.required_rows(0))
+
+    def test_band_matches_whole_image(self):
+        expected = [o.data_container.data.copy() for o in ExampleRowBandPipeline().run(self.image)]
+        pipeline = ExampleRowBandPipeline()
+        pipeline.set_row_demand()
+        actual = [o.data_container.data for o in pipeline.run(self.image)]
+        self.assertEqual([e.tolist() for e in expected], [a.tolist() for a in actual])
+        blurred = pipeline.blur_2.outputs[0].data_container.data
+        self.assertEqual(self.image.shape, blurred.shape)
+        self.assertFalse(blurred[:5].any())
+        self.assertFalse(blurred[11:].any())
+
+        pipeline.set_row_demand(False)
+        self.assertIsNone(pipeline.blur_1.output_rows)
+        self.assertIsNone(pipeline.blur_1.required_rows(0))
+
+    def test_graph_outputs_are_computed_entirely(self):
+        pipeline = ExampleImagePipeline()
+        pipeline.output.row_halo = 0
+        self.assertEqual({'output': None}, pipeline.set_row_demand())
+
+    def test_component_without_halo(self):
+        with self.assertRaises(ValueError):
+            ExampleImageIOComponent().set_output_rows((0, 1))
+
+
+class TestProfiling(unittest.TestCase):
+    def count(
+        self,
+        key: str,
+    ) -> int:
+        return PROFILER.stats(prefix=key).get(key, {'count': 0})['count']
+
+    def test_component_keys(self):
+        pipeline = ExampleNestedPipeline()
+        self.assertEqual('component.ExampleAddComponent', pipeline.add_one.profile_key)
+        graph = pipeline.compile()
+        self.assertEqual('component.inner.add_one', pipeline.inner.add_one.profile_key)
+        before = {
+            name: self.count(f'component.{name}')
+            for name in ('add_one', 'inner.add_one')
+        }
+        # NOTE: Both the validated calls and the compiled graph are timed.
+        pipeline.run(1)
+        graph(1)
+        for name, count in before.items():
+            self.assertEqual(count + 2, self.count(f'component.{name}'))
+        # NOTE: Passthrough components do not call `run()`.
+        self.assertEqual(0, self.count('component.input'))
+
+    def test_disabled(self):
+        pipeline = ExamplePipeline()
+        pipeline.compile()
+        before = self.count('component.add_one')
+        PROFILER.enabled = False
+        try:
+            pipeline.run(1)
+            pipeline.graph(1)
+        finally:
+            PROFILER.enabled = True
+        self.assertEqual(before, self.count('component.add_one'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,335 @@
+# Built-in
+import os
+import json
+import threading
+from time import perf_counter_ns
+from typing import Any, Callable
+
+
+class LatencyHistogram():
+    """! Log-linear histogram of durations in nanoseconds.
+
+    Durations below `2 ** (SUB_BITS + 1)` ns have a bucket each. Above,
+    every power of two is split into `2 ** SUB_BITS` buckets, so a
+    percentile is within `1 / 2 ** (SUB_BITS + 1)` (about 3%) of the true
+    value. The count, the sum and the maximum are exact. The count is
+    summed from the buckets when it is read, to keep `record()` short.
+
+    A histogram is written by a single thread (see `Profiler`), so
+    `record()` takes no lock.
+    """
+    SUB_BITS = 4
+    # NOTE: Enough buckets for any 64-bit duration.
+    N_BUCKETS = (64 - SUB_BITS) << SUB_BITS
+    __slots__ = ('counts', 'total_ns', 'max_ns')
+
+    def __init__(
+        self
+    ) -> None:
+        self.counts = [0] * self.N_BUCKETS
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @property
+    def count(
+        self
+    ) -> int:
+        return sum(self.counts)
+
+    def record(
+        self,
+        duration_ns: int,
+    ) -> None:
+        # NOTE: Written out for speed; see `bucket_index`.
+        shift = duration_ns.bit_length() - 5
+        if shift > 0:
+            self.counts[(shift << 4) + (duration_ns >> shift)] += 1
+        else:
+            self.counts[duration_ns] += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    @classmethod
+    def bucket_index(
+        cls,
+        duration_ns: int,
+    ) -> int:
+        shift = duration_ns.bit_length() - cls.SUB_BITS - 1
+        if shift <= 0:
+            return duration_ns
+        return (shift << cls.SUB_BITS) + (duration_ns >> shift)
+
+    @classmethod
+    def bucket_range(
+        cls,
+        index: int,
+    ) -> tuple[int, int]:
+        """! The durations `[lower, upper)` counted in the bucket `index`.
+        """
+        shift = (index >> cls.SUB_BITS) - 1
+        if shift <= 0:
+            return index, index + 1
+        lower = ((index & ((1 << cls.SUB_BITS) - 1)) | (1 << cls.SUB_BITS)) << shift
+        return lower, lower + (1 << shift)
+
+    def merge(
+        self,
+        other: 'LatencyHistogram',
+    ) -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def clear(
+        self
+    ) -> None:
+        for i, count in enumerate(self.counts):
+            if count:
+                self.counts[i] = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def percentile(
+        self,
+        q: float,
+    ) -> float:
+        """! The `q`-th percentile in nanoseconds, as the middle of its bucket.
+        `0` if nothing is recorded.
+        """
+        count = self.count
+        if not count:
+            return 0.0
+        rank = max(q / 100 * count, 1)
+        cumulative = 0
+        for index, n in enumerate(self.counts):
+            cumulative += n
+            if cumulative >= rank:
+                lower, upper = self.bucket_range(index)
+                return min((lower + upper - 1) / 2, float(self.max_ns))
+        return float(self.max_ns)
+
+    def summary(
+        self
+    ) -> dict:
+        """! `count`, `mean_us`, `p50_us`, `p95_us`, `p99_us` and `max_us`.
+        """
+        count = self.count
+        return {
+            'count': count,
+            'mean_us': self.total_ns / count / 1e3 if count else 0.0,
+            'p50_us': self.percentile(50) / 1e3,
+            'p95_us': self.percentile(95) / 1e3,
+            'p99_us': self.percentile(99) / 1e3,
+            'max_us': self.max_ns / 1e3,
+        }
+
+
+class Profiler():
+    """! Collects the latency of named hot-path sections (e.g. `run()` of each
+    component) into one `LatencyHistogram` per section and per thread.
+
+    Each thread records into its own histograms, found through a
+    `threading.local`, so recording takes no lock and threads never
+    contend. The lock is only taken when a thread records a section for
+    the first time, and when the histograms are read: `stats()` merges
+    the histograms of every thread.
+
+    The histograms of finished threads are folded into one total per key
+    (reported as the thread `FINISHED_THREADS`), so short-lived threads
+    (e.g. the request threads of the web server) do not accumulate.
+
+    Keys are dotted names: `component.<name>`, `visualizer.<name>`,
+    `queue.<name>.wait` and `streamer.<class>.<read|publish|encode>`.
+    """
+    FINISHED_THREADS = '(finished threads)'
+
+    def __init__(
+        self,
+        enabled: bool = True,
+    ) -> None:
+        self.enabled = enabled
+        # NOTE: A `TraceRecorder` that also records every section as an event
+        # (see `TraceRecorder.start`).
+        self.tracer = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._histograms: list[tuple[threading.Thread, str, LatencyHistogram]] = []
+        self._finished: dict[str, LatencyHistogram] = {}
+
+    def _fold_finished_threads(
+        self
+    ) -> None:
+        """! Folds the histograms of the finished threads into `_finished`.
+        The lock should be held.
+        """
+        alive = []
+        for entry in self._histograms:
+            thread, key, histogram = entry
+            if thread.is_alive():
+                alive.append(entry)
+                continue
+            # NOTE: A finished thread no longer writes its histograms.
+            if key not in self._finished:
+                self._finished[key] = LatencyHistogram()
+            self._finished[key].merge(histogram)
+        self._histograms = alive
+
+    def _register(
+        self,
+        key: str,
+    ) -> LatencyHistogram:
+        histograms = getattr(self._local, 'histograms', None)
+        if histograms is None:
+            histograms = self._local.histograms = {}
+        histogram = LatencyHistogram()
+        with self._lock:
+            # NOTE: A new thread often replaces a finished one.
+            self._fold_finished_threads()
+            self._histograms.append((threading.current_thread(), key, histogram))
+        histograms[key] = histogram
+        return histogram
+
+    def record(
+        self,
+        key: str,
+        duration_ns: int,
+    ) -> None:
+        """! Records a duration measured with `time.perf_counter_ns()`.
+        """
+        try:
+            histogram = self._local.histograms[key]
+        except (AttributeError, KeyError):
+            histogram = self._register(key)
+        # NOTE: `LatencyHistogram.record`, inlined to save a call per sample.
+        shift = duration_ns.bit_length() - 5
+        if shift > 0:
+            histogram.counts[(shift << 4) + (duration_ns >> shift)] += 1
+        else:
+            histogram.counts[duration_ns] += 1
+        histogram.total_ns += duration_ns
+        if duration_ns > histogram.max_ns:
+            histogram.max_ns = duration_ns
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.add(key, duration_ns)
+
+    def call(
+        self,
+        key: str,
+        fn: Callable,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """! Calls `fn(*args, **kwargs)` and records its duration under `key`.
+        The hottest paths (e.g. the schedule of `PipelineGraph`) time the
+        call inline instead, which saves packing the arguments.
+        """
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        t0 = perf_counter_ns()
+        ret = fn(*args, **kwargs)
+        self.record(key, perf_counter_ns() - t0)
+        return ret
+
+    def histograms(
+        self,
+        prefix: str = '',
+        by_thread: bool = False,
+    ) -> dict:
+        """! The merged histograms of the keys starting with `prefix`.
+
+        @param by_thread Merges the histograms per thread name instead,
+        as `{thread_name: {key: histogram}}`. The finished threads are
+        merged as `FINISHED_THREADS`.
+        """
+        merged = {}
+
+        def add(
+            thread_name: str,
+            key: str,
+            histogram: LatencyHistogram,
+        ) -> None:
+            if not key.startswith(prefix):
+                return
+            target = merged.setdefault(thread_name, {}) if by_thread else merged
+            if key not in target:
+                target[key] = LatencyHistogram()
+            target[key].merge(histogram)
+
+        with self._lock:
+            self._fold_finished_threads()
+            entries = list(self._histograms)
+            # NOTE: The totals are merged under the lock, since a fold may update them.
+            for key, histogram in self._finished.items():
+                add(self.FINISHED_THREADS, key, histogram)
+        for thread, key, histogram in entries:
+            add(thread.name, key, histogram)
+        return merged
+
+    def stats(
+        self,
+        prefix: str = '',
+        by_thread: bool = False,
+    ) -> dict:
+        """! The summary (see `LatencyHistogram.summary`) of each key
+        starting with `prefix` that has samples, sorted by key.
+        """
+        def summarize(histograms):
+            return {
+                key: histograms[key].summary()
+                for key in sorted(histograms)
+                if histograms[key].count
+            }
+        merged = self.histograms(prefix, by_thread)
+        if by_thread:
+            return {name: summarize(histograms) for name, histograms in merged.items()}
+        return summarize(merged)
+
+    def report(
+        self,
+        prefix: str = '',
+    ) -> str:
+        """! The stats as a table, e.g. to be logged.
+        """
+        stats = self.stats(prefix)
+        width = max([len(key) for key in stats] + [3])
+        lines = [
+            f'{"key":{width}s} {"count":>8s} {"p50":>10s} {"p95":>10s} {"p99":>10s} {"max":>10s}'
+        ]
+        for key, stat in stats.items():
+            lines.append(
+                f'{key:{width}s} {stat["count"]:8d} '
+                + ' '.join(
+                    f'{stat[name]:8.1f}us'
+                    for name in ('p50_us', 'p95_us', 'p99_us', 'max_us')
+                )
+            )
+        return '\n'.join(lines)
+
+    def dump(
+        self,
+        path: os.PathLike,
+        by_thread: bool = False,
+    ) -> None:
+        """! Writes the stats to `path` as JSON.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.stats(by_thread=by_thread), f, indent=2)
+
+    def reset(
+        self
+    ) -> None:
+        """! Clears every histogram. A sample recorded at the same time
+        by another thread may be kept or lost.
+        """
+        with self._lock:
+            entries = list(self._histograms)
+            self._finished.clear()
+        for _, _, histogram in entries:
+            histogram.clear()
+
+
+# NOTE: The profiler of the hot paths of the framework.
+# It is disabled with the environment variable `CVPYPE_PROFILING=0`.
+PROFILER = Profiler(enabled=os.environ.get('CVPYPE_PROFILING', '1') != '0')
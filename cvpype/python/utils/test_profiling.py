@@ -0,0 +1,119 @@
+# Built-in
+import os
+import json
+import tempfile
+import unittest
+import threading
+
+# Third party
+import numpy as np
+
+# Project-Utils
+from cvpype.python.utils.profiling import LatencyHistogram, Profiler
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_buckets(self):
+        previous_upper = 0
+        for index in range(LatencyHistogram.N_BUCKETS):
+            lower, upper = LatencyHistogram.bucket_range(index)
+            # NOTE: The buckets are contiguous.
+            self.assertEqual(previous_upper, lower)
+            self.assertEqual(index, LatencyHistogram.bucket_index(lower))
+            self.assertEqual(index, LatencyHistogram.bucket_index(upper - 1))
+            previous_upper = upper
+        self.assertGreaterEqual(previous_upper, 2 ** 63)
+
+    def test_record_matches_bucket_index(self):
+        histogram = LatencyHistogram()
+        for value in (0, 1, 31, 32, 33, 1000, 123456789):
+            histogram.record(value)
+            self.assertEqual(1, histogram.counts[LatencyHistogram.bucket_index(value)])
+            histogram.clear()
+
+    def test_percentiles(self):
+        rng = np.random.default_rng(0)
+        samples = rng.lognormal(mean=10, sigma=1, size=10000).astype(np.int64)
+        histogram = LatencyHistogram()
+        for sample in samples.tolist():
+            histogram.record(sample)
+        self.assertEqual(len(samples), histogram.count)
+        self.assertEqual(int(samples.max()), histogram.max_ns)
+        self.assertEqual(int(samples.sum()), histogram.total_ns)
+        for q in (50, 95, 99):
+            expected = np.percentile(samples, q)
+            self.assertAlmostEqual(expected, histogram.percentile(q), delta=expected * 0.04)
+        summary = histogram.summary()
+        self.assertEqual(
+            ['count', 'mean_us', 'p50_us', 'p95_us', 'p99_us', 'max_us'],
+            list(summary)
+        )
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.percentile(99))
+
+
+class TestProfiler(unittest.TestCase):
+    def test_call(self):
+        profiler = Profiler()
+        self.assertEqual(3, profiler.call('add', lambda x, y=0: x + y, 1, y=2))
+        self.assertEqual(1, profiler.stats()['add']['count'])
+        profiler.enabled = False
+        profiler.call('add', lambda: None)
+        self.assertEqual(1, profiler.stats()['add']['count'])
+
+    def test_threads(self):
+        profiler = Profiler()
+        recorded = threading.Barrier(5)
+        finish = threading.Event()
+
+        def work():
+            for i in range(1000):
+                profiler.record('section', 1000 + i)
+            recorded.wait()
+            finish.wait()
+
+        threads = [threading.Thread(target=work, name=f'worker-{i}') for i in range(4)]
+        for thread in threads:
+            thread.start()
+        recorded.wait()
+        profiler.record('other', 10)
+        # NOTE: Every thread has its own histogram; they are merged on read.
+        stats = profiler.stats()
+        self.assertEqual(4000, stats['section']['count'])
+        self.assertEqual(1.999, stats['section']['max_us'])
+        by_thread = profiler.stats(by_thread=True)
+        for i in range(4):
+            self.assertEqual(1000, by_thread[f'worker-{i}']['section']['count'])
+        self.assertEqual(['other'], list(profiler.stats(prefix='oth')))
+
+        finish.set()
+        for thread in threads:
+            thread.join()
+        # NOTE: The histograms of the finished threads are folded into one per key.
+        self.assertEqual(4000, profiler.stats()['section']['count'])
+        by_thread = profiler.stats(by_thread=True)
+        self.assertEqual(4000, by_thread[Profiler.FINISHED_THREADS]['section']['count'])
+        self.assertNotIn('worker-0', by_thread)
+        self.assertEqual(1, len(profiler._histograms))
+
+    def test_dump_and_reset(self):
+        profiler = Profiler()
+        profiler.record('component.a', 2000)
+        profiler.record('visualizer.a', 3000)
+        self.assertIn('component.a', profiler.report())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.json')
+            profiler.dump(path)
+            with open(path) as f:
+                self.assertEqual(profiler.stats(), json.load(f))
+        profiler.reset()
+        self.assertEqual({}, profiler.stats())
+        profiler.record('component.a', 2000)
+        self.assertEqual(1, profiler.stats()['component.a']['count'])
+
+
+if __name__ == '__main__':
+    unittest.main()
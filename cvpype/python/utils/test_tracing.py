@@ -0,0 +1,94 @@
+# Built-in
+import os
+import json
+import tempfile
+import unittest
+import threading
+
+# Project-Utils
+from cvpype.python.utils.profiling import Profiler
+from cvpype.python.utils.tracing import TraceRecorder
+
+
+class TestTraceRecorder(unittest.TestCase):
+    def setUp(self):
+        self.profiler = Profiler(enabled=False)
+        self.tracer = TraceRecorder(capacity=10)
+
+    def events(
+        self,
+        phase: str = 'X',
+    ) -> list[dict]:
+        return [
+            event for event in self.tracer.to_chrome_trace()['traceEvents']
+            if event['ph'] == phase
+        ]
+
+    def test_start_and_stop(self):
+        self.profiler.record('component.a', 1000)
+        self.assertEqual(0, len(self.tracer))
+        self.tracer.start(self.profiler)
+        self.assertTrue(self.profiler.enabled)
+        self.assertTrue(self.tracer.is_recording)
+        self.profiler.record('component.a', 1000)
+        self.tracer.stop()
+        self.profiler.record('component.a', 1000)
+        self.assertEqual(1, len(self.tracer))
+        self.assertFalse(self.tracer.is_recording)
+        # NOTE: The histograms are kept with or without the tracer.
+        self.assertEqual(3, self.profiler.stats()['component.a']['count'])
+
+    def test_events(self):
+        self.tracer.start(self.profiler)
+        self.tracer.set_frame_id(7)
+        self.profiler.record('component.a', 2000)
+
+        def work():
+            self.tracer.set_frame_id(8)
+            self.profiler.call('visualizer.b', lambda: None)
+
+        thread = threading.Thread(target=work, name='worker')
+        thread.start()
+        thread.join()
+        self.tracer.set_frame_id(None)
+        self.profiler.record('queue.c.wait', 3000)
+
+        a, b, c = self.events()
+        self.assertEqual(('component.a', 'component', 2.0, {'frame': 7}), (a['name'], a['cat'], a['dur'], a['args']))
+        self.assertEqual(('visualizer.b', 'visualizer', {'frame': 8}), (b['name'], b['cat'], b['args']))
+        self.assertNotIn('args', c)
+        self.assertLessEqual(a['ts'] + a['dur'], c['ts'] + c['dur'])
+        self.assertEqual(a['tid'], c['tid'])
+        self.assertNotEqual(a['tid'], b['tid'])
+        thread_names = {e['tid']: e['args']['name'] for e in self.events('M') if 'tid' in e}
+        self.assertEqual('worker', thread_names[b['tid']])
+
+    def test_ring(self):
+        self.tracer.start(self.profiler)
+        for i in range(25):
+            self.profiler.record(f'component.{i}', 1000)
+        self.assertEqual(10, len(self.tracer))
+        self.assertEqual(
+            [f'component.{i}' for i in range(15, 25)],
+            [event['name'] for event in self.events()]
+        )
+        self.tracer.clear()
+        self.assertEqual(0, len(self.tracer))
+
+    def test_export(self):
+        self.tracer.start(self.profiler)
+        self.profiler.record('component.a', 1000)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'trace.json')
+            self.tracer.export(path)
+            with open(path) as f:
+                trace = json.load(f)
+        self.assertEqual(self.tracer.to_chrome_trace(), trace)
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            TraceRecorder(capacity=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
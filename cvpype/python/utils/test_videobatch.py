@@ -0,0 +1,107 @@
+# Built-in
+import os
+import unittest
+from functools import partial
+
+# Third party
+import cv2
+
+# Project-Pipelines
+from cvpype.python.applications.pipelines.linetracking import LineTrackingPipeline
+
+# Project-Utils
+from cvpype.python.utils.videobatch import (
+    split_frame_ranges,
+    unwrap_outputs,
+    merge_chunk_results,
+    run_pipeline_on_video_in_parallel
+)
+
+
+VIDEO_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'data', 'sample.avi'
+)
+
+
+class TestSplitFrameRanges(unittest.TestCase):
+    def test_split(self):
+        self.assertEqual([(0, 4), (4, 8), (8, 10)], split_frame_ranges(10, 4))
+        self.assertEqual([(0, 10)], split_frame_ranges(10, 100))
+        self.assertEqual([], split_frame_ranges(0, 4))
+        with self.assertRaises(ValueError):
+            split_frame_ranges(10, 0)
+
+
+def create_chunk(
+    start: int,
+    end: int,
+    frame_indices: list[int],
+) -> dict:
+    return {
+        'start': start,
+        'end': end,
+        'results': [(frame_idx, f'frame{frame_idx}') for frame_idx in frame_indices],
+    }
+
+
+class TestMergeChunkResults(unittest.TestCase):
+    def test_merge(self):
+        chunks = [create_chunk(3, 6, [3, 4, 5]), create_chunk(0, 3, [0, 1, 2])]
+        self.assertEqual(
+            [f'frame{i}' for i in range(6)],
+            merge_chunk_results(chunks)
+        )
+        # NOTE: The frame count of the container may be overestimated.
+        chunks = [create_chunk(0, 3, [0, 1, 2]), create_chunk(3, 6, [3]), create_chunk(6, 9, [])]
+        self.assertEqual(4, len(merge_chunk_results(chunks)))
+
+    def test_short_read(self):
+        chunks = [create_chunk(0, 3, [0, 1]), create_chunk(3, 6, [3, 4, 5])]
+        with self.assertRaises(RuntimeError):
+            merge_chunk_results(chunks)
+
+    def test_inexact_seek(self):
+        chunks = [create_chunk(0, 3, [0, 1, 2]), create_chunk(3, 6, [0, 1, 2])]
+        with self.assertRaises(RuntimeError):
+            merge_chunk_results(chunks)
+
+
+class TestRunPipelineOnVideoInParallel(unittest.TestCase):
+    def test_matches_serial_run(self):
+        factory = partial(
+            LineTrackingPipeline,
+            crop_y=330,
+            crop_y_end=380,
+            roi_y=370,
+            image_h=480
+        )
+        pipeline = factory()
+        pipeline.autocreate_graph()
+        for _, visualizer in pipeline.visualizers.items():
+            visualizer.is_operating = False
+        expected = []
+        cap = cv2.VideoCapture(VIDEO_PATH)
+        while cap.isOpened():
+            ret, frame = cap.read()
+            if not ret:
+                break
+            expected.append(unwrap_outputs(pipeline.run(frame)))
+        cap.release()
+
+        results, report = run_pipeline_on_video_in_parallel(
+            factory, VIDEO_PATH, n_workers=2, chunk_size=25
+        )
+        self.assertEqual(len(expected), report['n_frames'])
+        self.assertEqual(6, report['n_chunks'])
+        self.assertEqual(
+            report['n_frames'],
+            sum(w['n_frames'] for w in report['workers'].values())
+        )
+        self.assertEqual(
+            [[tuple(map(int, e)) for e in frame] for frame in expected],
+            [[tuple(map(int, e)) for e in frame] for frame in results],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
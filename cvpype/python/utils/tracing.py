@@ -0,0 +1,157 @@
+# Built-in
+import os
+import json
+import threading
+from collections import deque
+from time import perf_counter_ns
+
+# Project-Utils
+from cvpype.python.utils.profiling import PROFILER, Profiler
+
+
+class TraceRecorder():
+    """! Records every section timed by a `Profiler` (component calls,
+    visualizer paints, queue waits, streamer reads and encodes) as an event
+    with its thread and frame id, to be exported to the Chrome trace format
+    (chrome://tracing, https://ui.perfetto.dev).
+
+    The events are kept in a ring of `capacity` events, so a long capture
+    keeps the latest events in a fixed amount of memory. Appending to the
+    ring takes no lock.
+
+    The frame id is per thread: the thread that starts processing a frame
+    sets it with `set_frame_id` (e.g. `BasePipeline.run_from_streamer`),
+    and the threads a frame is handed over to set it again.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100000,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(
+                f'`capacity` should be a positive integer. Current value: `{capacity}`'
+            )
+        self.capacity = capacity
+        self._events = deque(maxlen=capacity)
+        self._local = threading.local()
+        self._thread_names: dict[int, str] = {}
+        self._profiler: Profiler | None = None
+
+    @property
+    def is_recording(
+        self
+    ) -> bool:
+        return self._profiler is not None
+
+    def start(
+        self,
+        profiler: Profiler = PROFILER,
+    ) -> None:
+        """! Records the sections timed by `profiler`, which is enabled.
+        """
+        profiler.enabled = True
+        profiler.tracer = self
+        self._profiler = profiler
+
+    def stop(
+        self
+    ) -> None:
+        if self._profiler is not None:
+            self._profiler.tracer = None
+            self._profiler = None
+
+    def set_frame_id(
+        self,
+        frame_id: int | None,
+    ) -> None:
+        """! Tags the events of the calling thread with `frame_id`.
+        """
+        self._local.frame_id = frame_id
+
+    @property
+    def frame_id(
+        self
+    ) -> int | None:
+        """! The frame id of the calling thread.
+        """
+        return getattr(self._local, 'frame_id', None)
+
+    def add(
+        self,
+        name: str,
+        duration_ns: int,
+        end_ns: int | None = None,
+    ) -> None:
+        """! Records a section of the calling thread that ended at `end_ns`
+        (`time.perf_counter_ns()`, by default now).
+        """
+        if end_ns is None:
+            end_ns = perf_counter_ns()
+        local = self._local
+        tid = getattr(local, 'tid', None)
+        if tid is None:
+            tid = local.tid = threading.get_native_id()
+            self._thread_names[tid] = threading.current_thread().name
+        self._events.append((
+            name,
+            end_ns - duration_ns,
+            duration_ns,
+            tid,
+            getattr(local, 'frame_id', None),
+        ))
+
+    def clear(
+        self
+    ) -> None:
+        self._events.clear()
+
+    def __len__(
+        self
+    ) -> int:
+        return len(self._events)
+
+    def to_chrome_trace(
+        self
+    ) -> dict:
+        """! The recorded events in the Chrome trace event format.
+        Each section is a complete (`X`) event: its begin and its duration.
+        The category is the first part of the key (e.g. `component`).
+        """
+        pid = os.getpid()
+        events = [{
+            'name': 'process_name', 'ph': 'M', 'pid': pid,
+            'args': {'name': 'cvpype'},
+        }]
+        for tid, thread_name in list(self._thread_names.items()):
+            events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                'args': {'name': thread_name},
+            })
+        for name, start_ns, duration_ns, tid, frame_id in list(self._events):
+            event = {
+                'name': name,
+                'cat': name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': start_ns / 1e3,
+                'dur': duration_ns / 1e3,
+                'pid': pid,
+                'tid': tid,
+            }
+            if frame_id is not None:
+                event['args'] = {'frame': frame_id}
+            events.append(event)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(
+        self,
+        path: os.PathLike,
+    ) -> None:
+        """! Writes the recorded events to `path` as Chrome trace JSON.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+# NOTE: The tracer of the hot paths of the framework. It records nothing until `start()`.
+TRACER = TraceRecorder()
@@ -0,0 +1,240 @@
+# Built-In
+import os
+import time
+import logging
+import multiprocessing
+from typing import Any, Callable
+from concurrent.futures import ProcessPoolExecutor
+
+# Third party
+import cv2
+
+# Project
+from cvpype.python.iospec import ComponentIOSpec
+
+# Project-Pipelines
+from cvpype.python.core.pipelines.base import BasePipeline
+
+
+logger = logging.getLogger(__name__)
+
+# NOTE: Each worker process holds its own pipeline instance.
+_worker_pipeline: BasePipeline = None
+
+
+def count_frames(
+    video_path: os.PathLike,
+) -> int:
+    cap = cv2.VideoCapture(str(video_path))
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open video at path {video_path}")
+    n_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return n_frames
+
+
+def split_frame_ranges(
+    n_frames: int,
+    chunk_size: int,
+) -> list[tuple[int, int]]:
+    """! Splits `[0, n_frames)` into consecutive `(start, end)` ranges
+    of at most `chunk_size` frames.
+    """
+    if chunk_size < 1:
+        raise ValueError(
+            f'`chunk_size` should be a positive integer. Current value: `{chunk_size}`'
+        )
+    return [
+        (start, min(start + chunk_size, n_frames))
+        for start in range(0, n_frames, chunk_size)
+    ]
+
+
+def unwrap_outputs(
+    outputs: Any
+) -> Any:
+    """! Converts the return value of `run()` of a pipeline into plain data,
+    so that it can be sent to another process.
+    """
+    if isinstance(outputs, ComponentIOSpec):
+        return outputs.data_container.data
+    if isinstance(outputs, (list, tuple)):
+        return [unwrap_outputs(o) for o in outputs]
+    return outputs
+
+
+def _init_worker(
+    pipeline_factory: Callable[[], BasePipeline],
+    validation_frames: int | None,
+):
+    global _worker_pipeline
+    # NOTE: Processes already run in parallel.
+    # Avoid oversubscribing the cores with OpenCV threads.
+    cv2.setNumThreads(1)
+    _worker_pipeline = pipeline_factory()
+    _worker_pipeline.autocreate_graph()
+    for _, visualizer in _worker_pipeline.visualizers.items():
+        visualizer.is_operating = False
+    if validation_frames is not None:
+        _worker_pipeline.set_optimization_mode(validation_frames)
+
+
+def _open_at(
+    video_path: os.PathLike,
+    start: int,
+) -> cv2.VideoCapture:
+    cap = cv2.VideoCapture(str(video_path))
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open video at path {video_path}")
+    if start == 0:
+        return cap
+    cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+    if int(cap.get(cv2.CAP_PROP_POS_FRAMES)) == start:
+        return cap
+    # NOTE: Some codecs cannot seek to an exact frame.
+    # Fall back to decoding from the beginning.
+    cap.release()
+    cap = cv2.VideoCapture(str(video_path))
+    for _ in range(start):
+        if not cap.grab():
+            break
+    return cap
+
+
+def _run_frame_range(
+    video_path: os.PathLike,
+    start: int,
+    end: int,
+) -> dict:
+    t0 = time.perf_counter()
+    cap = _open_at(video_path, start)
+    results = []
+    for _ in range(start, end):
+        ret, frame = cap.read()
+        if not ret:
+            break
+        # NOTE: The index reported by the capture, not the planned one,
+        # so that an inexact seek is detected while merging the chunks.
+        frame_idx = int(cap.get(cv2.CAP_PROP_POS_FRAMES)) - 1
+        outputs = _worker_pipeline.run(frame)
+        results.append((frame_idx, unwrap_outputs(outputs)))
+    cap.release()
+    return {
+        'pid': os.getpid(),
+        'start': start,
+        'end': end,
+        'n_frames': len(results),
+        'seconds': time.perf_counter() - t0,
+        'results': results,
+    }
+
+
+def merge_chunk_results(
+    chunks: list[dict],
+) -> list:
+    """! Merges the results of the frame ranges into frame order.
+
+    Each range should start at its planned frame and continue without gaps.
+    Only the ranges at the end of the video may be shorter than planned
+    (`CAP_PROP_FRAME_COUNT` is an estimate for some containers), so that
+    the result `i` is always the one of the frame `i`.
+
+    @return the results of the frames `0, 1, ...` without their indices.
+    """
+    results = []
+    for chunk in sorted(chunks, key=lambda c: c['start']):
+        frame_indices = [frame_idx for frame_idx, _ in chunk['results']]
+        expected = list(range(chunk['start'], chunk['start'] + len(frame_indices)))
+        if frame_indices != expected:
+            raise RuntimeError(
+                f'The frames of the range [{chunk["start"]}, {chunk["end"]}) '
+                'were not read at their positions (inexact seek?). '
+                f'Expected frames from {chunk["start"]}, but got '
+                f'{frame_indices[:3]}{"..." if len(frame_indices) > 3 else ""}'
+            )
+        if frame_indices and len(results) != chunk['start']:
+            raise RuntimeError(
+                f'The frames [{len(results)}, {chunk["start"]}) are missing: '
+                'a previous range was read only partially (short read?).'
+            )
+        results.extend(result for _, result in chunk['results'])
+    return results
+
+
+def run_pipeline_on_video_in_parallel(
+    pipeline_factory: Callable[[], BasePipeline],
+    video_path: os.PathLike,
+    n_workers: int | None = None,
+    chunk_size: int | None = None,
+    validation_frames: int | None = 1,
+) -> tuple[list, dict]:
+    """! Runs a pipeline over a video with a pool of processes.
+
+    The video is split into frame ranges, and each range is processed by a
+    worker process that holds its own pipeline instance (created by
+    `pipeline_factory` once per process). The per-frame results are merged
+    back into frame order. This is only valid for stateless pipelines:
+    a pipeline that depends on previous frames sees a gap at every range
+    boundary.
+
+    @param pipeline_factory A picklable callable that creates the pipeline,
+    e.g. `functools.partial(LineTrackingPipeline, crop_y=330, ...)`.
+    @param video_path The path of the video.
+    @param n_workers The number of worker processes. Defaults to the number of CPUs.
+    @param chunk_size The number of frames per range. By default,
+    the video is split into four ranges per worker to balance the load.
+    @param validation_frames Passed to `set_optimization_mode` of each
+    pipeline instance. `None` keeps the debugging mode.
+
+    @return a tuple of the results (the unwrapped return value of `run()`
+    for each frame, in frame order, so that the result `i` is the one of
+    the frame `i`; see `merge_chunk_results`) and a report that contains the
+    throughput of the whole job and of each worker.
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    n_frames = count_frames(video_path)
+    if chunk_size is None:
+        chunk_size = max(1, -(-n_frames // (n_workers * 4)))
+    ranges = split_frame_ranges(n_frames, chunk_size)
+
+    t0 = time.perf_counter()
+    # NOTE: `spawn` avoids forking a process while OpenCV threads are running.
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(pipeline_factory, validation_frames),
+    ) as pool:
+        futures = [
+            pool.submit(_run_frame_range, video_path, start, end)
+            for start, end in ranges
+        ]
+        chunks = [future.result() for future in futures]
+    elapsed = time.perf_counter() - t0
+
+    results = merge_chunk_results(chunks)
+    workers = {}
+    for chunk in chunks:
+        worker = workers.setdefault(
+            chunk['pid'], {'n_frames': 0, 'seconds': 0.0, 'n_chunks': 0}
+        )
+        worker['n_frames'] += chunk['n_frames']
+        worker['seconds'] += chunk['seconds']
+        worker['n_chunks'] += 1
+    for _, worker in workers.items():
+        worker['fps'] = worker['n_frames'] / worker['seconds'] if worker['seconds'] else 0.0
+
+    report = {
+        'video_path': str(video_path),
+        'n_frames': len(results),
+        'n_workers': n_workers,
+        'n_chunks': len(ranges),
+        'seconds': elapsed,
+        'fps': len(results) / elapsed if elapsed else 0.0,
+        'workers': workers,
+    }
+    logger.info(
+        f'{report["n_frames"]} frames of {video_path} processed in '
+        f'{elapsed:.2f}s ({report["fps"]:.1f} fps, {n_workers} workers)'
+    )
+    return results, report
@@ -0,0 +1,67 @@
+# Built-in
+import json
+import glob
+import logging
+import argparse
+from functools import partial
+
+# Project
+from cvpype.python.utils import loggerutil
+from cvpype.python.utils.videobatch import run_pipeline_on_video_in_parallel
+
+# Project-Pipelines
+from cvpype.python.applications.pipelines.linetracking import LineTrackingPipeline
+
+
+loggerutil.set_basic_config(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run_pipeline(
+    video_paths: list[str],
+    n_workers: int | None = None,
+    chunk_size: int | None = None,
+    output_path: str = '',
+) -> None:
+    pipeline_factory = partial(
+        LineTrackingPipeline,
+        crop_y=330,
+        crop_y_end=380,
+        roi_y=370,
+        image_h=480
+    )
+    outputs = {}
+    for video_path in video_paths:
+        results, report = run_pipeline_on_video_in_parallel(
+            pipeline_factory,
+            video_path,
+            n_workers=n_workers,
+            chunk_size=chunk_size,
+        )
+        for pid, worker in report['workers'].items():
+            logger.info(
+                f'  worker {pid}: {worker["n_frames"]} frames '
+                f'in {worker["n_chunks"]} chunks, {worker["fps"]:.1f} fps'
+            )
+        outputs[video_path] = {
+            'report': report,
+            'intersections': [
+                [[int(x) for x in pair] for pair in intersections]
+                for intersections in results
+            ],
+        }
+    if output_path:
+        with open(output_path, 'w') as f:
+            json.dump(outputs, f)
+        logger.info(f'Results saved to {output_path}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run pipeline on videos with a pool of processes.')
+    parser.add_argument('video_paths', type=str, nargs='+', help='Paths (or glob patterns) of the video files.')
+    parser.add_argument('--n_workers', type=int, default=None, help='Number of worker processes.')
+    parser.add_argument('--chunk_size', type=int, default=None, help='Number of frames per chunk.')
+    parser.add_argument('--output', type=str, default='', help='Path to save the per-frame results as JSON.')
+    args = parser.parse_args()
+    paths = sorted(p for pattern in args.video_paths for p in glob.glob(pattern))
+    run_pipeline(paths, args.n_workers, args.chunk_size, args.output)